@@ -0,0 +1,56 @@
+"""add tree path
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+TREE_TABLES = ['sys_dept', 'sys_menu']
+
+
+def upgrade():
+    # ========== 部门表、菜单表增加树形路径 ==========
+    for table_name in TREE_TABLES:
+        op.add_column(table_name,
+                      sa.Column('tree_path', sa.String(length=255), nullable=False,
+                                server_default='/', comment='树形路径(祖先ID链,如 /1/3/)'))
+        op.create_index(f'ix_{table_name}_tree_path', table_name, ['tree_path'])
+
+    # ========== 回填历史数据 ==========
+    bind = op.get_bind()
+    for table_name in TREE_TABLES:
+        table = sa.table(table_name, sa.column('id'), sa.column('parent_id'), sa.column('tree_path'))
+        rows = bind.execute(sa.select(table.c.id, table.c.parent_id)).all()
+        node_ids = {row.id for row in rows}
+        children = {}
+        for row in rows:
+            parent_id = row.parent_id if row.parent_id in node_ids else None
+            children.setdefault(parent_id, []).append(row.id)
+
+        stack = [(node_id, '/') for node_id in children.get(None, [])]
+        while stack:
+            node_id, path = stack.pop()
+            child_ids = children.get(node_id, [])
+            stack.extend((child_id, f'{path}{node_id}/') for child_id in child_ids)
+            if path != '/':
+                bind.execute(
+                    table.update().where(table.c.id == node_id).values(tree_path=path)
+                )
+
+
+def downgrade():
+    # 回滚操作
+    for table_name in reversed(TREE_TABLES):
+        op.drop_index(f'ix_{table_name}_tree_path', table_name)
+        op.drop_column(table_name, 'tree_path')
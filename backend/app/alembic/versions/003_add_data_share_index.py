@@ -0,0 +1,27 @@
+"""add data share composite index
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ========== 数据分享表增加复合索引（数据权限 EXISTS 子查询） ==========
+    op.create_index('ix_sys_data_share_target', 'sys_data_share',
+                    ['target_tenant_id', 'resource_type', 'resource_id',
+                     'status', 'share_type', 'expire_time'])
+
+
+def downgrade():
+    # 回滚操作
+    op.drop_index('ix_sys_data_share_target', 'sys_data_share')
@@ -0,0 +1,52 @@
+"""add created dept id
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+# 混入 DeptMixin 的业务表（插件表未启用时跳过）
+DEPT_TABLES = ['sys_notice', 'sys_position', 'gen_demo', 'app_myapp', 'app_job']
+
+
+def _existing_tables():
+    return [name for name in DEPT_TABLES if sa.inspect(op.get_bind()).has_table(name)]
+
+
+def upgrade():
+    # ========== 业务表增加创建部门字段 ==========
+    for table_name in _existing_tables():
+        op.add_column(table_name,
+                      sa.Column('created_dept_id', sa.Integer(), nullable=True, comment='创建部门ID'))
+        op.create_index(f'ix_{table_name}_created_dept_id', table_name, ['created_dept_id'])
+
+        # ========== 按创建人当前部门回填历史数据 ==========
+        table = sa.table(table_name, sa.column('created_id'), sa.column('created_dept_id'))
+        user = sa.table('sys_user', sa.column('id'), sa.column('dept_id'))
+        op.execute(
+            table.update()
+            .where(table.c.created_id.is_not(None))
+            .values(
+                created_dept_id=sa.select(user.c.dept_id)
+                .where(user.c.id == table.c.created_id)
+                .scalar_subquery()
+            )
+        )
+
+
+def downgrade():
+    # 回滚操作
+    for table_name in reversed(_existing_tables()):
+        op.drop_index(f'ix_{table_name}_created_dept_id', table_name)
+        op.drop_column(table_name, 'created_dept_id')
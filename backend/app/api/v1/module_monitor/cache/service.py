@@ -66,10 +66,8 @@ class CacheService:
         返回:
         - list: 缓存键名列表信息。
         """
-        cache_keys = await RedisCURD(redis).get_keys(f"{cache_name}*")
-        cache_key_list = [
-            key.split(":", 1)[1] for key in cache_keys if key.startswith(f"{cache_name}:")
-        ]
+        cache_keys = await RedisCURD(redis).get_keys(f"{cache_name}:*")
+        cache_key_list = [key.split(":", 1)[1] for key in cache_keys]
 
         return cache_key_list
 
@@ -109,9 +107,7 @@ class CacheService:
         返回:
         - bool: 是否清理成功。
         """
-        cache_keys = await RedisCURD(redis).get_keys(f"{cache_name}*")
-        if cache_keys:
-            await RedisCURD(redis).delete(*cache_keys)
+        await RedisCURD(redis).delete_by_pattern(f"{cache_name}*")
 
         return True
 
@@ -127,9 +123,7 @@ class CacheService:
         返回:
         - bool: 是否清理成功。
         """
-        cache_keys = await RedisCURD(redis).get_keys(f"*{cache_key}")
-        if cache_keys:
-            await RedisCURD(redis).delete(*cache_keys)
+        await RedisCURD(redis).delete_by_pattern(f"*{cache_key}")
 
         return True
 
@@ -144,11 +138,7 @@ class CacheService:
         返回:
         - bool: 是否清理成功。
         """
-        cache_keys = await RedisCURD(redis).get_keys()
-        if cache_keys:
-            await RedisCURD(redis).delete(*cache_keys)
+        # 分批 SCAN + UNLINK，避免 KEYS * 与单次删除全部键阻塞 Redis
+        await RedisCURD(redis).delete_by_pattern("*")
 
         return True
-
-        # 避免清除所有的缓存，而采用上面的方式，只清除本系统内指定的所有缓存
-        # return await RedisCURD(redis).clear()
@@ -1,6 +1,7 @@
 from fastapi import Query
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.config.setting import settings
 from app.core.validator import DateTimeStr
 
 
@@ -28,12 +29,18 @@ class OnlineQueryParam:
 
     def __init__(
         self,
-        name: str | None = Query(None, description="登录名称"),
-        ipaddr: str | None = Query(None, description="登陆IP地址"),
-        login_location: str | None = Query(None, description="登录所属地"),
+        name: str | None = Query(None, description="登录名称(前缀匹配，不区分大小写)"),
+        ipaddr: str | None = Query(None, description="登陆IP地址(前缀匹配)"),
+        login_location: str | None = Query(
+            None,
+            description=(
+                "登录所属地(模糊匹配)。未同时按登录名称或IP地址搜索时，"
+                f"仅在最近登录的 {settings.ONLINE_SEARCH_MAX_RESULTS} 个会话中查找"
+            ),
+        ),
     ) -> None:
 
-        # 模糊查询字段
+        # 模糊查询字段（登录名称、IP地址按前缀匹配）
         self.name = ("like", f"%{name}%") if name else None
         self.login_location = ("like", f"%{login_location}%") if login_location else None
         self.ipaddr = ("like", f"%{ipaddr}%") if ipaddr else None
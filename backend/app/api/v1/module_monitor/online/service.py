@@ -1,52 +1,323 @@
 import json
+import time
+from datetime import datetime
+from typing import Any
 
 from redis.asyncio.client import Redis
 
 from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
 from app.core.logger import log
 from app.core.redis_crud import RedisCURD
-from app.core.security import decode_access_token
 
 from .schema import OnlineQueryParam
 
+# 搜索时分批读取会话字段的批大小
+SEARCH_BATCH_SIZE = 1000
+# 前缀索引成员中字段值与会话ID的分隔符
+INDEX_SEPARATOR = "\x00"
+
 
 class OnlineService:
-    """在线用户管理模块服务层"""
+    """
+    在线用户管理模块服务层
+
+    在线会话登记在 Redis 中:
+    - online_session:{会话ID}: 哈希，保存会话信息(info)及可搜索字段
+    - online_login_index: 有序集合，按登录时间排序，用于分页
+    - online_expire_index: 有序集合，按 access_token 过期时间排序，滑动续期时同步更新
+    - online_user:{用户ID}: 集合，用户的全部会话ID，用于按用户强制下线
+    - online_name_index / online_ipaddr_index: 有序集合，成员为 "{登录名称(小写)/IP}\\x00{会话ID}"，
+      分值均为0，按字典序(ZRANGEBYLEX)做前缀搜索
+
+    登记数据不设置TTL，登录、查询与强制下线前按过期索引统一清理，保证各索引一致。
+    """
+
+    @staticmethod
+    def _session_key(session_id: str) -> str:
+        return f"{RedisInitKeyConfig.ONLINE_SESSION.key}:{session_id}"
+
+    @staticmethod
+    def _user_key(user_id: Any) -> str:
+        return f"{RedisInitKeyConfig.ONLINE_USER_INDEX.key}:{user_id}"
+
+    @staticmethod
+    def _index_members(
+        name: str | None, ipaddr: str | None, session_id: str
+    ) -> list[tuple[str, str]]:
+        """
+        获取会话在前缀索引中的成员
+
+        参数:
+        - name (str | None): 登录名称。
+        - ipaddr (str | None): IP地址。
+        - session_id (str): 会话ID。
+
+        返回:
+        - list[tuple[str, str]]: (索引键, 成员) 列表，字段为空时不建索引。
+        """
+        members = []
+        if name:
+            members.append((
+                RedisInitKeyConfig.ONLINE_NAME_INDEX.key,
+                f"{name.lower()}{INDEX_SEPARATOR}{session_id}",
+            ))
+        if ipaddr:
+            members.append((
+                RedisInitKeyConfig.ONLINE_IPADDR_INDEX.key,
+                f"{ipaddr}{INDEX_SEPARATOR}{session_id}",
+            ))
+        return members
 
     @classmethod
-    async def get_online_list_service(
-        cls, redis: Redis, search: OnlineQueryParam | None = None
-    ) -> list[dict]:
+    async def register_session_service(cls, redis: Redis, session_info: dict, expire: int) -> None:
         """
-        获取在线用户列表信息（支持分页和搜索）
+        登记在线会话（登录、刷新令牌时调用）
 
         参数:
         - redis (Redis): Redis异步客户端实例。
-        - search (OnlineQueryParam | None): 查询参数模型。
+        - session_info (dict): 会话信息，字段同 OnlineOutSchema。
+        - expire (int): 会话过期时间(秒)，与 access_token 一致。
+
+        返回:
+        - None
+        """
+        session_id = session_info["session_id"]
+        login_time = session_info.get("login_time")
+        try:
+            score = datetime.fromisoformat(login_time).timestamp() if login_time else time.time()
+        except (TypeError, ValueError):
+            score = time.time()
+
+        await cls._purge_expired(redis)
+        session_key = cls._session_key(session_id)
+        # 刷新令牌时重新登记，先移除旧的索引成员
+        old_name, old_ipaddr = await redis.hmget(session_key, ["name", "ipaddr"])
+        async with redis.pipeline(transaction=True) as pipe:
+            for index_key, member in cls._index_members(old_name, old_ipaddr, session_id):
+                pipe.zrem(index_key, member)
+            pipe.hset(
+                session_key,
+                mapping={
+                    "info": json.dumps(session_info, ensure_ascii=False),
+                    "user_id": str(session_info.get("user_id") or ""),
+                    "name": session_info.get("name") or "",
+                    "ipaddr": session_info.get("ipaddr") or "",
+                    "login_location": session_info.get("login_location") or "",
+                },
+            )
+            pipe.zadd(RedisInitKeyConfig.ONLINE_LOGIN_INDEX.key, {session_id: score})
+            pipe.zadd(
+                RedisInitKeyConfig.ONLINE_EXPIRE_INDEX.key, {session_id: time.time() + expire}
+            )
+            pipe.sadd(cls._user_key(session_info.get("user_id")), session_id)
+            for index_key, member in cls._index_members(
+                session_info.get("name"), session_info.get("ipaddr"), session_id
+            ):
+                pipe.zadd(index_key, {member: 0})
+            await pipe.execute()
+
+    @classmethod
+    async def unregister_session_service(cls, redis: Redis, *session_ids: str) -> None:
+        """
+        注销在线会话并删除其令牌（退出登录、强制下线时调用）
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+        - session_ids (str): 会话ID。
 
         返回:
-        - list[dict]: 在线用户详情字典列表。
+        - None
         """
+        if not session_ids:
+            return
+        async with redis.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.hmget(cls._session_key(session_id), ["user_id", "name", "ipaddr"])
+            rows = await pipe.execute()
 
-        keys = await RedisCURD(redis).get_keys(f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:*")
-        tokens = await RedisCURD(redis).mget(keys)
+        async with redis.pipeline(transaction=True) as pipe:
+            for session_id, (user_id, name, ipaddr) in zip(session_ids, rows, strict=True):
+                pipe.delete(
+                    f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}",
+                    f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:{session_id}",
+                    cls._session_key(session_id),
+                )
+                if user_id:
+                    pipe.srem(cls._user_key(user_id), session_id)
+                for index_key, member in cls._index_members(name, ipaddr, session_id):
+                    pipe.zrem(index_key, member)
+            pipe.zrem(RedisInitKeyConfig.ONLINE_LOGIN_INDEX.key, *session_ids)
+            pipe.zrem(RedisInitKeyConfig.ONLINE_EXPIRE_INDEX.key, *session_ids)
+            await pipe.execute()
 
+    @classmethod
+    async def _purge_expired(cls, redis: Redis) -> None:
+        """
+        清理索引中已过期的会话
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+
+        返回:
+        - None
+        """
+        expired = await redis.zrangebyscore(
+            RedisInitKeyConfig.ONLINE_EXPIRE_INDEX.key, "-inf", time.time()
+        )
+        if expired:
+            await cls.unregister_session_service(redis, *expired)
+
+    @classmethod
+    async def _load_sessions(cls, redis: Redis, session_ids: list[str]) -> list[dict]:
+        """
+        批量读取会话信息
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+        - session_ids (list[str]): 会话ID列表。
+
+        返回:
+        - list[dict]: 会话信息列表，保持传入顺序，跳过已失效会话。
+        """
+        async with redis.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.hget(cls._session_key(session_id), "info")
+            infos = await pipe.execute()
         online_users = []
-        for token in tokens:
-            if not token:
+        for info in infos:
+            if not info:
                 continue
             try:
-                payload = decode_access_token(token=token)
-                session_info = json.loads(payload.sub)
-                if cls._match_search_conditions(session_info, search):
-                    online_users.append(session_info)
-            except Exception as e:
+                online_users.append(json.loads(info))
+            except json.JSONDecodeError as e:
                 log.error(f"解析在线用户数据失败: {e}")
+        return online_users
+
+    @classmethod
+    async def get_online_page_service(
+        cls,
+        redis: Redis,
+        page_no: int = 1,
+        page_size: int = 10,
+        search: OnlineQueryParam | None = None,
+    ) -> dict[str, Any]:
+        """
+        分页获取在线用户列表（按登录时间倒序，支持搜索）
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+        - page_no (int): 当前页码。
+        - page_size (int): 每页数量。
+        - search (OnlineQueryParam | None): 查询参数模型。
+
+        返回:
+        - dict[str, Any]: 分页数据对象，搜索命中数超过 ONLINE_SEARCH_MAX_RESULTS 时 truncated 为True。
+        """
+        await cls._purge_expired(redis)
+        index_key = RedisInitKeyConfig.ONLINE_LOGIN_INDEX.key
+        start = (page_no - 1) * page_size
+        truncated = False
+
+        if not cls._has_search_conditions(search):
+            total = await redis.zcard(index_key)
+            page_ids = await redis.zrevrange(index_key, start, start + page_size - 1)
+        else:
+            # 先由前缀索引(或最近登录的会话)得到候选，再读取可搜索字段过滤，命中分页范围后读取完整会话信息
+            session_ids, truncated = await cls._search_candidates(redis, search)
+            matched: list[str] = []
+            for offset in range(0, len(session_ids), SEARCH_BATCH_SIZE):
+                batch = session_ids[offset : offset + SEARCH_BATCH_SIZE]
+                async with redis.pipeline(transaction=False) as pipe:
+                    for session_id in batch:
+                        pipe.hmget(
+                            cls._session_key(session_id), ["name", "ipaddr", "login_location"]
+                        )
+                    rows = await pipe.execute()
+                for session_id, (name, ipaddr, login_location) in zip(batch, rows, strict=True):
+                    online_info = {"name": name, "ipaddr": ipaddr, "login_location": login_location}
+                    if name is not None and cls._match_search_conditions(online_info, search):
+                        matched.append(session_id)
+            total = len(matched)
+            page_ids = matched[start : start + page_size]
+
+        return {
+            "items": await cls._load_sessions(redis, page_ids),
+            "total": total,
+            "page_no": page_no,
+            "page_size": page_size,
+            "has_next": start + page_size < total,
+            "truncated": truncated,
+        }
+
+    @classmethod
+    async def _search_candidates(
+        cls, redis: Redis, search: OnlineQueryParam
+    ) -> tuple[list[str], bool]:
+        """
+        获取搜索的候选会话ID（按登录时间倒序）
+
+        按登录名称、IP地址搜索时查询前缀索引，各取前 ONLINE_SEARCH_MAX_RESULTS 个成员后取交集；
+        仅按登录所属地搜索时没有可用索引，只扫描最近登录的 ONLINE_SEARCH_MAX_RESULTS 个会话。
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+        - search (OnlineQueryParam): 查询参数模型。
+
+        返回:
+        - tuple[list[str], bool]: 候选会话ID，以及候选是否因数量上限被截断。
+        """
+        limit = max(settings.ONLINE_SEARCH_MAX_RESULTS, 1)
+        login_index = RedisInitKeyConfig.ONLINE_LOGIN_INDEX.key
+        candidates: set[str] | None = None
+        truncated = False
+        for index_key, keyword in (
+            (RedisInitKeyConfig.ONLINE_NAME_INDEX.key, cls._keyword(search.name).lower()),
+            (RedisInitKeyConfig.ONLINE_IPADDR_INDEX.key, cls._keyword(search.ipaddr)),
+        ):
+            if not keyword:
                 continue
-        # 按照 login_time 倒序排序
-        online_users.sort(key=lambda x: x.get("login_time", ""), reverse=True)
+            # UTF-8 编码中不会出现 0xff，以其结尾作为前缀范围的上界
+            prefix = keyword.encode()
+            members = await redis.zrangebylex(
+                index_key, b"[" + prefix, b"[" + prefix + b"\xff", start=0, num=limit + 1
+            )
+            truncated = truncated or len(members) > limit
+            session_ids = {member.rsplit(INDEX_SEPARATOR, 1)[-1] for member in members[:limit]}
+            candidates = session_ids if candidates is None else candidates & session_ids
 
-        return online_users
+        if candidates is None:
+            truncated = await redis.zcard(login_index) > limit
+            return await redis.zrevrange(login_index, 0, limit - 1), truncated
+
+        session_ids = list(candidates)
+        async with redis.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.zscore(login_index, session_id)
+            scores = await pipe.execute()
+        ordered = sorted(
+            (
+                (score, session_id)
+                for session_id, score in zip(session_ids, scores, strict=True)
+                if score is not None
+            ),
+            reverse=True,
+        )
+        return [session_id for _, session_id in ordered], truncated
+
+    @classmethod
+    async def count_online_service(cls, redis: Redis) -> int:
+        """
+        获取在线会话数量
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+
+        返回:
+        - int: 在线会话数量。
+        """
+        await cls._purge_expired(redis)
+        return await redis.zcard(RedisInitKeyConfig.ONLINE_LOGIN_INDEX.key)
 
     @classmethod
     async def delete_online_service(cls, redis: Redis, session_id: str) -> bool:
@@ -60,13 +331,31 @@ class OnlineService:
         返回:
         - bool: 如果操作成功则返回True，否则返回False。
         """
-        # 删除 token
-        await RedisCURD(redis).delete(f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}")
-        await RedisCURD(redis).delete(f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:{session_id}")
+        await cls.unregister_session_service(redis, session_id)
 
         log.info(f"强制下线用户会话: {session_id}")
         return True
 
+    @classmethod
+    async def delete_user_online_service(cls, redis: Redis, user_ids: list[int]) -> None:
+        """
+        强制下线指定用户的全部会话
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+        - user_ids (list[int]): 用户ID列表。
+
+        返回:
+        - None
+        """
+        await cls._purge_expired(redis)
+        for user_id in user_ids:
+            session_ids = list(await redis.smembers(cls._user_key(user_id)))
+            await cls.unregister_session_service(redis, *session_ids)
+            await RedisCURD(redis).delete(cls._user_key(user_id))
+            if session_ids:
+                log.info(f"强制下线用户 {user_id} 的 {len(session_ids)} 个会话")
+
     @classmethod
     async def clear_online_service(cls, redis: Redis) -> bool:
         """
@@ -78,13 +367,50 @@ class OnlineService:
         返回:
         - bool: 如果操作成功则返回True，否则返回False。
         """
-        # 删除 token
-        await RedisCURD(redis).clear(f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:*")
-        await RedisCURD(redis).clear(f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:*")
+        # 删除 token 及在线会话登记
+        for key_config in (
+            RedisInitKeyConfig.ACCESS_TOKEN,
+            RedisInitKeyConfig.REFRESH_TOKEN,
+            RedisInitKeyConfig.ONLINE_SESSION,
+            RedisInitKeyConfig.ONLINE_USER_INDEX,
+        ):
+            await RedisCURD(redis).delete_by_pattern(f"{key_config.key}:*")
+        await RedisCURD(redis).delete(
+            RedisInitKeyConfig.ONLINE_LOGIN_INDEX.key,
+            RedisInitKeyConfig.ONLINE_EXPIRE_INDEX.key,
+            RedisInitKeyConfig.ONLINE_NAME_INDEX.key,
+            RedisInitKeyConfig.ONLINE_IPADDR_INDEX.key,
+        )
 
         log.info("清除所有在线用户会话成功")
         return True
 
+    @staticmethod
+    def _has_search_conditions(search: OnlineQueryParam | None = None) -> bool:
+        """
+        检查是否存在搜索条件
+
+        参数:
+        - search (OnlineQueryParam | None): 查询参数模型。
+
+        返回:
+        - bool: 存在任一搜索条件时返回True。
+        """
+        return bool(search and (search.name or search.ipaddr or search.login_location))
+
+    @staticmethod
+    def _keyword(condition: tuple | None) -> str:
+        """
+        获取查询条件中的关键字
+
+        参数:
+        - condition (tuple | None): 查询条件，格式为 ("like", "%关键字%")。
+
+        返回:
+        - str: 去除通配符后的关键字，未提供时返回空字符串。
+        """
+        return condition[1].strip("%") if condition and condition[1] else ""
+
     @staticmethod
     def _match_search_conditions(online_info: dict, search: OnlineQueryParam | None = None) -> bool:
         """
@@ -100,19 +426,20 @@ class OnlineService:
         if not search:
             return True
 
+        # 登录名称、IP地址按前缀匹配，与前缀索引一致
         if search.name and search.name[1]:
             keyword = search.name[1].strip("%")
-            if keyword.lower() not in online_info.get("name", "").lower():
+            if not (online_info.get("name") or "").lower().startswith(keyword.lower()):
                 return False
 
         if search.ipaddr and search.ipaddr[1]:
             keyword = search.ipaddr[1].strip("%")
-            if keyword not in online_info.get("ipaddr", ""):
+            if not (online_info.get("ipaddr") or "").startswith(keyword):
                 return False
 
         if search.login_location and search.login_location[1]:
             keyword = search.login_location[1].strip("%")
-            if keyword.lower() not in online_info.get("login_location", "").lower():
+            if keyword.lower() not in (online_info.get("login_location") or "").lower():
                 return False
 
         return True
@@ -65,6 +65,44 @@ class DiskInfoSchema(BaseModel):
     usage: float = Field(ge=0, le=100, description="使用率(%)")
 
 
+class PwdHashInfoSchema(BaseModel):
+    """密码计算线程池信息模型"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    workers: int = Field(ge=0, description="线程数")
+    running: int = Field(ge=0, description="执行中任务数")
+    pending: int = Field(ge=0, description="排队任务数")
+
+
+class OperationLogWriterInfoSchema(BaseModel):
+    """操作日志写入队列信息模型"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    queue_size: int = Field(ge=0, description="队列长度")
+    queue_max: int = Field(ge=0, description="队列容量")
+    overflow: str = Field(description="队列满时的处理策略")
+    written: int = Field(ge=0, description="已写入条数")
+    dropped: int = Field(ge=0, description="已丢弃条数")
+    failed: int = Field(ge=0, description="写入失败条数")
+    batches: int = Field(ge=0, description="写入批次数")
+    last_flush_ms: float = Field(ge=0, description="最近一批写入耗时(毫秒)")
+    max_flush_ms: float = Field(ge=0, description="最大单批写入耗时(毫秒)")
+
+
+class UserAgentCacheInfoSchema(BaseModel):
+    """User-Agent 解析缓存信息模型"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    size: int = Field(ge=0, description="缓存条数")
+    maxsize: int = Field(ge=0, description="缓存容量")
+    hits: int = Field(ge=0, description="命中次数")
+    misses: int = Field(ge=0, description="未命中次数")
+    hit_rate: float = Field(ge=0, le=1, description="命中率")
+
+
 class ServerMonitorSchema(BaseModel):
     """服务器监控信息模型"""
 
@@ -75,3 +113,10 @@ class ServerMonitorSchema(BaseModel):
     py: PyInfoSchema = Field(description="Python运行信息")
     sys: SysInfoSchema = Field(description="系统信息")
     disks: list[DiskInfoSchema] = Field(default_factory=list, description="磁盘信息")
+    pwd_hash: PwdHashInfoSchema | None = Field(default=None, description="密码计算线程池信息")
+    operation_log: OperationLogWriterInfoSchema | None = Field(
+        default=None, description="操作日志写入队列信息"
+    )
+    user_agent: UserAgentCacheInfoSchema | None = Field(
+        default=None, description="User-Agent 解析缓存信息"
+    )
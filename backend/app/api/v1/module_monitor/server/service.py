@@ -5,15 +5,21 @@ from pathlib import Path
 
 import psutil
 
+from app.core.log_writer import OperationLogWriter
 from app.utils.common_util import bytes2human
+from app.utils.hash_bcrpy_util import PwdUtil
+from app.utils.ua_util import UserAgentUtil
 
 from .schema import (
     CpuInfoSchema,
     DiskInfoSchema,
     MemoryInfoSchema,
+    OperationLogWriterInfoSchema,
+    PwdHashInfoSchema,
     PyInfoSchema,
     ServerMonitorSchema,
     SysInfoSchema,
+    UserAgentCacheInfoSchema,
 )
 
 
@@ -34,6 +40,9 @@ class ServerService:
             sys=cls._get_system_info(),
             py=cls._get_python_info(),
             disks=cls._get_disk_info(),
+            pwd_hash=PwdHashInfoSchema(**PwdUtil.stats()),
+            operation_log=OperationLogWriterInfoSchema(**OperationLogWriter.stats()),
+            user_agent=UserAgentCacheInfoSchema(**UserAgentUtil.stats()),
         ).model_dump()
 
     @classmethod
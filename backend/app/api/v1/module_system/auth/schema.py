@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.module_system.user.model import UserModel
@@ -14,6 +15,12 @@ class AuthSchema(BaseModel):
     user: UserModel | None = Field(default=None, description="用户信息")
     check_data_scope: bool = Field(default=True, description="是否检查数据权限")
     db: AsyncSession = Field(description="数据库会话")
+    permissions: frozenset[str] = Field(default_factory=frozenset, description="权限标识集合")
+
+    # 请求内数据权限范围缓存（部门子树等），由 Permission 维护
+    _scope_cache: dict[tuple, Any] = PrivateAttr(default_factory=dict)
+    # 数据权限范围版本号，由 get_current_user 每个请求从 Redis 读取一次，为空时不使用跨请求缓存
+    _scope_versions: dict[str, int] = PrivateAttr(default_factory=dict)
 
 
 class JWTPayloadSchema(BaseModel):
@@ -6,9 +6,9 @@ from typing import NewType
 from fastapi import Request
 from redis.asyncio.client import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
-from user_agents import parse
 
 from app.api.v1.module_monitor.online.schema import OnlineOutSchema
+from app.api.v1.module_monitor.online.service import OnlineService
 from app.api.v1.module_system.user.crud import UserCRUD
 from app.api.v1.module_system.user.model import UserModel
 from app.common.enums import RedisInitKeyConfig
@@ -21,10 +21,11 @@ from app.core.security import (
     create_access_token,
     decode_access_token,
 )
-from app.utils.captcha_util import CaptchaUtil
+from app.utils.captcha_util import CaptchaPool
 from app.utils.common_util import get_random_character
 from app.utils.hash_bcrpy_util import PwdUtil
 from app.utils.ip_local_util import IpLocalUtil
+from app.utils.ua_util import UserAgentUtil
 
 from .schema import (
     AuthSchema,
@@ -85,14 +86,19 @@ class LoginService:
         if not user:
             raise CustomException(msg="用户不存在")
 
-        if not PwdUtil.verify_password(
+        verified, new_password_hash = await PwdUtil.verify_and_update_password(
             plain_password=login_form.password, password_hash=user.password
-        ):
+        )
+        if not verified:
             raise CustomException(msg="账号或密码错误")
 
         if user.status == "1":
             raise CustomException(msg="用户已被停用")
 
+        # 加密配置变更后透明地重新加密密码
+        if new_password_hash:
+            await UserCRUD(auth).change_password_crud(id=user.id, password_hash=new_password_hash)
+
         # 更新最后登录时间
         user = await UserCRUD(auth).update_last_login_crud(id=user.id)
         if not user:
@@ -133,7 +139,7 @@ class LoginService:
         session_id = str(uuid.uuid4())
         request.scope["session_id"] = session_id
 
-        user_agent = parse(request.headers.get("user-agent"))
+        user_agent = UserAgentUtil.parse(request.headers.get("user-agent"))
         request_ip = None
         x_forwarded_for = request.headers.get("X-Forwarded-For")
         if x_forwarded_for:
@@ -165,8 +171,8 @@ class LoginService:
             user_name=user.username,
             ipaddr=request_ip,
             login_location=login_location,
-            os=user_agent.os.family,
-            browser=user_agent.browser.family,
+            os=user_agent.os,
+            browser=user_agent.browser,
             login_time=user.last_login,
             login_type=login_type,
         ).model_dump_json()
@@ -198,6 +204,11 @@ class LoginService:
             value=refresh_token,
             expire=int(refresh_expires.total_seconds()),
         )
+        await OnlineService.register_session_service(
+            redis=redis,
+            session_info=json.loads(session_info),
+            expire=int(access_expires.total_seconds()),
+        )
 
         return JWTOutSchema(
             access_token=access_token,
@@ -285,6 +296,11 @@ class LoginService:
             value=refresh_token_new,
             expire=int(refresh_expires.total_seconds()),
         )
+        await OnlineService.register_session_service(
+            redis=redis,
+            session_info=session_info,
+            expire=int(access_expires.total_seconds()),
+        )
 
         return JWTOutSchema(
             access_token=access_token,
@@ -316,8 +332,7 @@ class LoginService:
             raise CustomException(msg="非法凭证,无法获取会话编号")
 
         # 删除Redis中的在线用户、访问令牌、刷新令牌
-        await RedisCURD(redis).delete(f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}")
-        await RedisCURD(redis).delete(f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:{session_id}")
+        await OnlineService.unregister_session_service(redis, session_id)
 
         log.info(f"用户退出登录成功,会话编号:{session_id}")
 
@@ -345,7 +360,7 @@ class CaptchaService:
             raise CustomException(msg="未开启验证码服务")
 
         # 生成验证码图片和值
-        captcha_base64, captcha_value = CaptchaUtil.captcha_arithmetic()
+        captcha_base64, captcha_value = await CaptchaPool.get()
         captcha_key = get_random_character()
 
         # 保存到Redis并设置过期时间
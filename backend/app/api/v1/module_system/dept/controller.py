@@ -2,11 +2,12 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.common.response import SuccessResponse
 from app.core.base_schema import BatchSetAvailable
-from app.core.dependencies import AuthPermission
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 
@@ -84,6 +85,7 @@ async def get_obj_detail_controller(
 async def create_obj_controller(
     data: DeptCreateSchema,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:dept:create"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     创建部门
@@ -91,6 +93,7 @@ async def create_obj_controller(
     参数:
     - data (DeptCreateSchema): 创建部门负载模型
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 包含创建部门结果的响应模型
@@ -98,7 +101,7 @@ async def create_obj_controller(
     异常:
     - CustomException: 创建部门失败时抛出异常。
     """
-    result_dict = await DeptService.create_dept_service(data=data, auth=auth)
+    result_dict = await DeptService.create_dept_service(data=data, auth=auth, redis=redis)
     log.info(f"创建部门成功: {result_dict}")
     return SuccessResponse(data=result_dict, msg="创建部门成功")
 
@@ -113,6 +116,7 @@ async def update_obj_controller(
     data: DeptUpdateSchema,
     id: Annotated[int, Path(description="部门ID")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:dept:update"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     修改部门
@@ -121,6 +125,7 @@ async def update_obj_controller(
     - data (DeptUpdateSchema): 修改部门负载模型
     - id (int): 部门ID
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 包含修改部门结果的响应模型
@@ -128,7 +133,7 @@ async def update_obj_controller(
     异常:
     - CustomException: 修改部门失败时抛出异常。
     """
-    result_dict = await DeptService.update_dept_service(auth=auth, id=id, data=data)
+    result_dict = await DeptService.update_dept_service(auth=auth, redis=redis, id=id, data=data)
     log.info(f"修改部门成功: {result_dict}")
     return SuccessResponse(data=result_dict, msg="修改部门成功")
 
@@ -141,6 +146,7 @@ async def update_obj_controller(
 async def delete_obj_controller(
     ids: Annotated[list[int], Body(description="ID列表")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:dept:delete"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     删除部门
@@ -148,6 +154,7 @@ async def delete_obj_controller(
     参数:
     - ids (list[int]): 部门ID列表
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 包含删除部门结果的响应模型
@@ -155,7 +162,7 @@ async def delete_obj_controller(
     异常:
     - CustomException: 删除部门失败时抛出异常。
     """
-    await DeptService.delete_dept_service(ids=ids, auth=auth)
+    await DeptService.delete_dept_service(ids=ids, auth=auth, redis=redis)
     log.info(f"删除部门成功: {ids}")
     return SuccessResponse(msg="删除部门成功")
 
@@ -168,6 +175,7 @@ async def delete_obj_controller(
 async def batch_set_available_obj_controller(
     data: BatchSetAvailable,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:dept:patch"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     批量修改部门状态
@@ -175,6 +183,7 @@ async def batch_set_available_obj_controller(
     参数:
     - data (BatchSetAvailable): 批量修改部门状态负载模型
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 包含批量修改部门状态结果的响应模型
@@ -182,6 +191,6 @@ async def batch_set_available_obj_controller(
     异常:
     - CustomException: 批量修改部门状态失败时抛出异常。
     """
-    await DeptService.batch_set_available_service(data=data, auth=auth)
+    await DeptService.batch_set_available_service(data=data, auth=auth, redis=redis)
     log.info(f"批量修改部门状态成功: {data.ids}")
     return SuccessResponse(msg="批量修改部门状态成功")
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.base_model import ModelMixin, TenantMixin
+from app.core.base_model import ModelMixin, TenantMixin, TreeMixin
 
 if TYPE_CHECKING:
     from app.api.v1.module_system.role.model import RoleModel
@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from app.api.v1.module_system.user.model import UserModel
 
 
-class DeptModel(ModelMixin, TenantMixin):
+class DeptModel(ModelMixin, TenantMixin, TreeMixin):
     """
     部门模型
     """
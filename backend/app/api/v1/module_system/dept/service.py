@@ -1,13 +1,12 @@
+from redis.asyncio.client import Redis
+
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.base_schema import BatchSetAvailable
+from app.core.database import after_commit
 from app.core.exceptions import CustomException
-from app.utils.common_util import (
-    get_child_id_map,
-    get_child_recursion,
-    get_parent_id_map,
-    get_parent_recursion,
-    traversal_to_tree,
-)
+from app.core.permission import Permission
+from app.core.principal import PrincipalCache
+from app.utils.common_util import traversal_to_tree
 
 from .crud import DeptCRUD
 from .schema import (
@@ -71,12 +70,15 @@ class DeptService:
         return traversal_to_tree(dept_dict_list)
 
     @classmethod
-    async def create_dept_service(cls, auth: AuthSchema, data: DeptCreateSchema) -> dict:
+    async def create_dept_service(
+        cls, auth: AuthSchema, redis: Redis, data: DeptCreateSchema
+    ) -> dict:
         """
         创建部门。
 
         参数:
         - auth (AuthSchema): 认证对象。
+        - redis (Redis): Redis 客户端实例。
         - data (DeptCreateSchema): 部门创建对象。
 
         返回:
@@ -92,15 +94,19 @@ class DeptService:
         if obj:
             raise CustomException(msg="创建失败，编码已存在")
         dept = await DeptCRUD(auth).create(data=data)
+        after_commit(auth.db, lambda: Permission.invalidate_cache(redis, "dept"))
         return DeptOutSchema.model_validate(dept).model_dump()
 
     @classmethod
-    async def update_dept_service(cls, auth: AuthSchema, id: int, data: DeptUpdateSchema) -> dict:
+    async def update_dept_service(
+        cls, auth: AuthSchema, redis: Redis, id: int, data: DeptUpdateSchema
+    ) -> dict:
         """
         更新部门。
 
         参数:
         - auth (AuthSchema): 认证对象。
+        - redis (Redis): Redis 客户端实例。
         - id (int): 部门 ID。
         - data (DeptUpdateSchema): 部门更新对象。
 
@@ -117,15 +123,18 @@ class DeptService:
         if exist_dept and exist_dept.id != id:
             raise CustomException(msg="更新失败，部门名称重复")
         dept = await DeptCRUD(auth).update(id=id, data=data)
+        after_commit(auth.db, lambda: Permission.invalidate_cache(redis, "dept"))
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
         return DeptOutSchema.model_validate(dept).model_dump()
 
     @classmethod
-    async def delete_dept_service(cls, auth: AuthSchema, ids: list[int]) -> None:
+    async def delete_dept_service(cls, auth: AuthSchema, redis: Redis, ids: list[int]) -> None:
         """
         删除部门。
 
         参数:
         - auth (AuthSchema): 认证对象。
+        - redis (Redis): Redis 客户端实例。
         - ids (List[int]): 部门 ID 列表。
 
         返回:
@@ -137,50 +146,35 @@ class DeptService:
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
 
-        # 获取所有部门列表，用于构建树形关系
-        all_depts = await DeptCRUD(auth).get_list_crud()
-
-        # 构建子部门ID映射
-        child_id_map = get_child_id_map(model_list=all_depts)
-
-        # 收集所有需要删除的部门ID，包括直接指定的ID和它们的所有子部门ID
-        delete_ids_set = set()
-
-        for id in ids:
-            # 递归获取该ID的所有子部门ID
-            all_descendants = get_child_recursion(id=id, id_map=child_id_map)
-            delete_ids_set.update(all_descendants)
-
-        # 将集合转换为列表
-        delete_ids = list(delete_ids_set)
+        # 按 tree_path 一次查询出所有子孙部门ID，一并删除
+        delete_ids = await DeptCRUD(auth).tree_children_ids(ids)
 
         # 执行批量删除操作
         await DeptCRUD(auth).delete(ids=delete_ids)
+        after_commit(auth.db, lambda: Permission.invalidate_cache(redis, "dept"))
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
 
     @classmethod
-    async def batch_set_available_service(cls, auth: AuthSchema, data: BatchSetAvailable) -> None:
+    async def batch_set_available_service(
+        cls, auth: AuthSchema, redis: Redis, data: BatchSetAvailable
+    ) -> None:
         """
         批量设置部门可用状态。
 
         参数:
         - auth (AuthSchema): 认证对象。
+        - redis (Redis): Redis 客户端实例。
         - data (BatchSetAvailable): 批量设置可用状态对象。
 
         返回:
         - None
         """
-        dept_list = await DeptCRUD(auth).get_list_crud()
-        total_ids = []
-
         if data.status == "0":
-            id_map = get_parent_id_map(model_list=dept_list)
-            for dept_id in data.ids:
-                enable_ids = get_parent_recursion(id=dept_id, id_map=id_map)
-                total_ids.extend(enable_ids)
+            # 激活，则需要把所有父级部门都激活
+            total_ids = await DeptCRUD(auth).tree_parent_ids(data.ids)
         else:
-            id_map = get_child_id_map(model_list=dept_list)
-            for dept_id in data.ids:
-                disable_ids = get_child_recursion(id=dept_id, id_map=id_map)
-                total_ids.extend(disable_ids)
+            # 禁止，则需要把所有子级部门都禁止
+            total_ids = await DeptCRUD(auth).tree_children_ids(data.ids)
 
         await DeptCRUD(auth).set_available_crud(ids=total_ids, status=data.status)
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
@@ -5,7 +5,6 @@ from fastapi.responses import JSONResponse, StreamingResponse
 from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.base_schema import BatchSetAvailable
@@ -82,13 +81,12 @@ async def get_type_list_controller(
     异常:
     - CustomException: 查询字典类型失败时抛出异常。
     """
-    result_dict_list = await DictTypeService.get_obj_list_service(
-        auth=auth, search=search, order_by=page.order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    result_dict = await DictTypeService.get_obj_page_service(
+        auth=auth,
         page_no=page.page_no,
         page_size=page.page_size,
+        search=search,
+        order_by=page.order_by,
     )
     log.info("查询字典类型列表成功")
     return SuccessResponse(data=result_dict, msg="查询字典类型列表成功")
@@ -328,13 +326,12 @@ async def get_data_list_controller(
     order_by = [{"order": "asc"}]
     if page.order_by:
         order_by = page.order_by
-    result_dict_list = await DictDataService.get_obj_list_service(
-        auth=auth, search=search, order_by=order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    result_dict = await DictDataService.get_obj_page_service(
+        auth=auth,
         page_no=page.page_no,
         page_size=page.page_size,
+        search=search,
+        order_by=order_by,
     )
     log.info("查询字典数据列表成功")
     return SuccessResponse(data=result_dict, msg="查询字典数据列表成功")
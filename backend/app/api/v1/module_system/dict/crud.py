@@ -4,8 +4,10 @@ from app.api.v1.module_system.auth.schema import AuthSchema
 from app.api.v1.module_system.dict.model import DictDataModel, DictTypeModel
 from app.api.v1.module_system.dict.schema import (
     DictDataCreateSchema,
+    DictDataOutSchema,
     DictDataUpdateSchema,
     DictTypeCreateSchema,
+    DictTypeOutSchema,
     DictTypeUpdateSchema,
 )
 from app.core.base_crud import CRUDBase
@@ -64,6 +66,39 @@ class DictTypeCRUD(CRUDBase[DictTypeModel, DictTypeCreateSchema, DictTypeUpdateS
             preload = []
         return await self.list(search=search, order_by=order_by, preload=preload)
 
+    async def get_obj_page_crud(
+        self,
+        offset: int,
+        limit: int,
+        order_by: list[dict] | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+    ) -> dict:
+        """
+        分页获取数据字典类型列表
+
+        参数:
+        - offset (int): 偏移量
+        - limit (int): 每页数量
+        - order_by (list[dict] | None): 排序参数
+        - search (dict | None): 查询参数
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - dict: 分页数据
+        """
+        if preload is None:
+            preload = []
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=order_by or [{"id": "asc"}],
+            search=search or {},
+            out_schema=DictTypeOutSchema,
+            preload=preload,
+            lean=True,
+        )
+
     async def create_obj_crud(self, data: DictTypeCreateSchema) -> DictTypeModel | None:
         """
         创建数据字典类型
@@ -181,6 +216,39 @@ class DictDataCRUD(CRUDBase[DictDataModel, DictDataCreateSchema, DictDataUpdateS
             preload = []
         return await self.list(search=search, order_by=order_by, preload=preload)
 
+    async def get_obj_page_crud(
+        self,
+        offset: int,
+        limit: int,
+        order_by: list[dict] | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+    ) -> dict:
+        """
+        分页获取数据字典数据列表
+
+        参数:
+        - offset (int): 偏移量
+        - limit (int): 每页数量
+        - order_by (list[dict] | None): 排序参数
+        - search (dict | None): 查询参数
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - dict: 分页数据
+        """
+        if preload is None:
+            preload = []
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=order_by or [{"id": "asc"}],
+            search=search or {},
+            out_schema=DictDataOutSchema,
+            preload=preload,
+            lean=True,
+        )
+
     async def create_obj_crud(self, data: DictDataCreateSchema) -> DictDataModel | None:
         """
         创建数据字典数据
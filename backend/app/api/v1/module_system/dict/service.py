@@ -67,6 +67,36 @@ class DictTypeService:
         )
         return [DictTypeOutSchema.model_validate(obj).model_dump() for obj in obj_list]
 
+    @classmethod
+    async def get_obj_page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: DictTypeQueryParam | None = None,
+        order_by: list[dict] | None = None,
+    ) -> dict:
+        """
+        分页获取数据字典类型列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (DictTypeQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+
+        返回:
+        - dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await DictTypeCRUD(auth).get_obj_page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+        )
+
     @classmethod
     async def create_obj_service(
         cls, auth: AuthSchema, redis: Redis, data: DictTypeCreateSchema
@@ -308,6 +338,36 @@ class DictDataService:
         )
         return [DictDataOutSchema.model_validate(obj).model_dump() for obj in obj_list]
 
+    @classmethod
+    async def get_obj_page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: DictDataQueryParam | None = None,
+        order_by: list[dict] | None = None,
+    ) -> dict:
+        """
+        分页获取数据字典数据列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (DictDataQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+
+        返回:
+        - dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await DictDataCRUD(auth).get_obj_page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+        )
+
     @classmethod
     async def init_dict_service(cls, redis: Redis) -> None:
         """
@@ -4,7 +4,6 @@ from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.dependencies import AuthPermission
@@ -43,14 +42,23 @@ async def get_obj_list_controller(
     order_by = [{"created_time": "desc"}]
     if page.order_by:
         order_by = page.order_by
-    result_dict_list = await OperationLogService.get_log_list_service(
-        search=search, auth=auth, order_by=order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
-        page_no=page.page_no,
-        page_size=page.page_size,
-    )
+    if page.page_mode == "cursor":
+        result_dict = await OperationLogService.get_log_cursor_page_service(
+            auth=auth,
+            cursor=page.cursor,
+            page_size=page.page_size,
+            search=search,
+            order_by=order_by,
+            with_total=page.with_total,
+        )
+    else:
+        result_dict = await OperationLogService.get_log_page_service(
+            auth=auth,
+            page_no=page.page_no,
+            page_size=page.page_size,
+            search=search,
+            order_by=order_by,
+        )
     log.info("查询日志成功")
     return SuccessResponse(data=result_dict, msg="查询日志成功")
 
@@ -80,6 +88,58 @@ async def get_obj_detail_controller(
     return SuccessResponse(data=result_dict, msg="获取日志详情成功")
 
 
+@LogRouter.get(
+    "/archive/months",
+    summary="查询归档月份",
+    description="查询已归档的日志月份",
+)
+async def get_archive_months_controller(
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:log:query"]))],
+) -> JSONResponse:
+    """
+    查询归档月份
+
+    参数:
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含归档月份列表的 JSON 响应模型
+    """
+    result = await OperationLogService.get_archive_months_service()
+    log.info("查询日志归档月份成功")
+    return SuccessResponse(data=result, msg="查询日志归档月份成功")
+
+
+@LogRouter.get(
+    "/archive/{month}",
+    summary="查询归档日志",
+    description="分页查询指定月份的归档日志",
+)
+async def get_archive_list_controller(
+    month: Annotated[str, Path(description="归档月份(YYYY-MM)")],
+    page: Annotated[PaginationQueryParam, Depends()],
+    search: Annotated[OperationLogQueryParam, Depends()],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:log:query"]))],
+) -> JSONResponse:
+    """
+    查询归档日志
+
+    参数:
+    - month (str): 归档月份(YYYY-MM)
+    - page (PaginationQueryParam): 分页查询参数模型
+    - search (OperationLogQueryParam): 日志查询参数模型
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含分页归档日志的 JSON 响应模型
+    """
+    result_dict = await OperationLogService.get_archive_page_service(
+        auth=auth, month=month, page_no=page.page_no, page_size=page.page_size, search=search
+    )
+    log.info(f"查询归档日志成功 {month}")
+    return SuccessResponse(data=result_dict, msg="查询归档日志成功")
+
+
 @LogRouter.delete(
     "/delete",
     summary="删除日志",
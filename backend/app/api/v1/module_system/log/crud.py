@@ -4,7 +4,7 @@ from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.base_crud import CRUDBase
 
 from .model import OperationLogModel
-from .schema import OperationLogCreateSchema
+from .schema import OperationLogCreateSchema, OperationLogOutSchema
 
 
 class OperationLogCRUD(
@@ -66,3 +66,68 @@ class OperationLogCRUD(
         - Sequence[OperationLogModel]: 操作日志列表。
         """
         return await self.list(search=search, order_by=order_by, preload=preload)
+
+    async def get_page_crud(
+        self,
+        offset: int,
+        limit: int,
+        order_by: list | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+    ) -> dict:
+        """
+        分页获取操作日志列表。
+
+        参数:
+        - offset (int): 偏移量。
+        - limit (int): 每页数量。
+        - order_by (List[Dict[str, str]] | None): 排序字段列表。
+        - search (Dict | None): 搜索条件字典。
+        - preload (Optional[List[Union[str, Any]]]): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - dict: 分页数据。
+        """
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=order_by or [{"id": "asc"}],
+            search=search or {},
+            out_schema=OperationLogOutSchema,
+            preload=preload,
+            lean=True,
+        )
+
+    async def get_cursor_page_crud(
+        self,
+        cursor: str | None,
+        limit: int,
+        order_by: list[dict] | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+        with_total: bool = False,
+    ) -> dict:
+        """
+        游标分页获取操作日志列表
+
+        参数:
+        - cursor (str | None): 上一页返回的游标，为空时返回第一页
+        - limit (int): 每页数量
+        - order_by (list[dict] | None): 排序参数
+        - search (dict | None): 查询参数
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+        - with_total (bool): 是否统计总数
+
+        返回:
+        - dict: 分页数据
+        """
+        return await self.page_after(
+            cursor=cursor,
+            limit=limit,
+            order_by=order_by,
+            search=search,
+            out_schema=OperationLogOutSchema,
+            preload=preload,
+            with_total=with_total,
+            lean=True,
+        )
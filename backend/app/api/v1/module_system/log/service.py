@@ -1,5 +1,6 @@
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.exceptions import CustomException
+from app.core.log_archiver import LogArchiver
 from app.utils.excel_util import ExcelUtil
 
 from .crud import OperationLogCRUD
@@ -56,6 +57,109 @@ class OperationLogService:
         log_dict_list = [OperationLogOutSchema.model_validate(log).model_dump() for log in log_list]
         return log_dict_list
 
+    @classmethod
+    async def get_log_page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: OperationLogQueryParam | None = None,
+        order_by: list | None = None,
+    ) -> dict:
+        """
+        分页获取日志列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (OperationLogQueryParam | None): 日志查询参数模型
+        - order_by (list | None): 排序字段列表
+
+        返回:
+        - dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await OperationLogCRUD(auth).get_page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+        )
+
+    @classmethod
+    async def get_log_cursor_page_service(
+        cls,
+        auth: AuthSchema,
+        cursor: str | None,
+        page_size: int,
+        search: OperationLogQueryParam | None = None,
+        order_by: list[dict] | None = None,
+        with_total: bool = False,
+    ) -> dict:
+        """
+        游标分页获取日志列表
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - cursor (str | None): 上一页返回的游标，为空时返回第一页
+        - page_size (int): 每页数量
+        - search (OperationLogQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+        - with_total (bool): 是否统计总数
+
+        返回:
+        - dict: 分页数据
+        """
+        return await OperationLogCRUD(auth).get_cursor_page_crud(
+            cursor=cursor,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+            with_total=with_total,
+        )
+
+    @classmethod
+    async def get_archive_months_service(cls) -> list[dict]:
+        """
+        获取已归档的日志月份
+
+        返回:
+        - list[dict]: 归档月份列表
+        """
+        return LogArchiver.list_months(name="sys_log")
+
+    @classmethod
+    async def get_archive_page_service(
+        cls,
+        auth: AuthSchema,
+        month: str,
+        page_no: int,
+        page_size: int,
+        search: OperationLogQueryParam | None = None,
+    ) -> dict:
+        """
+        分页查询归档月份中的日志
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - month (str): 归档月份(YYYY-MM)
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (OperationLogQueryParam | None): 日志查询参数模型
+
+        返回:
+        - dict: 分页数据
+        """
+        return await LogArchiver.read_month(
+            auth=auth,
+            name="sys_log",
+            month=month,
+            page_no=page_no,
+            page_size=page_size,
+            search=search.__dict__ if search else {},
+        )
+
     @classmethod
     async def create_log_service(cls, auth: AuthSchema, data: OperationLogCreateSchema) -> dict:
         """
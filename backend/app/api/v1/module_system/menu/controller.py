@@ -2,11 +2,12 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.common.response import SuccessResponse
 from app.core.base_schema import BatchSetAvailable
-from app.core.dependencies import AuthPermission
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 
@@ -101,6 +102,7 @@ async def update_obj_controller(
     data: MenuUpdateSchema,
     id: Annotated[int, Path(description="菜单ID")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:menu:update"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     修改菜单。
@@ -108,11 +110,12 @@ async def update_obj_controller(
     参数:
     - id (int): 菜单ID。
     - data (MenuUpdateSchema): 菜单更新模型。
+    - redis (Redis): Redis数据库连接。
 
     返回:
     - JSONResponse: 包含修改菜单的 JSON 响应。
     """
-    result_dict = await MenuService.update_menu_service(id=id, data=data, auth=auth)
+    result_dict = await MenuService.update_menu_service(id=id, data=data, auth=auth, redis=redis)
     log.info(f"修改菜单成功: {result_dict}")
     return SuccessResponse(data=result_dict, msg="修改菜单成功")
 
@@ -125,17 +128,19 @@ async def update_obj_controller(
 async def delete_obj_controller(
     ids: Annotated[list[int], Body(description="ID列表")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:menu:delete"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     删除菜单。
 
     参数:
     - ids (list[int]): 菜单ID列表。
+    - redis (Redis): Redis数据库连接。
 
     返回:
     - JSONResponse: 包含删除菜单的 JSON 响应。
     """
-    await MenuService.delete_menu_service(ids=ids, auth=auth)
+    await MenuService.delete_menu_service(ids=ids, auth=auth, redis=redis)
     log.info(f"删除菜单成功: {ids}")
     return SuccessResponse(msg="删除菜单成功")
 
@@ -148,16 +153,18 @@ async def delete_obj_controller(
 async def batch_set_available_obj_controller(
     data: BatchSetAvailable,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:menu:patch"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     批量修改菜单状态。
 
     参数:
     - data (BatchSetAvailable): 批量修改菜单状态模型。
+    - redis (Redis): Redis数据库连接。
 
     返回:
     - JSONResponse: 批量修改菜单状态的 JSON 响应。
     """
-    await MenuService.set_menu_available_service(data=data, auth=auth)
+    await MenuService.set_menu_available_service(data=data, auth=auth, redis=redis)
     log.info(f"批量修改菜单状态成功: {data.ids}")
     return SuccessResponse(msg="批量修改菜单状态成功")
@@ -1,13 +1,11 @@
+from redis.asyncio.client import Redis
+
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.base_schema import BatchSetAvailable
+from app.core.database import after_commit
 from app.core.exceptions import CustomException
-from app.utils.common_util import (
-    get_child_id_map,
-    get_child_recursion,
-    get_parent_id_map,
-    get_parent_recursion,
-    traversal_to_tree,
-)
+from app.core.principal import PrincipalCache
+from app.utils.common_util import traversal_to_tree
 
 from .crud import MenuCRUD
 from .schema import (
@@ -93,12 +91,15 @@ class MenuService:
         return new_menu_dict
 
     @classmethod
-    async def update_menu_service(cls, auth: AuthSchema, id: int, data: MenuUpdateSchema) -> dict:
+    async def update_menu_service(
+        cls, auth: AuthSchema, redis: Redis, id: int, data: MenuUpdateSchema
+    ) -> dict:
         """
         更新菜单。
 
         参数:
         - auth (AuthSchema): 认证对象。
+        - redis (Redis): Redis连接。
         - id (int): 菜单ID。
         - data (MenuUpdateSchema): 更新参数对象。
 
@@ -120,19 +121,20 @@ class MenuService:
         new_menu = await MenuCRUD(auth).update(id=id, data=data)
 
         await cls.set_menu_available_service(
-            auth=auth, data=BatchSetAvailable(ids=[id], status=data.status)
+            auth=auth, redis=redis, data=BatchSetAvailable(ids=[id], status=data.status)
         )
 
         new_menu_dict = MenuOutSchema.model_validate(new_menu).model_dump()
         return new_menu_dict
 
     @classmethod
-    async def delete_menu_service(cls, auth: AuthSchema, ids: list[int]) -> None:
+    async def delete_menu_service(cls, auth: AuthSchema, redis: Redis, ids: list[int]) -> None:
         """
         删除菜单。
 
         参数:
         - auth (AuthSchema): 认证对象。
+        - redis (Redis): Redis连接。
         - ids (list[int]): 菜单ID列表。
 
         返回:
@@ -141,52 +143,34 @@ class MenuService:
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
 
-        # 获取所有菜单列表，用于构建树形关系
-        all_menus = await MenuCRUD(auth).get_list_crud()
-
-        # 构建子菜单ID映射
-        child_id_map = get_child_id_map(model_list=all_menus)
-
-        # 收集所有需要删除的菜单ID，包括直接指定的ID和它们的所有子菜单ID
-        delete_ids_set = set()
-
-        for id in ids:
-            # 递归获取该ID的所有子菜单ID
-            all_descendants = get_child_recursion(id=id, id_map=child_id_map)
-            delete_ids_set.update(all_descendants)
-
-        # 将集合转换为列表
-        delete_ids = list(delete_ids_set)
+        # 按 tree_path 一次查询出所有子孙菜单ID，一并删除
+        delete_ids = await MenuCRUD(auth).tree_children_ids(ids)
 
         # 执行批量删除操作
         await MenuCRUD(auth).delete(ids=delete_ids)
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
 
     @classmethod
-    async def set_menu_available_service(cls, auth: AuthSchema, data: BatchSetAvailable) -> None:
+    async def set_menu_available_service(
+        cls, auth: AuthSchema, redis: Redis, data: BatchSetAvailable
+    ) -> None:
         """
         递归获取所有父、子级菜单，然后批量修改菜单可用状态。
 
         参数:
         - auth (AuthSchema): 认证对象。
+        - redis (Redis): Redis连接。
         - data (BatchSetAvailable): 批量设置可用参数对象。
 
         返回:
         - None
         """
-        menu_list = await MenuCRUD(auth).get_list_crud()
-        total_ids = []
-
         if data.status == "0":
             # 激活，则需要把所有父级菜单都激活
-            id_map = get_parent_id_map(model_list=menu_list)
-            for menu_id in data.ids:
-                enable_ids = get_parent_recursion(id=menu_id, id_map=id_map)
-                total_ids.extend(enable_ids)
+            total_ids = await MenuCRUD(auth).tree_parent_ids(data.ids)
         else:
             # 禁止，则需要把所有子级菜单都禁止
-            id_map = get_child_id_map(model_list=menu_list)
-            for menu_id in data.ids:
-                disable_ids = get_child_recursion(id=menu_id, id_map=id_map)
-                total_ids.extend(disable_ids)
+            total_ids = await MenuCRUD(auth).tree_children_ids(data.ids)
 
         await MenuCRUD(auth).set_available_crud(ids=total_ids, status=data.status)
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
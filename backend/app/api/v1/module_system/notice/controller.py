@@ -4,7 +4,6 @@ from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.base_schema import BatchSetAvailable
@@ -66,13 +65,12 @@ async def get_obj_list_controller(
     返回:
     - JSONResponse: 包含分页公告详情的响应模型。
     """
-    result_dict_list = await NoticeService.get_notice_list_service(
-        auth=auth, search=search, order_by=page.order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    result_dict = await NoticeService.get_notice_page_service(
+        auth=auth,
         page_no=page.page_no,
         page_size=page.page_size,
+        search=search,
+        order_by=page.order_by,
     )
     log.info("查询公告列表成功")
     return SuccessResponse(data=result_dict, msg="查询公告列表成功")
@@ -226,7 +224,6 @@ async def get_obj_list_available_controller(
     返回:
     - JSONResponse: 包含分页已启用公告详情的响应模型。
     """
-    result_dict_list = await NoticeService.get_notice_list_available_service(auth=auth)
-    result_dict = await PaginationService.paginate(data_list=result_dict_list)
+    result_dict = await NoticeService.get_notice_page_available_service(auth=auth)
     log.info("查询已启用公告列表成功")
     return SuccessResponse(data=result_dict, msg="查询已启用公告列表成功")
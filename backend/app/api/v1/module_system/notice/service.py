@@ -33,21 +33,24 @@ class NoticeService:
         return NoticeOutSchema.model_validate(notice_obj).model_dump()
 
     @classmethod
-    async def get_notice_list_available_service(cls, auth: AuthSchema) -> list[dict]:
+    async def get_notice_page_available_service(
+        cls, auth: AuthSchema, page_no: int = 1, page_size: int = 10
+    ) -> dict:
         """
-        获取可用的公告列表。
+        分页获取可用的公告列表（数据库分页）。
 
         参数:
         - auth (AuthSchema): 认证信息模型。
+        - page_no (int): 页码，默认 1。
+        - page_size (int): 每页数量，默认 10。
 
         返回:
-        - list[dict]: 可用公告详情字典列表。
+        - dict: 可用公告分页数据。
         """
-        notice_obj_list = await NoticeCRUD(auth).get_list_crud(search={"status": "0"})
-        return [
-            NoticeOutSchema.model_validate(notice_obj).model_dump()
-            for notice_obj in notice_obj_list
-        ]
+        offset = (page_no - 1) * page_size
+        return await NoticeCRUD(auth).page_crud(
+            offset=offset, limit=page_size, search={"status": "0"}
+        )
 
     @classmethod
     async def get_notice_list_service(
@@ -75,6 +78,36 @@ class NoticeService:
             for notice_obj in notice_obj_list
         ]
 
+    @classmethod
+    async def get_notice_page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: NoticeQueryParam | None = None,
+        order_by: list[dict] | None = None,
+    ) -> dict:
+        """
+        分页获取公告列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (NoticeQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+
+        返回:
+        - dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await NoticeCRUD(auth).page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+        )
+
     @classmethod
     async def create_notice_service(cls, auth: AuthSchema, data: NoticeCreateSchema) -> dict:
         """
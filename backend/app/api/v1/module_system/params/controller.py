@@ -5,7 +5,6 @@ from fastapi.responses import JSONResponse, StreamingResponse
 from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.dependencies import AuthPermission, redis_getter
@@ -118,13 +117,12 @@ async def get_obj_list_controller(
     返回:
     - JSONResponse: 包含参数列表的 JSON 响应
     """
-    result_dict_list = await ParamsService.get_obj_list_service(
-        auth=auth, search=search, order_by=page.order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    result_dict = await ParamsService.get_obj_page_service(
+        auth=auth,
         page_no=page.page_no,
         page_size=page.page_size,
+        search=search,
+        order_by=page.order_by,
     )
     log.info("获取参数列表成功")
     return SuccessResponse(data=result_dict, msg="查询参数列表成功")
@@ -4,7 +4,7 @@ from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.base_crud import CRUDBase
 
 from .model import ParamsModel
-from .schema import ParamsCreateSchema, ParamsUpdateSchema
+from .schema import ParamsCreateSchema, ParamsOutSchema, ParamsUpdateSchema
 
 
 class ParamsCRUD(CRUDBase[ParamsModel, ParamsCreateSchema, ParamsUpdateSchema]):
@@ -67,6 +67,37 @@ class ParamsCRUD(CRUDBase[ParamsModel, ParamsCreateSchema, ParamsUpdateSchema]):
         """
         return await self.list(search=search, order_by=order_by, preload=preload)
 
+    async def get_obj_page_crud(
+        self,
+        offset: int,
+        limit: int,
+        order_by: list[dict] | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+    ) -> dict:
+        """
+        分页获取配置管理型列表
+
+        参数:
+        - offset (int): 偏移量
+        - limit (int): 每页数量
+        - order_by (list[dict] | None): 排序参数
+        - search (dict | None): 查询参数
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - dict: 分页数据
+        """
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=order_by or [{"id": "asc"}],
+            search=search or {},
+            out_schema=ParamsOutSchema,
+            preload=preload,
+            lean=True,
+        )
+
     async def create_obj_crud(self, data: ParamsCreateSchema) -> ParamsModel | None:
         """
         创建配置管理型
@@ -92,14 +123,15 @@ class ParamsCRUD(CRUDBase[ParamsModel, ParamsCreateSchema, ParamsUpdateSchema]):
         """
         return await self.update(id=id, data=data)
 
-    async def delete_obj_crud(self, ids: list[int]) -> None:
+    async def delete_obj_crud(self, ids: list[int], search: dict | None = None) -> dict:
         """
         删除配置管理型
 
         参数:
         - ids (list[int]): 配置管理型ID列表
+        - search (dict | None): 附加删除条件
 
         返回:
-        - None
+        - dict: 已删除的ID(affected_ids)与未删除的ID(denied_ids)
         """
-        return await self.delete(ids=ids)
+        return await self.delete(ids=ids, search=search)
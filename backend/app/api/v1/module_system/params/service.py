@@ -10,6 +10,7 @@ from app.core.database import async_db_session
 from app.core.exceptions import CustomException
 from app.core.logger import log
 from app.core.redis_crud import RedisCURD
+from app.core.system_config import SystemConfigCache
 from app.utils.excel_util import ExcelUtil
 from app.utils.upload_util import UploadUtil
 
@@ -103,6 +104,36 @@ class ParamsService:
             obj_list = await ParamsCRUD(auth).get_obj_list_crud()
         return [ParamsOutSchema.model_validate(obj).model_dump() for obj in obj_list]
 
+    @classmethod
+    async def get_obj_page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: ParamsQueryParam | None = None,
+        order_by: list[dict] | None = None,
+    ) -> dict:
+        """
+        分页获取配置管理型列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (ParamsQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+
+        返回:
+        - dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await ParamsCRUD(auth).get_obj_page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+        )
+
     @classmethod
     async def create_obj_service(
         cls, auth: AuthSchema, redis: Redis, data: ParamsCreateSchema
@@ -138,6 +169,7 @@ class ParamsService:
         except Exception as e:
             log.error(f"创建字典类型失败: {e}")
             raise CustomException(msg=f"创建字典类型失败 {e}")
+        await SystemConfigCache.publish(redis)
 
         return new_obj_dict
 
@@ -182,6 +214,7 @@ class ParamsService:
         except Exception as e:
             log.error(f"更新系统配置失败: {e}")
             raise CustomException(msg="更新系统配置失败")
+        await SystemConfigCache.publish(redis)
 
         return new_obj_dict
 
@@ -200,31 +233,40 @@ class ParamsService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            exist_obj = await ParamsCRUD(auth).get_obj_by_id_crud(id=id)
+
+        # 一次查询取出待删除配置，用于失败原因提示和同步删除缓存
+        exist_objs = {
+            obj.id: obj
+            for obj in await ParamsCRUD(auth).get_obj_list_crud(search={"id": ("in", ids)})
+        }
+
+        # 权限与业务条件合并到一条删除语句中，系统初始化配置不参与删除
+        result = await ParamsCRUD(auth).delete_obj_crud(ids=ids, search={"config_type": False})
+        for id in result["denied_ids"]:
+            exist_obj = exist_objs.get(id)
             if not exist_obj:
                 raise CustomException(msg="删除失败，该数据字典类型不存在")
             # 检查是否是否初始化类型
             if exist_obj.config_type:
-                # 如果有字典数据，不能删除
                 raise CustomException(
                     msg=f"{exist_obj.config_name} 删除失败，系统初始化配置不可以删除"
                 )
-
-        await ParamsCRUD(auth).delete_obj_crud(ids=ids)
+            raise CustomException(msg="删除失败，该数据字典类型不存在")
 
         # 同步删除Redis缓存
-        for id in ids:
-            exist_obj = await ParamsCRUD(auth).get_obj_by_id_crud(id=id)
-            if not exist_obj:
-                continue
-            redis_key = f"{RedisInitKeyConfig.SYSTEM_CONFIG.key}:{exist_obj.config_key}"
+        redis_keys = [
+            f"{RedisInitKeyConfig.SYSTEM_CONFIG.key}:{exist_objs[id].config_key}"
+            for id in result["affected_ids"]
+            if id in exist_objs
+        ]
+        if redis_keys:
             try:
-                await RedisCURD(redis).delete(redis_key)
-                log.info(f"删除系统配置成功: {id}")
+                await RedisCURD(redis).delete(*redis_keys)
+                log.info(f"删除系统配置成功: {result['affected_ids']}")
             except Exception as e:
                 log.error(f"删除系统配置失败: {e}")
                 raise CustomException(msg="删除字典类型失败")
+            await SystemConfigCache.publish(redis)
 
     @classmethod
     async def export_obj_service(cls, data_list: list[dict]) -> bytes:
@@ -318,6 +360,7 @@ class ParamsService:
                 except Exception as e:
                     log.error(f"❌️ 初始化系统配置失败: {e}")
                     raise CustomException(msg="初始化系统配置失败")
+        await SystemConfigCache.publish(redis)
 
     @classmethod
     async def get_init_config_service(cls, redis: Redis) -> list[dict]:
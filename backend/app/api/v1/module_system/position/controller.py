@@ -2,13 +2,13 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse, StreamingResponse
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.base_schema import BatchSetAvailable
-from app.core.dependencies import AuthPermission
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 from app.utils.common_util import bytes2file_response
@@ -49,13 +49,12 @@ async def get_obj_list_controller(
     order_by = [{"order": "asc"}]
     if page.order_by:
         order_by = page.order_by
-    result_dict_list = await PositionService.get_position_list_service(
-        search=search, auth=auth, order_by=order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    result_dict = await PositionService.get_position_page_service(
+        auth=auth,
         page_no=page.page_no,
         page_size=page.page_size,
+        search=search,
+        order_by=order_by,
     )
     log.info("查询岗位列表成功")
     return SuccessResponse(data=result_dict, msg="查询岗位列表成功")
@@ -121,6 +120,7 @@ async def update_obj_controller(
     data: PositionUpdateSchema,
     id: Annotated[int, Path(description="岗位ID")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:position:update"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     修改岗位
@@ -129,11 +129,14 @@ async def update_obj_controller(
     - data (PositionUpdateSchema): 修改岗位模型
     - id (int): 岗位ID
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 岗位详情对象
     """
-    result_dict = await PositionService.update_position_service(id=id, data=data, auth=auth)
+    result_dict = await PositionService.update_position_service(
+        id=id, data=data, auth=auth, redis=redis
+    )
     log.info(f"修改岗位成功: {result_dict}")
     return SuccessResponse(data=result_dict, msg="修改岗位成功")
 
@@ -146,6 +149,7 @@ async def update_obj_controller(
 async def delete_obj_controller(
     ids: Annotated[list[int], Body(description="ID列表")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:position:delete"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     删除岗位
@@ -153,11 +157,12 @@ async def delete_obj_controller(
     参数:
     - ids (list[int]): ID列表
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 成功消息
     """
-    await PositionService.delete_position_service(ids=ids, auth=auth)
+    await PositionService.delete_position_service(ids=ids, auth=auth, redis=redis)
     log.info(f"删除岗位成功: {ids}")
     return SuccessResponse(msg="删除岗位成功")
 
@@ -170,6 +175,7 @@ async def delete_obj_controller(
 async def batch_set_available_obj_controller(
     data: BatchSetAvailable,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:position:patch"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     批量修改岗位状态
@@ -177,11 +183,12 @@ async def batch_set_available_obj_controller(
     参数:
     - data (BatchSetAvailable): 批量修改岗位状态模型
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 成功消息
     """
-    await PositionService.set_position_available_service(data=data, auth=auth)
+    await PositionService.set_position_available_service(data=data, auth=auth, redis=redis)
     log.info(f"批量修改岗位状态成功: {data.ids}")
     return SuccessResponse(msg="批量修改岗位状态成功")
 
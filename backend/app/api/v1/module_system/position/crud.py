@@ -5,7 +5,7 @@ from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.base_crud import CRUDBase
 
 from .model import PositionModel
-from .schema import PositionCreateSchema, PositionUpdateSchema
+from .schema import PositionCreateSchema, PositionOutSchema, PositionUpdateSchema
 
 
 class PositionCRUD(CRUDBase[PositionModel, PositionCreateSchema, PositionUpdateSchema]):
@@ -55,6 +55,36 @@ class PositionCRUD(CRUDBase[PositionModel, PositionCreateSchema, PositionUpdateS
         """
         return await self.list(search=search, order_by=order_by, preload=preload)
 
+    async def page_crud(
+        self,
+        offset: int,
+        limit: int,
+        order_by: list[dict] | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+    ) -> dict:
+        """
+        分页获取岗位列表
+
+        参数:
+        - offset (int): 偏移量
+        - limit (int): 每页数量
+        - order_by (list[dict] | None): 排序参数
+        - search (dict | None): 查询参数
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - dict: 分页数据
+        """
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=order_by or [{"id": "asc"}],
+            search=search or {},
+            out_schema=PositionOutSchema,
+            preload=preload,
+        )
+
     async def set_available_crud(self, ids: list[int], status: str) -> None:
         """
         批量设置岗位可用状态。
@@ -1,6 +1,10 @@
+from redis.asyncio.client import Redis
+
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.base_schema import BatchSetAvailable
+from app.core.database import after_commit
 from app.core.exceptions import CustomException
+from app.core.principal import PrincipalCache
 from app.utils.excel_util import ExcelUtil
 
 from .crud import PositionCRUD
@@ -55,6 +59,36 @@ class PositionService:
             PositionOutSchema.model_validate(position).model_dump() for position in position_list
         ]
 
+    @classmethod
+    async def get_position_page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: PositionQueryParam | None = None,
+        order_by: list[dict] | None = None,
+    ) -> dict:
+        """
+        分页获取岗位列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (PositionQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+
+        返回:
+        - dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await PositionCRUD(auth).page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+        )
+
     @classmethod
     async def create_position_service(cls, auth: AuthSchema, data: PositionCreateSchema) -> dict:
         """
@@ -75,13 +109,14 @@ class PositionService:
 
     @classmethod
     async def update_position_service(
-        cls, auth: AuthSchema, id: int, data: PositionUpdateSchema
+        cls, auth: AuthSchema, redis: Redis, id: int, data: PositionUpdateSchema
     ) -> dict:
         """
         更新岗位
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis 客户端实例
         - id (int): 岗位ID
         - data (PositionUpdateSchema): 岗位更新模型
 
@@ -95,15 +130,17 @@ class PositionService:
         if exist_position and exist_position.id != id:
             raise CustomException(msg="更新失败，岗位名称重复")
         updated_position = await PositionCRUD(auth).update(id=id, data=data)
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
         return PositionOutSchema.model_validate(updated_position).model_dump()
 
     @classmethod
-    async def delete_position_service(cls, auth: AuthSchema, ids: list[int]) -> None:
+    async def delete_position_service(cls, auth: AuthSchema, redis: Redis, ids: list[int]) -> None:
         """
         删除岗位
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis 客户端实例
         - ids (list[int]): 岗位ID列表
 
         返回:
@@ -116,22 +153,25 @@ class PositionService:
             if not position:
                 raise CustomException(msg="删除失败，该岗位不存在")
         await PositionCRUD(auth).delete(ids=ids)
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
 
     @classmethod
     async def set_position_available_service(
-        cls, auth: AuthSchema, data: BatchSetAvailable
+        cls, auth: AuthSchema, redis: Redis, data: BatchSetAvailable
     ) -> None:
         """
         设置岗位状态
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis 客户端实例
         - data (BatchSetAvailable): 批量设置状态模型
 
         返回:
         - None
         """
         await PositionCRUD(auth).set_available_crud(ids=data.ids, status=data.status)
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
 
     @classmethod
     async def export_position_list_service(cls, position_list: list[dict]) -> bytes:
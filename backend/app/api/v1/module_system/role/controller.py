@@ -2,13 +2,13 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse, StreamingResponse
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.base_schema import BatchSetAvailable
-from app.core.dependencies import AuthPermission
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 from app.utils.common_util import bytes2file_response
@@ -50,13 +50,12 @@ async def get_obj_list_controller(
     order_by = [{"order": "asc"}]
     if page.order_by:
         order_by = page.order_by
-    result_dict_list = await RoleService.get_role_list_service(
-        search=search, auth=auth, order_by=order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    result_dict = await RoleService.get_role_page_service(
+        auth=auth,
         page_no=page.page_no,
         page_size=page.page_size,
+        search=search,
+        order_by=order_by,
     )
     log.info("查询角色成功")
     return SuccessResponse(data=result_dict, msg="查询角色成功")
@@ -122,6 +121,7 @@ async def update_obj_controller(
     data: RoleUpdateSchema,
     id: Annotated[int, Path(description="角色ID")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:role:update"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     修改角色
@@ -130,11 +130,12 @@ async def update_obj_controller(
     - data (RoleUpdateSchema): 修改角色模型
     - id (int): 角色ID
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 修改角色JSON响应
     """
-    result_dict = await RoleService.update_role_service(id=id, data=data, auth=auth)
+    result_dict = await RoleService.update_role_service(id=id, data=data, auth=auth, redis=redis)
     log.info(f"修改角色成功: {result_dict}")
     return SuccessResponse(data=result_dict, msg="修改角色成功")
 
@@ -147,6 +148,7 @@ async def update_obj_controller(
 async def delete_obj_controller(
     ids: Annotated[list[int], Body(description="ID列表")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:role:delete"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     删除角色
@@ -154,11 +156,12 @@ async def delete_obj_controller(
     参数:
     - ids (list[int]): ID列表
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 删除角色JSON响应
     """
-    await RoleService.delete_role_service(ids=ids, auth=auth)
+    await RoleService.delete_role_service(ids=ids, auth=auth, redis=redis)
     log.info(f"删除角色成功: {ids}")
     return SuccessResponse(msg="删除角色成功")
 
@@ -171,6 +174,7 @@ async def delete_obj_controller(
 async def batch_set_available_obj_controller(
     data: BatchSetAvailable,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:role:patch"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     批量修改角色状态
@@ -178,11 +182,12 @@ async def batch_set_available_obj_controller(
     参数:
     - data (BatchSetAvailable): 批量修改角色状态模型
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 批量修改角色状态JSON响应
     """
-    await RoleService.set_role_available_service(data=data, auth=auth)
+    await RoleService.set_role_available_service(data=data, auth=auth, redis=redis)
     log.info(f"批量修改角色状态成功: {data.ids}")
     return SuccessResponse(msg="批量修改角色状态成功")
 
@@ -195,6 +200,7 @@ async def batch_set_available_obj_controller(
 async def set_role_permission_controller(
     data: RolePermissionSettingSchema,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:role:permission"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     角色授权
@@ -202,11 +208,12 @@ async def set_role_permission_controller(
     参数:
     - data (RolePermissionSettingSchema): 角色授权模型
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 角色授权JSON响应
     """
-    await RoleService.set_role_permission_service(data=data, auth=auth)
+    await RoleService.set_role_permission_service(data=data, auth=auth, redis=redis)
     log.info(f"设置角色权限成功: {data}")
     return SuccessResponse(msg="授权角色成功")
 
@@ -6,7 +6,7 @@ from app.api.v1.module_system.menu.crud import MenuCRUD
 from app.core.base_crud import CRUDBase
 
 from .model import RoleModel
-from .schema import RoleCreateSchema, RoleUpdateSchema
+from .schema import RoleCreateSchema, RoleOutSchema, RoleUpdateSchema
 
 
 class RoleCRUD(CRUDBase[RoleModel, RoleCreateSchema, RoleUpdateSchema]):
@@ -54,6 +54,36 @@ class RoleCRUD(CRUDBase[RoleModel, RoleCreateSchema, RoleUpdateSchema]):
         """
         return await self.list(search=search, order_by=order_by, preload=preload)
 
+    async def page_crud(
+        self,
+        offset: int,
+        limit: int,
+        order_by: list[dict] | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+    ) -> dict:
+        """
+        分页获取角色列表
+
+        参数:
+        - offset (int): 偏移量
+        - limit (int): 每页数量
+        - order_by (list[dict] | None): 排序参数
+        - search (dict | None): 查询参数
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - dict: 分页数据
+        """
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=order_by or [{"id": "asc"}],
+            search=search or {},
+            out_schema=RoleOutSchema,
+            preload=preload,
+        )
+
     async def set_role_menus_crud(self, role_ids: list[int], menu_ids: list[int]) -> None:
         """
         设置角色的菜单权限
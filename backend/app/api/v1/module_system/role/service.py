@@ -1,8 +1,12 @@
 from typing import Any
 
+from redis.asyncio.client import Redis
+
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.base_schema import BatchSetAvailable
+from app.core.database import after_commit
 from app.core.exceptions import CustomException
+from app.core.principal import PrincipalCache
 from app.utils.excel_util import ExcelUtil
 
 from .crud import RoleCRUD
@@ -54,6 +58,36 @@ class RoleService:
         role_list = await RoleCRUD(auth).get_list_crud(search=search.__dict__, order_by=order_by)
         return [RoleOutSchema.model_validate(role).model_dump() for role in role_list]
 
+    @classmethod
+    async def get_role_page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: RoleQueryParam | None = None,
+        order_by: list[dict] | None = None,
+    ) -> dict:
+        """
+        分页获取角色列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (RoleQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+
+        返回:
+        - dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await RoleCRUD(auth).page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+        )
+
     @classmethod
     async def create_role_service(cls, auth: AuthSchema, data: RoleCreateSchema) -> dict:
         """
@@ -76,12 +110,15 @@ class RoleService:
         return RoleOutSchema.model_validate(new_role).model_dump()
 
     @classmethod
-    async def update_role_service(cls, auth: AuthSchema, id: int, data: RoleUpdateSchema) -> dict:
+    async def update_role_service(
+        cls, auth: AuthSchema, redis: Redis, id: int, data: RoleUpdateSchema
+    ) -> dict:
         """
         更新角色
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis连接
         - id (int): 角色ID
         - data (RoleUpdateSchema): 更新角色模型
 
@@ -95,15 +132,17 @@ class RoleService:
         if exist_role and exist_role.id != id:
             raise CustomException(msg="更新失败，角色名称重复")
         updated_role = await RoleCRUD(auth).update(id=id, data=data)
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
         return RoleOutSchema.model_validate(updated_role).model_dump()
 
     @classmethod
-    async def delete_role_service(cls, auth: AuthSchema, ids: list[int]) -> None:
+    async def delete_role_service(cls, auth: AuthSchema, redis: Redis, ids: list[int]) -> None:
         """
         删除角色
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis连接
         - ids (list[int]): 角色ID列表
 
         返回:
@@ -116,16 +155,18 @@ class RoleService:
             if not role:
                 raise CustomException(msg="删除失败，该角色不存在")
         await RoleCRUD(auth).delete(ids=ids)
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
 
     @classmethod
     async def set_role_permission_service(
-        cls, auth: AuthSchema, data: RolePermissionSettingSchema
+        cls, auth: AuthSchema, redis: Redis, data: RolePermissionSettingSchema
     ) -> None:
         """
         设置角色权限
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis连接
         - data (RolePermissionSettingSchema): 角色权限设置模型
 
         返回:
@@ -144,20 +185,25 @@ class RoleService:
             await RoleCRUD(auth).set_role_depts_crud(role_ids=data.role_ids, dept_ids=data.dept_ids)
         else:
             await RoleCRUD(auth).set_role_depts_crud(role_ids=data.role_ids, dept_ids=[])
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
 
     @classmethod
-    async def set_role_available_service(cls, auth: AuthSchema, data: BatchSetAvailable) -> None:
+    async def set_role_available_service(
+        cls, auth: AuthSchema, redis: Redis, data: BatchSetAvailable
+    ) -> None:
         """
         设置角色可用状态
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis连接
         - data (BatchSetAvailable): 批量设置可用状态模型
 
         返回:
         - None
         """
         await RoleCRUD(auth).set_available_crud(ids=data.ids, status=data.status)
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
 
     @classmethod
     async def export_role_list_service(cls, role_list: list[dict[str, Any]]) -> bytes:
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.base_model import ModelMixin, UserMixin
@@ -25,7 +25,19 @@ class DataShareModel(ModelMixin, UserMixin):
     """
 
     __tablename__: str = "sys_data_share"
-    __table_args__: dict[str, str] = {"comment": "数据分享表"}
+    __table_args__: tuple = (
+        # 数据权限 EXISTS 子查询按 目标租户 + 资源 定位分享记录，其余字段由索引覆盖
+        Index(
+            "ix_sys_data_share_target",
+            "target_tenant_id",
+            "resource_type",
+            "resource_id",
+            "status",
+            "share_type",
+            "expire_time",
+        ),
+        {"comment": "数据分享表"},
+    )
     __loader_options__: list[str] = ["target_tenant", "created_by", "updated_by"]
 
     # ========== 资源标识 ==========
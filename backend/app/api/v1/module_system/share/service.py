@@ -5,6 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.module_system.auth.schema import AuthSchema
+from app.core.base_crud import CRUDBase
 from app.core.base_model import MappedBase
 from app.api.v1.module_system.share.model import DataShareModel
 from app.api.v1.module_system.share.schema import (
@@ -162,23 +163,21 @@ class ShareService:
         if not source_objects:
             raise CustomException(msg="未找到要复制的数据")
 
-        # 3. 逐个复制数据
-        copied_count = 0
-        id_mapping = {}
-
-        for obj in source_objects:
-            # 克隆对象
-            new_obj = ShareService._clone_object(
+        # 3. 批量复制数据（单条多值 INSERT 并按输入顺序回传新ID）
+        rows = [
+            ShareService._clone_object(
                 obj=obj,
                 target_tenant_id=obj_in.target_tenant_id,
                 auth=auth,
             )
+            for obj in source_objects
+        ]
+        new_ids = await CRUDBase(model=model_class, auth=auth).create_many(
+            rows=rows, returning=["id"]
+        )
 
-            auth.db.add(new_obj)
-            await auth.db.flush()  # 获取新ID
-
-            id_mapping[obj.id] = new_obj.id
-            copied_count += 1
+        copied_count = len(new_ids)
+        id_mapping = {obj.id: new["id"] for obj, new in zip(source_objects, new_ids, strict=True)}
 
         return DataCopyResponseSchema(
             copied_count=copied_count,
@@ -191,9 +190,9 @@ class ShareService:
         obj: MappedBase,
         target_tenant_id: int,
         auth: AuthSchema,
-    ) -> MappedBase:
+    ) -> dict[str, Any]:
         """
-        克隆对象（深拷贝）
+        克隆对象为待插入的字段字典
 
         跳过字段：
         - 主键（id）
@@ -206,33 +205,31 @@ class ShareService:
         """
         from sqlalchemy import inspect
 
-        mapper = inspect(obj)
-        new_obj = obj.__class__()
+        mapper = inspect(obj.__class__)
+        data: dict[str, Any] = {}
 
-        for column in mapper.columns:
+        for attr in mapper.column_attrs:
+            column = attr.columns[0]
             # 跳过主键
             if column.primary_key:
                 continue
 
             # 跳过只读字段
-            if column.name in ["created_time", "updated_time"]:
+            if attr.key in ["created_time", "updated_time"]:
                 continue
 
-            # 获取原值
-            value = getattr(obj, column.name)
-
             # 覆盖特定字段
-            if column.name == "tenant_id":
-                setattr(new_obj, column.name, target_tenant_id)
-            elif column.name == "uuid":
-                setattr(new_obj, column.name, uuid4_str())
-            elif column.name in ["created_id", "updated_id"] and auth.user:
-                setattr(new_obj, column.name, auth.user.id)
+            if attr.key == "tenant_id":
+                data[attr.key] = target_tenant_id
+            elif attr.key == "uuid":
+                data[attr.key] = uuid4_str()
+            elif attr.key in ["created_id", "updated_id"] and auth.user:
+                data[attr.key] = auth.user.id
             else:
                 # 保留其他字段值
-                setattr(new_obj, column.name, value)
+                data[attr.key] = getattr(obj, attr.key)
 
-        return new_obj
+        return data
 
     @staticmethod
     def _get_model_by_table_name(table_name: str) -> type[MappedBase]:
@@ -3,14 +3,14 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path, Request, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
+from redis.asyncio.client import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.base_schema import BatchSetAvailable
-from app.core.dependencies import AuthPermission, db_getter, get_current_user
+from app.core.dependencies import AuthPermission, db_getter, get_current_user, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 from app.utils.common_util import bytes2file_response
@@ -85,6 +85,7 @@ async def user_avatar_upload_controller(file: UploadFile, request: Request) -> J
 async def update_current_user_info_controller(
     data: CurrentUserUpdateSchema,
     auth: Annotated[AuthSchema, Depends(get_current_user)],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     更新当前用户基本信息
@@ -92,11 +93,14 @@ async def update_current_user_info_controller(
     参数:
     - data (CurrentUserUpdateSchema): 当前用户更新模型
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 更新当前用户基本信息JSON响应
     """
-    result_dict = await UserService.update_current_user_info_service(data=data, auth=auth)
+    result_dict = await UserService.update_current_user_info_service(
+        data=data, auth=auth, redis=redis
+    )
     log.info(f"更新当前用户基本信息成功: {result_dict}")
     return SuccessResponse(data=result_dict, msg="更新当前用户基本信息成功")
 
@@ -225,14 +229,23 @@ async def get_obj_list_controller(
     返回:
     - JSONResponse: 分页查询结果JSON响应
     """
-    result_dict_list = await UserService.get_user_list_service(
-        search=search, auth=auth, order_by=page.order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
-        page_no=page.page_no,
-        page_size=page.page_size,
-    )
+    if page.page_mode == "cursor":
+        result_dict = await UserService.get_user_cursor_page_service(
+            auth=auth,
+            cursor=page.cursor,
+            page_size=page.page_size,
+            search=search,
+            order_by=page.order_by,
+            with_total=page.with_total,
+        )
+    else:
+        result_dict = await UserService.get_user_page_service(
+            auth=auth,
+            page_no=page.page_no,
+            page_size=page.page_size,
+            search=search,
+            order_by=page.order_by,
+        )
     log.info("查询用户成功")
     return SuccessResponse(data=result_dict, msg="查询用户成功")
 
@@ -301,6 +314,7 @@ async def update_obj_controller(
     data: UserUpdateSchema,
     id: Annotated[int, Path(description="用户ID")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:user:update"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     修改用户
@@ -309,11 +323,12 @@ async def update_obj_controller(
     - data (UserUpdateSchema): 用户修改模型
     - id (int): 用户ID
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 修改用户JSON响应
     """
-    result_dict = await UserService.update_user_service(id=id, data=data, auth=auth)
+    result_dict = await UserService.update_user_service(id=id, data=data, auth=auth, redis=redis)
     log.info(f"修改用户成功: {result_dict}")
     return SuccessResponse(data=result_dict, msg="修改用户成功")
 
@@ -326,6 +341,7 @@ async def update_obj_controller(
 async def delete_obj_controller(
     ids: Annotated[list[int], Body(description="ID列表")],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:user:delete"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     删除用户
@@ -333,11 +349,12 @@ async def delete_obj_controller(
     参数:
     - ids (list[int]): 用户ID列表
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 删除用户JSON响应
     """
-    await UserService.delete_user_service(ids=ids, auth=auth)
+    await UserService.delete_user_service(ids=ids, auth=auth, redis=redis)
     log.info(f"删除用户成功: {ids}")
     return SuccessResponse(msg="删除用户成功")
 
@@ -350,6 +367,7 @@ async def delete_obj_controller(
 async def batch_set_available_obj_controller(
     data: BatchSetAvailable,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:user:patch"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     批量修改用户状态
@@ -357,11 +375,12 @@ async def batch_set_available_obj_controller(
     参数:
     - data (BatchSetAvailable): 批量修改用户状态模型
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 批量修改用户状态JSON响应
     """
-    await UserService.set_user_available_service(data=data, auth=auth)
+    await UserService.set_user_available_service(data=data, auth=auth, redis=redis)
     log.info(f"批量修改用户状态成功: {data.ids}")
     return SuccessResponse(msg="批量修改用户状态成功")
 
@@ -426,6 +445,7 @@ async def export_obj_list_controller(
 async def import_obj_list_controller(
     file: UploadFile,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:user:import"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     导入用户
@@ -433,12 +453,13 @@ async def import_obj_list_controller(
     参数:
     - file (UploadFile): 用户导入文件
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis数据库连接
 
     返回:
     - JSONResponse: 导入用户JSON响应
     """
     batch_import_result = await UserService.batch_import_user_service(
-        file=file, auth=auth, update_support=True
+        file=file, auth=auth, redis=redis, update_support=True
     )
     log.info(f"导入用户成功: {batch_import_result}")
     return SuccessResponse(data=batch_import_result, msg="导入用户成功")
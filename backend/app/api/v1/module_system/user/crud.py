@@ -2,15 +2,18 @@ from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy import delete
+
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.api.v1.module_system.position.crud import PositionCRUD
 from app.api.v1.module_system.role.crud import RoleCRUD
 from app.core.base_crud import CRUDBase
 
-from .model import UserModel
+from .model import UserModel, UserPositionsModel, UserRolesModel
 from .schema import (
     UserCreateSchema,
     UserForgetPasswordSchema,
+    UserOutSchema,
     UserUpdateSchema,
 )
 
@@ -105,6 +108,69 @@ class UserCRUD(CRUDBase[UserModel, UserCreateSchema, UserUpdateSchema]):
             preload=preload,
         )
 
+    async def page_crud(
+        self,
+        offset: int,
+        limit: int,
+        order_by: list[dict[str, str]] | None = None,
+        search: dict | None = None,
+        preload: list[str | Any] | None = None,
+    ) -> dict:
+        """
+        分页获取用户列表
+
+        参数:
+        - offset (int): 偏移量
+        - limit (int): 每页数量
+        - order_by (list[dict[str, str]] | None): 排序参数列表。
+        - search (dict | None): 查询参数对象。
+        - preload (list[str | Any] | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - dict: 分页数据
+        """
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=order_by or [{"id": "asc"}],
+            search=search or {},
+            out_schema=UserOutSchema,
+            preload=preload,
+        )
+
+    async def cursor_page_crud(
+        self,
+        cursor: str | None,
+        limit: int,
+        order_by: list[dict] | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+        with_total: bool = False,
+    ) -> dict:
+        """
+        游标分页获取用户列表
+
+        参数:
+        - cursor (str | None): 上一页返回的游标，为空时返回第一页
+        - limit (int): 每页数量
+        - order_by (list[dict] | None): 排序参数
+        - search (dict | None): 查询参数
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+        - with_total (bool): 是否统计总数
+
+        返回:
+        - dict: 分页数据
+        """
+        return await self.page_after(
+            cursor=cursor,
+            limit=limit,
+            order_by=order_by,
+            search=search,
+            out_schema=UserOutSchema,
+            preload=preload,
+            with_total=with_total,
+        )
+
     async def update_last_login_crud(self, id: int) -> UserModel | None:
         """
         更新用户最后登录时间
@@ -117,18 +183,41 @@ class UserCRUD(CRUDBase[UserModel, UserCreateSchema, UserUpdateSchema]):
         """
         return await self.update(id=id, data={"last_login": datetime.now()})
 
-    async def set_available_crud(self, ids: list[int], status: str) -> None:
+    async def set_available_crud(
+        self, ids: list[int], status: str, search: dict | None = None
+    ) -> dict:
         """
         批量设置用户可用状态
 
         参数:
         - ids (list[int]): 用户ID列表
         - status (bool): 可用状态
+        - search (dict | None): 附加更新条件
 
         返回:
-        - None:
+        - dict: 已更新的ID(affected_ids)与未更新的ID(denied_ids)
+        """
+        return await self.set(ids=ids, search=search, status=status)
+
+    async def delete_user_crud(self, ids: list[int], search: dict | None = None) -> dict:
+        """
+        批量删除用户及其角色、岗位关联
+
+        参数:
+        - ids (list[int]): 用户ID列表
+        - search (dict | None): 附加删除条件
+
+        返回:
+        - dict: 已删除的ID(affected_ids)与未删除的ID(denied_ids)
         """
-        await self.set(ids=ids, status=status)
+        result = await self.delete(ids=ids, search=search)
+        if result["affected_ids"]:
+            # 外键已设置级联删除，此处显式清理以兼容未开启外键约束的数据库（如SQLite）
+            for model in (UserRolesModel, UserPositionsModel):
+                await self.auth.db.execute(
+                    delete(model).where(model.user_id.in_(result["affected_ids"]))
+                )
+        return result
 
     async def set_user_roles_crud(self, user_ids: list[int], role_ids: list[int]) -> None:
         """
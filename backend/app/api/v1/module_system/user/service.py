@@ -3,7 +3,9 @@ from typing import Any
 
 import pandas as pd
 from fastapi import UploadFile
+from redis.asyncio.client import Redis
 
+from app.api.v1.module_monitor.online.service import OnlineService
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.api.v1.module_system.dept.crud import DeptCRUD
 from app.api.v1.module_system.menu.crud import MenuCRUD
@@ -11,8 +13,10 @@ from app.api.v1.module_system.menu.schema import MenuOutSchema
 from app.api.v1.module_system.position.crud import PositionCRUD
 from app.api.v1.module_system.role.crud import RoleCRUD
 from app.core.base_schema import BatchSetAvailable, UploadResponseSchema
+from app.core.database import after_commit
 from app.core.exceptions import CustomException
 from app.core.logger import log
+from app.core.principal import PrincipalCache
 from app.utils.common_util import traversal_to_tree
 from app.utils.excel_util import ExcelUtil
 from app.utils.hash_bcrpy_util import PwdUtil
@@ -86,6 +90,69 @@ class UserService:
 
         return user_dict_list
 
+    @classmethod
+    async def get_user_page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: UserQueryParam | None = None,
+        order_by: list[dict[str, str]] | None = None,
+    ) -> dict:
+        """
+        分页获取用户列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (UserQueryParam | None): 查询参数对象。
+        - order_by (list[dict[str, str]] | None): 排序参数列表。
+
+        返回:
+        - dict: 分页数据
+        """
+        search_dict = search.__dict__ if search else {}
+        offset = (page_no - 1) * page_size
+        return await UserCRUD(auth).page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search_dict,
+        )
+
+    @classmethod
+    async def get_user_cursor_page_service(
+        cls,
+        auth: AuthSchema,
+        cursor: str | None,
+        page_size: int,
+        search: UserQueryParam | None = None,
+        order_by: list[dict] | None = None,
+        with_total: bool = False,
+    ) -> dict:
+        """
+        游标分页获取用户列表
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - cursor (str | None): 上一页返回的游标，为空时返回第一页
+        - page_size (int): 每页数量
+        - search (UserQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+        - with_total (bool): 是否统计总数
+
+        返回:
+        - dict: 分页数据
+        """
+        return await UserCRUD(auth).cursor_page_crud(
+            cursor=cursor,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+            with_total=with_total,
+        )
+
     @classmethod
     async def create_user_service(cls, data: UserCreateSchema, auth: AuthSchema) -> dict:
         """
@@ -115,7 +182,7 @@ class UserService:
                 raise CustomException(msg="部门不存在")
         # 创建用户
         if data.password:
-            data.password = PwdUtil.set_password_hash(password=data.password)
+            data.password = await PwdUtil.set_password_hash(password=data.password)
         user_dict = data.model_dump(exclude_unset=True, exclude={"role_ids", "position_ids"})
         # 创建用户
         new_user = await UserCRUD(auth).create(data=user_dict)
@@ -132,7 +199,9 @@ class UserService:
         return new_user_dict
 
     @classmethod
-    async def update_user_service(cls, id: int, data: UserUpdateSchema, auth: AuthSchema) -> dict:
+    async def update_user_service(
+        cls, id: int, data: UserUpdateSchema, auth: AuthSchema, redis: Redis
+    ) -> dict:
         """
         更新用户
 
@@ -140,6 +209,7 @@ class UserService:
         - id (int): 用户ID
         - data (UserUpdateSchema): 用户更新信息
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis连接
 
         返回:
         - Dict: 更新后的用户详情字典
@@ -207,17 +277,19 @@ class UserService:
             await UserCRUD(auth).set_user_positions_crud(
                 user_ids=[id], position_ids=data.position_ids
             )
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
 
         user_dict = UserOutSchema.model_validate(new_user).model_dump()
         return user_dict
 
     @classmethod
-    async def delete_user_service(cls, auth: AuthSchema, ids: list[int]) -> None:
+    async def delete_user_service(cls, auth: AuthSchema, redis: Redis, ids: list[int]) -> None:
         """
         删除用户
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis连接
         - ids (list[int]): 用户ID列表
 
         返回:
@@ -225,24 +297,32 @@ class UserService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            user = await UserCRUD(auth).get_by_id_crud(id=id)
-            if not user:
-                raise CustomException(msg="用户不存在")
-            if user.is_superuser:
-                raise CustomException(msg="超级管理员不能删除")
-            if user.status == "0":
-                raise CustomException(msg="用户已启用,不能删除")
-            if auth.user and auth.user.id == id:
-                raise CustomException(msg="不能删除当前登陆用户")
-        # 删除用户角色关联数据
-        await UserCRUD(auth).set_user_roles_crud(user_ids=ids, role_ids=[])
-
-        # 删除用户岗位关联数据
-        await UserCRUD(auth).set_user_positions_crud(user_ids=ids, position_ids=[])
-
-        # 删除用户
-        await UserCRUD(auth).delete(ids=ids)
+        if auth.user and auth.user.id in ids:
+            raise CustomException(msg="不能删除当前登陆用户")
+
+        # 权限与业务条件合并到一条删除语句中，仅删除非超管且已停用的用户
+        result = await UserCRUD(auth).delete_user_crud(
+            ids=ids, search={"is_superuser": False, "status": ("!=", "0")}
+        )
+        if result["denied_ids"]:
+            # 存在未删除的用户时查询原因并抛出异常，事务回滚
+            denied = {
+                user.id: user
+                for user in await UserCRUD(auth).get_list_crud(
+                    search={"id": ("in", result["denied_ids"])}, preload=[]
+                )
+            }
+            for id in result["denied_ids"]:
+                user = denied.get(id)
+                if not user:
+                    raise CustomException(msg="用户不存在")
+                if user.is_superuser:
+                    raise CustomException(msg="超级管理员不能删除")
+                if user.status == "0":
+                    raise CustomException(msg="用户已启用,不能删除")
+            raise CustomException(msg="删除失败，用户不存在或无权限")
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
+        await OnlineService.delete_user_online_service(redis=redis, user_ids=ids)
 
     @classmethod
     async def get_current_user_info_service(cls, auth: AuthSchema) -> dict:
@@ -274,10 +354,10 @@ class UserService:
             menus = [MenuOutSchema.model_validate(menu).model_dump() for menu in menu_all]
 
         else:
-            # 收集用户所有角色的菜单ID，使用列表推导式优化代码
+            # 收集用户所有角色的菜单ID（auth.user 为权限快照，不含菜单关联，需使用重新加载的用户）
             menu_ids = {
                 menu.id
-                for role in auth.user.roles or []
+                for role in (user.roles if user else [])
                 for menu in role.menus
                 if menu.status == "0" and menu.type in [1, 2, 4]
             }
@@ -299,13 +379,14 @@ class UserService:
 
     @classmethod
     async def update_current_user_info_service(
-        cls, auth: AuthSchema, data: CurrentUserUpdateSchema
+        cls, auth: AuthSchema, redis: Redis, data: CurrentUserUpdateSchema
     ) -> dict:
         """
         更新当前用户信息
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis连接
         - data (CurrentUserUpdateSchema): 当前用户更新信息
 
         返回:
@@ -330,27 +411,45 @@ class UserService:
                 raise CustomException(msg="更新失败，邮箱已存在")
         user_update_data = UserUpdateSchema(**data.model_dump())
         new_user = await UserCRUD(auth).update(id=auth.user.id, data=user_update_data)
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
         return UserOutSchema.model_validate(new_user).model_dump()
 
     @classmethod
-    async def set_user_available_service(cls, auth: AuthSchema, data: BatchSetAvailable) -> None:
+    async def set_user_available_service(
+        cls, auth: AuthSchema, redis: Redis, data: BatchSetAvailable
+    ) -> None:
         """
         设置用户状态
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis连接
         - data (BatchSetAvailable): 批量设置用户状态数据
 
         返回:
         - None
         """
-        for id in data.ids:
-            user = await UserCRUD(auth).get_by_id_crud(id=id)
-            if not user:
-                raise CustomException(msg=f"用户ID {id} 不存在")
-            if user.is_superuser:
-                raise CustomException(msg="超级管理员状态不能修改")
-        await UserCRUD(auth).set_available_crud(ids=data.ids, status=data.status)
+        # 权限与业务条件合并到一条更新语句中，超级管理员不参与更新
+        result = await UserCRUD(auth).set_available_crud(
+            ids=data.ids, status=data.status, search={"is_superuser": False}
+        )
+        if result["denied_ids"]:
+            # 存在未更新的用户时查询原因并抛出异常，事务回滚
+            denied = {
+                user.id: user
+                for user in await UserCRUD(auth).get_list_crud(
+                    search={"id": ("in", result["denied_ids"])}, preload=[]
+                )
+            }
+            for id in result["denied_ids"]:
+                user = denied.get(id)
+                if user and user.is_superuser:
+                    raise CustomException(msg="超级管理员状态不能修改")
+            raise CustomException(msg=f"用户ID {result['denied_ids'][0]} 不存在")
+        after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
+        # 停用用户时强制下线其全部会话
+        if data.status == "1":
+            await OnlineService.delete_user_online_service(redis=redis, user_ids=data.ids)
 
     @classmethod
     async def upload_avatar_service(cls, base_url: str, file: UploadFile) -> dict:
@@ -396,13 +495,13 @@ class UserService:
         user = await UserCRUD(auth).get_by_id_crud(id=auth.user.id)
         if not user:
             raise CustomException(msg="用户不存在")
-        if not PwdUtil.verify_password(
+        if not await PwdUtil.verify_password(
             plain_password=data.old_password, password_hash=user.password
         ):
             raise CustomException(msg="原密码输入错误")
 
         # 更新密码
-        new_password_hash = PwdUtil.set_password_hash(password=data.new_password)
+        new_password_hash = await PwdUtil.set_password_hash(password=data.new_password)
         new_user = await UserCRUD(auth).change_password_crud(
             id=user.id, password_hash=new_password_hash
         )
@@ -433,7 +532,7 @@ class UserService:
             raise CustomException(msg="超级管理员密码不能重置")
 
         # 更新密码
-        new_password_hash = PwdUtil.set_password_hash(password=data.password)
+        new_password_hash = await PwdUtil.set_password_hash(password=data.password)
         new_user = await UserCRUD(auth).change_password_crud(
             id=data.id, password_hash=new_password_hash
         )
@@ -456,7 +555,7 @@ class UserService:
         if username_ok:
             raise CustomException(msg="账号已存在")
 
-        data.password = PwdUtil.set_password_hash(password=data.password)
+        data.password = await PwdUtil.set_password_hash(password=data.password)
         data.name = data.username
         create_dict = data.model_dump(exclude_unset=True, exclude={"role_ids", "position_ids"})
 
@@ -493,7 +592,7 @@ class UserService:
         if user.is_superuser:
             raise CustomException(msg="超级管理员密码不能重置")
 
-        new_password_hash = PwdUtil.set_password_hash(password=data.new_password)
+        new_password_hash = await PwdUtil.set_password_hash(password=data.new_password)
         new_user = await UserCRUD(auth).forget_password_crud(
             id=user.id, password_hash=new_password_hash
         )
@@ -501,13 +600,14 @@ class UserService:
 
     @classmethod
     async def batch_import_user_service(
-        cls, auth: AuthSchema, file: UploadFile, update_support: bool = False
+        cls, auth: AuthSchema, redis: Redis, file: UploadFile, update_support: bool = False
     ) -> str:
         """
         批量导入用户
 
         参数:
         - auth (AuthSchema): 认证信息模型
+        - redis (Redis): Redis连接
         - file (UploadFile): 上传的Excel文件
         - update_support (bool, optional): 是否支持更新已存在用户. 默认值为False.
 
@@ -557,14 +657,16 @@ class UserService:
 
             error_msgs = []
             success_count = 0
-            count = 0
 
-            # 处理每一行数据
-            for _index, row in df.iterrows():
+            # 默认密码只需计算一次哈希，bcrypt 逐行计算是导入的主要耗时
+            default_password = await PwdUtil.set_password_hash(password="123456")
+
+            # 构建全部用户数据，文件内重复的用户名仅保留首次出现的行
+            user_rows: dict[str, tuple[int, dict]] = {}
+            for count, (_index, row) in enumerate(df.iterrows(), start=1):
                 try:
-                    count = count + 1
                     # 数据转换
-                    gender = 1 if row["gender"] == "男" else (2 if row["gender"] == "女" else 1)
+                    gender = "2" if row["gender"] == "女" else "1"
                     status = "0" if row["status"] == "正常" else "1"
 
                     # 构建用户数据
@@ -576,32 +678,66 @@ class UserService:
                         "gender": gender,
                         "status": status,
                         "dept_id": int(row["dept_id"]),
-                        "password": PwdUtil.set_password_hash(password="123456"),  # 设置默认密码
+                        "password": default_password,  # 设置默认密码
                     }
-
-                    # 处理用户导入
-                    exists_user = await UserCRUD(auth).get_by_username_crud(
-                        username=user_data["username"]
-                    )
-                    if exists_user:
-                        # 检查是否是超级管理员
-                        if exists_user.is_superuser:
-                            error_msgs.append(f"第{count}行: 超级管理员不允许修改")
-                            continue
-                        if update_support:
-                            user_update_data = UserUpdateSchema(**user_data)
-                            await UserCRUD(auth).update(id=exists_user.id, data=user_update_data)
-                            success_count += 1
-                        else:
-                            error_msgs.append(f"第{count}行: 用户 {user_data['username']} 已存在")
-                    else:
-                        user_create_data = UserCreateSchema(**user_data)
-                        await UserCRUD(auth).create(data=user_create_data)
-                        success_count += 1
-
                 except Exception as e:
                     error_msgs.append(f"第{count}行: 异常{e!s}")
                     continue
+                if user_data["username"] in user_rows:
+                    error_msgs.append(f"第{count}行: 用户 {user_data['username']} 在文件中重复")
+                    continue
+                user_rows[user_data["username"]] = (count, user_data)
+
+            # 一次查询取出已存在的用户，替代逐行按用户名查询
+            exists_users = {}
+            if user_rows:
+                exists_objs = await UserCRUD(auth).get_list_crud(
+                    search={"username": ("in", list(user_rows.keys()))}, preload=[]
+                )
+                exists_users = {user.username: user for user in exists_objs}
+
+            create_rows: list[tuple[int, UserCreateSchema]] = []
+            for username, (count, user_data) in user_rows.items():
+                exists_user = exists_users.get(username)
+                if not exists_user:
+                    try:
+                        create_rows.append((count, UserCreateSchema(**user_data)))
+                    except Exception as e:
+                        error_msgs.append(f"第{count}行: 异常{e!s}")
+                    continue
+                # 检查是否是超级管理员
+                if exists_user.is_superuser:
+                    error_msgs.append(f"第{count}行: 超级管理员不允许修改")
+                    continue
+                if not update_support:
+                    error_msgs.append(f"第{count}行: 用户 {username} 已存在")
+                    continue
+                # 更新仍逐条执行，保留数据权限的二次校验
+                try:
+                    user_update_data = UserUpdateSchema(**user_data)
+                    await UserCRUD(auth).update(id=exists_user.id, data=user_update_data)
+                    success_count += 1
+                except Exception as e:
+                    error_msgs.append(f"第{count}行: 异常{e!s}")
+
+            # 新用户批量写入；整批失败（如手机号、邮箱冲突）时逐行重试以定位错误行
+            if create_rows:
+                try:
+                    async with auth.db.begin_nested():
+                        await UserCRUD(auth).create_many(rows=[data for _, data in create_rows])
+                    success_count += len(create_rows)
+                except Exception:
+                    for count, user_create_data in create_rows:
+                        try:
+                            async with auth.db.begin_nested():
+                                await UserCRUD(auth).create_many(rows=[user_create_data])
+                            success_count += 1
+                        except Exception as e:
+                            error_msgs.append(f"第{count}行: 异常{e!s}")
+
+            # 更新了已存在用户时刷新权限快照
+            if update_support:
+                after_commit(auth.db, lambda: PrincipalCache.invalidate(redis))
 
             # 返回详细的导入结果
             result = f"成功导入 {success_count} 条数据"
@@ -44,7 +44,18 @@ class RedisInitKeyConfig(Enum):
     REFRESH_TOKEN = {"key": "refresh_token", "remark": "刷新令牌信息"}
     CAPTCHA_CODES = {"key": "captcha_codes", "remark": "图片验证码"}
     SYSTEM_CONFIG = {"key": "system_config", "remark": "系统配置"}
+    SYSTEM_CONFIG_CHANNEL = {"key": "system_config_channel", "remark": "系统配置变更通知频道"}
     SYSTEM_DICT = {"key": "system_dict", "remark": "数据字典"}
+    PRINCIPAL = {"key": "principal", "remark": "登录用户权限快照"}
+    PRINCIPAL_VERSION = {"key": "principal_version", "remark": "登录用户权限快照版本号"}
+    DATA_SCOPE_VERSION = {"key": "data_scope_version", "remark": "数据权限范围版本号"}
+    ONLINE_SESSION = {"key": "online_session", "remark": "在线会话信息"}
+    ONLINE_LOGIN_INDEX = {"key": "online_login_index", "remark": "在线会话登录时间索引"}
+    ONLINE_EXPIRE_INDEX = {"key": "online_expire_index", "remark": "在线会话过期时间索引"}
+    ONLINE_USER_INDEX = {"key": "online_user", "remark": "用户在线会话索引"}
+    ONLINE_NAME_INDEX = {"key": "online_name_index", "remark": "在线会话登录名称前缀索引"}
+    ONLINE_IPADDR_INDEX = {"key": "online_ipaddr_index", "remark": "在线会话IP地址前缀索引"}
+    LOG_ARCHIVE_STORAGE = {"key": "log_archive_storage", "remark": "日志归档目录标识"}
     APSCHEDULER_LOCK_KEY = {
         "key": "scheduler_job_lock",
         "remark": "定时任务初始化锁",
@@ -70,6 +70,18 @@ class Settings(BaseSettings):
     TOKEN_TYPE: str = "bearer"  # token类型
     TOKEN_REQUEST_PATH_EXCLUDE: list[str] = ["api/v1/auth/login"]  # JWT / RBAC 路由白名单
     TOKEN_SLIDING_EXPIRE: bool = True  # 是否启用滑动过期(用户操作时自动续期)
+    TOKEN_SLIDING_RENEW_RATIO: float = 1.0  # 剩余有效期低于该比例时才续期，1.0 表示每次请求都续期
+    TOKEN_CACHE_MAXSIZE: int = 4096  # 已校验令牌进程内缓存最大条目数，0 表示不缓存
+    DATA_SCOPE_CACHE_SECONDS: int = 60  # 数据权限范围跨请求缓存时间(秒)，按 Redis 版本号失效，0 表示仅在单次请求内缓存
+    DATA_SCOPE_CACHE_MAXSIZE: int = 1024  # 数据权限范围跨请求缓存最大条目数
+    PRINCIPAL_CACHE_SECONDS: int = 300  # 登录用户权限快照缓存时间(秒)，0 表示不缓存
+    PRINCIPAL_CACHE_MAXSIZE: int = 1024  # 登录用户权限快照进程内缓存最大条目数
+    ONLINE_SEARCH_MAX_RESULTS: int = (
+        1000  # 在线用户搜索最多命中的会话数，仅按登录所属地搜索时只扫描最近登录的这些会话
+    )
+    PASSWORD_HASH_ROUNDS: int = 12  # bcrypt 加密轮数，调整后用户下次登录时自动重新加密
+    PASSWORD_HASH_WORKERS: int = 4  # 密码加密/校验线程池大小(并发上限)
+    PASSWORD_HASH_QUEUE_MAX: int = 256  # 密码计算最大排队数，超出后拒绝请求，0 表示不限制
 
     # ================================================= #
     # ******************** 数据库配置 ******************* #
@@ -105,6 +117,9 @@ class Settings(BaseSettings):
     REDIS_DB_NAME: int = 1
     REDIS_USER: str = ""
     REDIS_PASSWORD: str = ""
+    REDIS_SCAN_COUNT: int = 1000  # 按模式遍历键时每次 SCAN 的 COUNT 提示
+    REDIS_DELETE_BATCH_SIZE: int = 500  # 按模式删除键时每批 UNLINK 的键数
+    SYSTEM_CONFIG_CACHE_SECONDS: int = 60  # 系统配置进程内快照有效期(秒)，变更时经发布订阅即时失效
 
     # ================================================= #
     # ******************** 验证码配置 ******************* #
@@ -113,6 +128,16 @@ class Settings(BaseSettings):
     CAPTCHA_EXPIRE_SECONDS: int = 60 * 1  # 验证码过期时间(秒) 1分钟
     CAPTCHA_FONT_SIZE: int = 40  # 字体大小
     CAPTCHA_FONT_PATH: str = "static/assets/font/Arial.ttf"  # 字体路径
+    CAPTCHA_POOL_SIZE: int = 64  # 预渲染验证码池容量(每个进程)，0 表示每次请求实时生成
+
+    # ================================================= #
+    # ****************** IP归属地配置 ****************** #
+    # ================================================= #
+    IP_LOCATION_DB_PATH: str = "static/assets/ipdb/ip_location.dat"  # 离线IP库路径
+    IP_LOCATION_CACHE_MAXSIZE: int = 4096  # IP归属地LRU缓存容量(每个进程)
+    IP_LOCATION_REMOTE_ENABLE: bool = True  # 离线库未命中时是否在后台调用在线接口补全
+    IP_LOCATION_REMOTE_TIMEOUT: float = 3.0  # 在线接口超时时间(秒)
+    IP_LOCATION_REMOTE_RETRY_SECONDS: int = 60  # 在线查询失败后同一IP的重试间隔(秒)，失败结果不缓存
 
     # ================================================= #
     # ********************* 日志配置 ******************* #
@@ -127,6 +152,31 @@ class Settings(BaseSettings):
         "HEAD",
         "OPTIONS",
     ]  # 需要记录的请求方法
+    OPERATION_LOG_QUEUE_SIZE: int = 10000  # 操作日志写入队列容量(每个进程)
+    OPERATION_LOG_BATCH_SIZE: int = 200  # 操作日志每批最多写入条数
+    OPERATION_LOG_FLUSH_MS: int = 500  # 操作日志攒批最长等待时间(毫秒)
+    OPERATION_LOG_OVERFLOW: Literal["drop", "sample", "block"] = "drop"  # 队列满时的处理策略
+    OPERATION_LOG_SAMPLE_RATE: float = 0.1  # sample 策略下队列过半后的保留比例
+    OPERATION_LOG_CAPTURE: dict[str, Any] = {
+        "request_max_bytes": 2000,  # 请求内容最多记录的字节数
+        "response_max_bytes": 2000,  # 响应内容最多记录的字节数
+        "skip_binary": True,  # 非文本内容只记录类型和大小
+        "sample_rate": 1.0,  # 记录请求/响应内容的采样比例
+        "hash_only": False,  # 只记录内容的 sha256 摘要
+    }  # 操作日志内容记录默认策略
+    # 按 路由函数名 / 路由路径 / 请求方法 覆盖默认策略，如 {"/system/user/export": {"skip_binary": True}, "DELETE": {"hash_only": True}}
+    OPERATION_LOG_CAPTURE_RULES: dict[str, dict[str, Any]] = {}
+    USER_AGENT_CACHE_MAXSIZE: int = 1024  # User-Agent 解析结果LRU缓存容量(每个进程)
+
+    # ================================================= #
+    # ******************* 日志归档配置 ******************* #
+    # ================================================= #
+    LOG_ARCHIVE_ENABLE: bool = True  # 是否定时归档操作日志与任务日志
+    LOG_RETENTION_DAYS: int = 180  # 日志表保留天数，更早的记录移入归档文件
+    # 归档文件目录(相对项目根目录，不要放在静态资源目录下)。多实例部署时必须是各实例共享的存储(如NFS挂载)，启动时校验
+    LOG_ARCHIVE_DIR: str = "archive"
+    LOG_ARCHIVE_BATCH_SIZE: int = 5000  # 每批归档并删除的记录数
+    LOG_ARCHIVE_CRON: str = "0 30 3 * * ?"  # 归档任务执行时间(秒 分 时 日 月 周)
 
     # ================================================= #
     # ******************* Gzip压缩配置 ******************* #
@@ -189,6 +239,7 @@ class Settings(BaseSettings):
         # 中间件列表
         MIDDLEWARES: list[str | None] = [
             "app.core.middlewares.CustomCORSMiddleware" if self.CORS_ORIGIN_ENABLE else None,
+            "app.core.middlewares.AuthContextMiddleware",
             "app.core.middlewares.RequestLogMiddleware" if self.OPERATION_LOG_RECORD else None,
             "app.core.middlewares.CustomGZipMiddleware" if self.GZIP_ENABLE else None,
         ]
@@ -1,17 +1,36 @@
+import base64
 import builtins
+import json
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, get_args
 
 from pydantic import BaseModel
-from sqlalchemy import Select, asc, delete, desc, func, select, update
+from sqlalchemy import (
+    Select,
+    and_,
+    asc,
+    delete,
+    desc,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy import inspect as sa_inspect
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql.elements import ColumnElement
 
 from app.api.v1.module_system.auth.schema import AuthSchema
+from app.config.setting import settings
 from app.core.base_model import MappedBase
 from app.core.exceptions import CustomException
 from app.core.permission import Permission
+from app.utils.common_util import uuid4_str
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Result
@@ -147,6 +166,111 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except Exception as e:
             raise CustomException(msg=f"树形列表查询失败: {e!s}")
 
+    async def tree_children_ids(self, ids: Sequence[int]) -> builtins.list[int]:
+        """
+        获取节点及其全部子孙节点ID（基于 tree_path 前缀匹配，不做递归，不过滤数据权限）
+
+        参数:
+        - ids (Sequence[int]): 节点ID列表
+
+        返回:
+        - List[int]: 节点及子孙节点ID，不存在的节点会被忽略
+        """
+        paths = await self.__tree_paths(ids)
+        if not paths:
+            return []
+        sql = select(self.model.id).where(
+            or_(
+                self.model.id.in_(list(paths)),
+                *[self.model.tree_path.like(f"{path}{id}/%") for id, path in paths.items()],
+            )
+        )
+        result: Result = await self.auth.db.execute(sql)
+        return builtins.list(result.scalars().all())
+
+    async def tree_parent_ids(self, ids: Sequence[int]) -> builtins.list[int]:
+        """
+        获取节点及其全部祖先节点ID（解析 tree_path，不做递归，不过滤数据权限）
+
+        参数:
+        - ids (Sequence[int]): 节点ID列表
+
+        返回:
+        - List[int]: 节点及祖先节点ID，不存在的节点会被忽略
+        """
+        paths = await self.__tree_paths(ids)
+        parent_ids = set(paths)
+        for path in paths.values():
+            parent_ids.update(int(item) for item in path.split("/") if item)
+        return builtins.list(parent_ids)
+
+    async def rebuild_tree_path(self) -> int:
+        """
+        根据 parent_id 全量重建 tree_path（用于历史数据回填或数据修复）
+
+        父节点不存在或存在环的节点按根节点处理。
+
+        返回:
+        - int: 路径发生变化的节点数
+        """
+        result: Result = await self.auth.db.execute(
+            select(self.model.id, self.model.parent_id, self.model.tree_path)
+        )
+        rows = result.all()
+        children: dict[int | None, builtins.list[int]] = {}
+        node_ids = {row.id for row in rows}
+        for row in rows:
+            parent_id = row.parent_id if row.parent_id in node_ids else None
+            children.setdefault(parent_id, []).append(row.id)
+
+        paths: dict[int, str] = {}
+        stack = [(id, "/") for id in children.get(None, [])]
+        while stack:
+            id, path = stack.pop()
+            paths[id] = path
+            stack.extend((child, f"{path}{id}/") for child in children.get(id, []))
+
+        changed = [
+            {"id": row.id, "tree_path": paths.get(row.id, "/")}
+            for row in rows
+            if paths.get(row.id, "/") != row.tree_path
+        ]
+        if changed:
+            await self.auth.db.execute(update(self.model), changed)
+        return len(changed)
+
+    async def list_lean(
+        self,
+        fields: Sequence[str] | type[BaseModel],
+        search: dict | None = None,
+        order_by: builtins.list[dict[str, str]] | None = None,
+    ) -> builtins.list[dict]:
+        """
+        投影查询对象列表，仅查询指定列并直接返回字典
+
+        参数:
+        - fields (Union[Sequence[str], Type[BaseModel]]): 字段列表或输出模型；
+          "关系.字段" 形式的多对一关系字段通过 LEFT JOIN 查询，并组装为嵌套字典
+        - search (Optional[Dict]): 查询条件
+        - order_by (Optional[List[Dict[str, str]]]): 排序字段
+
+        返回:
+        - List[Dict]: 字典列表
+
+        异常:
+        - CustomException: 查询失败时抛出异常
+        """
+        try:
+            conditions = await self.__build_conditions(**search) if search else []
+            order = order_by or [{"id": "asc"}]
+            sql = self.__select(out_schema=fields, lean=True)
+            sql = sql.where(*conditions).order_by(*self.__order_by(order))
+            sql = await self.__filter_permissions(sql)
+            result: Result = await self.auth.db.execute(sql)
+            return [self.__lean_row(row) for row in result.all()]
+        except Exception as e:
+            raise CustomException(msg=f"列表查询失败: {e!s}")
+
     async def page(
         self,
         offset: int,
@@ -155,6 +279,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         search: dict,
         out_schema: type[OutSchemaType],
         preload: builtins.list[str | Any] | None = None,
+        lean: bool = False,
     ) -> dict:
         """
         获取分页数据
@@ -166,6 +291,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         - search (Dict): 查询条件
         - out_schema (Type[OutSchemaType]): 输出数据模型
         - preload (Optional[List[Union[str, Any]]]): 预加载关系
+        - lean (bool): 投影模式，仅查询 out_schema 所需的列并直接返回字典，不构建ORM对象
 
         返回:
         - Dict: 分页数据
@@ -176,42 +302,111 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         try:
             conditions = await self.__build_conditions(**search) if search else []
             order = order_by or [{"id": "asc"}]
-            sql = select(self.model).where(*conditions).order_by(*self.__order_by(order))
-            # 应用预加载选项
-            for opt in self.__loader_options(preload):
-                sql = sql.options(opt)
+            sql = self.__select(out_schema=out_schema, preload=preload, lean=lean)
+            sql = sql.where(*conditions).order_by(*self.__order_by(order))
             sql = await self.__filter_permissions(sql)
 
-            # 优化count查询：使用主键计数而非全表扫描
-            mapper = sa_inspect(self.model)
-            pk_cols = list(getattr(mapper, "primary_key", []))
-            if pk_cols:
-                # 使用主键的第一列进行计数（主键必定非NULL，性能更好）
-                count_sql = select(func.count(pk_cols[0])).select_from(self.model)
-            else:
-                # 降级方案：使用count(*)
-                count_sql = select(func.count()).select_from(self.model)
-
-            if conditions:
-                count_sql = count_sql.where(*conditions)
-            count_sql = await self.__filter_permissions(count_sql)
-
-            total_result = await self.auth.db.execute(count_sql)
-            total = total_result.scalar() or 0
+            total = await self.__count(conditions)
 
             result: Result = await self.auth.db.execute(sql.offset(offset).limit(limit))
-            objs = result.scalars().all()
+            if lean:
+                items = [self.__lean_row(row) for row in result.all()]
+            else:
+                items = [out_schema.model_validate(obj).model_dump() for obj in result.scalars()]
 
             return {
                 "page_no": offset // limit + 1 if limit else 1,
                 "page_size": limit or 10,
                 "total": total,
                 "has_next": offset + limit < total,
-                "items": [out_schema.model_validate(obj).model_dump() for obj in objs],
+                "items": items,
             }
         except Exception as e:
             raise CustomException(msg=f"分页查询失败: {e!s}")
 
+    async def page_after(
+        self,
+        cursor: str | None,
+        limit: int,
+        order_by: builtins.list[dict[str, str]] | None,
+        search: dict | None,
+        out_schema: type[OutSchemaType],
+        preload: builtins.list[str | Any] | None = None,
+        with_total: bool = False,
+        lean: bool = False,
+    ) -> dict:
+        """
+        获取游标(keyset)分页数据
+
+        以排序字段加主键 id 作为定位条件，直接从上一页最后一行之后开始读取，
+        翻页深度不影响查询代价。
+
+        参数:
+        - cursor (Optional[str]): 上一页返回的 next_cursor，为空时返回第一页
+        - limit (int): 每页数量
+        - order_by (Optional[List[Dict[str, str]]]): 排序字段
+        - search (Optional[Dict]): 查询条件
+        - out_schema (Type[OutSchemaType]): 输出数据模型
+        - preload (Optional[List[Union[str, Any]]]): 预加载关系
+        - with_total (bool): 是否统计总数，默认不统计
+        - lean (bool): 投影模式，仅查询 out_schema 所需的列并直接返回字典，不构建ORM对象
+
+        返回:
+        - Dict: 分页数据，包含下一页游标 next_cursor
+
+        异常:
+        - CustomException: 查询失败或游标无效时抛出异常
+        """
+        try:
+            conditions = await self.__build_conditions(**search) if search else []
+            keys = self.__keyset_keys(order_by or [{"id": "asc"}])
+            # 投影模式下额外查询排序键用于生成游标
+            key_columns = [getattr(self.model, field).label(f"__key_{field}") for field, _ in keys]
+            sql = self.__select(
+                out_schema=out_schema,
+                preload=preload,
+                lean=lean,
+                extra_columns=key_columns,
+            )
+            sql = sql.where(*conditions)
+            if cursor:
+                values = self.__decode_cursor(cursor)
+                if len(values) != len(keys):
+                    raise CustomException(msg="游标与排序字段不匹配")
+                sql = sql.where(self.__keyset_condition(keys, values))
+            sql = sql.order_by(*self.__keyset_order_by(keys))
+            sql = await self.__filter_permissions(sql)
+
+            # 多取一行用于判断是否存在下一页
+            result: Result = await self.auth.db.execute(sql.limit(limit + 1))
+            objs = result.all() if lean else result.scalars().all()
+            has_next = len(objs) > limit
+            objs = objs[:limit]
+
+            next_cursor = None
+            if has_next and objs:
+                if lean:
+                    last = objs[-1]._mapping
+                    values = [last[f"__key_{field}"] for field, _ in keys]
+                else:
+                    values = [getattr(objs[-1], field) for field, _ in keys]
+                next_cursor = self.__encode_cursor(values)
+
+            if lean:
+                items = [self.__lean_row(row) for row in objs]
+            else:
+                items = [out_schema.model_validate(obj).model_dump() for obj in objs]
+
+            return {
+                "page_size": limit,
+                "total": await self.__count(conditions) if with_total else None,
+                "has_next": has_next,
+                "next_cursor": next_cursor,
+                "items": items,
+            }
+        except Exception as e:
+            raise CustomException(msg=f"游标分页查询失败: {e!s}")
+
     async def create(self, data: CreateSchemaType | dict) -> ModelType:
         """
         创建新对象
@@ -227,6 +422,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         try:
             obj_dict = data if isinstance(data, dict) else data.model_dump()
+            if hasattr(self.model, "tree_path"):
+                parent_id = obj_dict.get("parent_id")
+                tree_paths = await self.__child_tree_paths([parent_id])
+                obj_dict = {**obj_dict, "tree_path": tree_paths.get(parent_id, "/")}
             obj = self.model(**obj_dict)
 
             # 设置字段值（只检查一次current_user）
@@ -235,6 +434,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                     setattr(obj, "created_id", self.auth.user.id)
                 if hasattr(obj, "updated_id"):
                     setattr(obj, "updated_id", self.auth.user.id)
+                if hasattr(obj, "created_dept_id"):
+                    setattr(obj, "created_dept_id", self.auth.user.dept_id)
 
             self.auth.db.add(obj)
             await self.auth.db.flush()
@@ -243,6 +444,164 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except Exception as e:
             raise CustomException(msg=f"创建失败: {e!s}")
 
+    async def create_many(
+        self,
+        rows: Sequence[CreateSchemaType | dict],
+        returning: builtins.list[str] | None = None,
+        batch_size: int = 1000,
+    ) -> builtins.list[dict]:
+        """
+        批量创建对象（单条多值 INSERT，按批次提交，不逐条 flush/refresh）
+
+        参数:
+        - rows (Sequence[Union[CreateSchemaType, Dict]]): 待创建的数据
+        - returning (Optional[List[str]]): 需要回传的字段，按输入顺序返回；为空时不回传
+        - batch_size (int): 每批写入的行数
+
+        返回:
+        - List[Dict]: returning 指定字段组成的字典列表，未指定 returning 时为空列表
+
+        异常:
+        - CustomException: 创建失败时抛出异常
+        """
+        if not rows:
+            return []
+        try:
+            values = self.__prepare_rows(rows)
+            columns = sa_inspect(self.model).columns
+            if "tree_path" in columns:
+                tree_paths = await self.__child_tree_paths([row.get("parent_id") for row in values])
+                for row in values:
+                    row["tree_path"] = tree_paths.get(row.get("parent_id"), "/")
+            dialect = self.auth.db.get_bind().dialect
+            # MySQL 不支持 executemany RETURNING，预先生成 uuid 以便回查
+            fetch_by_uuid = bool(returning) and not (
+                dialect.insert_executemany_returning_sort_by_parameter_order
+            )
+            if fetch_by_uuid:
+                if "uuid" not in columns:
+                    raise CustomException(msg="当前数据库不支持批量回传，且模型缺少uuid字段")
+                for row in values:
+                    row.setdefault("uuid", uuid4_str())
+
+            result_rows: builtins.list[dict] = []
+            for batch in self.__split_rows(values, batch_size):
+                sql = insert(self.model)
+                if returning and not fetch_by_uuid:
+                    sql = sql.returning(
+                        *[getattr(self.model, field) for field in returning],
+                        sort_by_parameter_order=True,
+                    )
+                    result: Result = await self.auth.db.execute(sql, batch)
+                    result_rows.extend(dict(row._mapping) for row in result.all())
+                else:
+                    await self.auth.db.execute(sql, batch)
+
+            if fetch_by_uuid and returning:
+                uuids = [row["uuid"] for row in values]
+                fields = [
+                    getattr(self.model, field) for field in dict.fromkeys(["uuid", *returning])
+                ]
+                found: dict[str, dict] = {}
+                for start in range(0, len(uuids), batch_size):
+                    sql = select(*fields).where(
+                        self.model.uuid.in_(uuids[start : start + batch_size])
+                    )
+                    result = await self.auth.db.execute(sql)
+                    found.update({row.uuid: dict(row._mapping) for row in result.all()})
+                result_rows = [{field: found[uuid][field] for field in returning} for uuid in uuids]
+            return result_rows
+        except CustomException:
+            raise
+        except Exception as e:
+            raise CustomException(msg=f"批量创建失败: {e!s}")
+
+    async def upsert_many(
+        self,
+        rows: Sequence[CreateSchemaType | dict],
+        conflict_cols: builtins.list[str],
+        update_cols: builtins.list[str] | None = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        批量插入或更新对象（INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE）
+
+        参数:
+        - rows (Sequence[Union[CreateSchemaType, Dict]]): 待写入的数据
+        - conflict_cols (List[str]): 判定冲突的唯一字段（MySQL 由唯一索引自动判定）
+        - update_cols (Optional[List[str]]): 冲突时需要更新的字段，默认更新除冲突字段、主键及创建信息外的全部字段
+        - batch_size (int): 每批写入的行数
+
+        返回:
+        - int: 受影响的行数（由驱动返回，MySQL 中更新行按 2 计）
+
+        异常:
+        - CustomException: 写入失败时抛出异常
+        """
+        if not rows:
+            return 0
+        try:
+            values = self.__prepare_rows(rows)
+            dialect_name = self.auth.db.get_bind().dialect.name
+            if dialect_name == "mysql":
+                from sqlalchemy.dialects.mysql import insert as dialect_insert
+            elif dialect_name == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            elif dialect_name == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                raise CustomException(msg=f"数据库不支持批量更新插入: {dialect_name}")
+
+            affected = 0
+            for batch in self.__split_rows(values, batch_size):
+                keys = list(batch[0].keys())
+                if update_cols is None:
+                    excluded = {
+                        *conflict_cols,
+                        "id",
+                        "uuid",
+                        "created_id",
+                        "created_dept_id",
+                        "created_time",
+                    }
+                    cols = [key for key in keys if key not in excluded]
+                    if (
+                        "updated_time" in sa_inspect(self.model).columns
+                        and "updated_time" not in cols
+                    ):
+                        cols.append("updated_time")
+                else:
+                    cols = update_cols
+
+                # 单条语句的绑定参数数量受数据库限制，按列数收缩每条语句的行数
+                per_stmt = max(1, min(batch_size, 30000 // len(sa_inspect(self.model).columns)))
+                for start in range(0, len(batch), per_stmt):
+                    sql = dialect_insert(self.model).values(batch[start : start + per_stmt])
+                    if dialect_name == "mysql":
+                        sql = sql.on_duplicate_key_update(
+                            {col: sql.inserted[col] if col in keys else func.now() for col in cols}
+                            if cols
+                            else {conflict_cols[0]: sql.inserted[conflict_cols[0]]}
+                        )
+                    elif cols:
+                        sql = sql.on_conflict_do_update(
+                            index_elements=conflict_cols,
+                            set_={
+                                col: sql.excluded[col] if col in keys else func.now()
+                                for col in cols
+                            },
+                        )
+                    else:
+                        sql = sql.on_conflict_do_nothing(index_elements=conflict_cols)
+                    result = await self.auth.db.execute(sql)
+                    affected += max(result.rowcount or 0, 0)
+            await self.auth.db.flush()
+            return affected
+        except CustomException:
+            raise
+        except Exception as e:
+            raise CustomException(msg=f"批量更新插入失败: {e!s}")
+
     async def update(self, id: int, data: UpdateSchemaType | dict) -> ModelType:
         """
         更新对象
@@ -263,41 +622,76 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 if isinstance(data, dict)
                 else data.model_dump(exclude_unset=True, exclude={"id"})
             )
-            # 获取对象时不自动预加载关系，避免循环依赖
-            obj = await self.get(id=id, preload=[])
+            mapper = sa_inspect(self.model)
+            values = {
+                key: value
+                for key, value in obj_dict.items()
+                if key in mapper.column_attrs and key != "id"
+            }
+            # 设置字段值（只检查一次current_user）
+            if self.auth.user and "updated_id" in mapper.column_attrs:
+                values["updated_id"] = self.auth.user.id
+            # 关系、属性等非列字段只能通过ORM对象赋值
+            extra = {
+                key: value
+                for key, value in obj_dict.items()
+                if key not in mapper.column_attrs and hasattr(self.model, key)
+            }
+
+            # 树形表调整父级时需读取原路径以同步子孙节点，走加锁读取分支
+            move_tree = "parent_id" in values and hasattr(self.model, "tree_path")
+
+            if not extra and not move_tree and self.auth.db.get_bind().dialect.update_returning:
+                # 单条 UPDATE ... WHERE id AND <数据权限> RETURNING，
+                # 权限条件与写入在同一语句中生效，无需再次校验
+                sql = (
+                    update(self.model)
+                    .where(self.model.id == id)
+                    .values(**values)
+                    .returning(self.model)
+                )
+                sql = await Permission(model=self.model, auth=self.auth).filter_query(sql)
+                result: Result = await self.auth.db.execute(sql)
+                obj = result.scalars().first()
+                if not obj:
+                    raise CustomException(msg="更新对象不存在")
+                return obj
+
+            # 不支持 UPDATE ... RETURNING 时（MySQL）：按权限加行锁读取后写入，
+            # 锁定期间其他事务无法修改 created_id 等权限字段，保证与校验结果一致
+            sql = select(self.model).where(self.model.id == id).with_for_update()
+            sql = await self.__filter_permissions(sql)
+            result = await self.auth.db.execute(sql.execution_options(populate_existing=True))
+            obj = result.scalars().first()
             if not obj:
                 raise CustomException(msg="更新对象不存在")
 
-            # 设置字段值（只检查一次current_user）
-            if self.auth.user and hasattr(obj, "updated_id"):
-                setattr(obj, "updated_id", self.auth.user.id)
+            if move_tree and values["parent_id"] != obj.parent_id:
+                await self.__move_tree(obj, values["parent_id"])
 
-            for key, value in obj_dict.items():
-                if hasattr(obj, key):
-                    setattr(obj, key, value)
+            for key, value in {**values, **extra}.items():
+                setattr(obj, key, value)
 
             await self.auth.db.flush()
-            # 刷新对象时不自动预加载关系
-            await self.auth.db.refresh(obj)
-
-            # 权限二次确认：flush后再次验证对象仍在权限范围内
-            # 防止并发修改导致的权限逃逸（如其他事务修改了created_id）
-            # 验证时也不自动预加载关系
-            verify_obj = await self.get(id=id, preload=[])
-            if not verify_obj:
-                # 对象已被删除或权限已失效
-                raise CustomException(msg="更新失败，对象不存在或无权限访问")
-
             return obj
         except Exception as e:
             raise CustomException(msg=f"更新失败: {e!s}")
 
-    async def delete(self, ids: builtins.list[int]) -> None:
+    async def delete(
+        self, ids: builtins.list[int], search: dict | None = None
+    ) -> dict[str, builtins.list[int]]:
         """
         删除对象
 
+        数据权限（operation_type="delete"）与附加条件合并到同一条 DELETE 语句中，
+        无权限、不满足条件或不存在的ID不会被删除，并在返回值中列出。
+
         参数:
         - ids (List[int]): 对象ID列表
+        - search (Optional[Dict]): 附加删除条件，格式同查询条件
+
+        返回:
+        - Dict[str, List[int]]: affected_ids 为已删除的ID，denied_ids 为未删除的ID
 
         异常:
         - CustomException: 删除失败时抛出异常
@@ -311,9 +705,15 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 raise CustomException(msg="暂不支持复合主键的批量删除")
 
             # 只删除有权限的数据
-            sql = delete(self.model).where(pk_cols[0].in_(ids))
-            await self.auth.db.execute(sql)
+            affected_ids = await self.__bulk_execute(
+                sql=delete(self.model),
+                pk=pk_cols[0],
+                ids=ids,
+                search=search,
+                operation_type="delete",
+            )
             await self.auth.db.flush()
+            return self.__bulk_result(ids, affected_ids)
         except Exception as e:
             raise CustomException(msg=f"删除失败: {e!s}")
 
@@ -331,14 +731,23 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except Exception as e:
             raise CustomException(msg=f"清空失败: {e!s}")
 
-    async def set(self, ids: builtins.list[int], **kwargs) -> None:
+    async def set(
+        self, ids: builtins.list[int], search: dict | None = None, **kwargs
+    ) -> dict[str, builtins.list[int]]:
         """
         批量更新对象
 
+        数据权限（operation_type="update"）与附加条件合并到同一条 UPDATE 语句中，
+        无权限、不满足条件或不存在的ID不会被更新，并在返回值中列出。
+
         参数:
         - ids (List[int]): 对象ID列表
+        - search (Optional[Dict]): 附加更新条件，格式同查询条件
         - **kwargs: 更新的属性及值
 
+        返回:
+        - Dict[str, List[int]]: affected_ids 为已更新的ID，denied_ids 为未更新的ID
+
         异常:
         - CustomException: 更新失败时抛出异常
         """
@@ -351,9 +760,15 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 raise CustomException(msg="暂不支持复合主键的批量更新")
 
             # 只更新有权限的数据
-            sql = update(self.model).where(pk_cols[0].in_(ids)).values(**kwargs)
-            await self.auth.db.execute(sql)
+            affected_ids = await self.__bulk_execute(
+                sql=update(self.model).values(**kwargs),
+                pk=pk_cols[0],
+                ids=ids,
+                search=search,
+                operation_type="update",
+            )
             await self.auth.db.flush()
+            return self.__bulk_result(ids, affected_ids)
         except CustomException:
             raise
         except Exception as e:
@@ -366,6 +781,486 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         filter = Permission(model=self.model, auth=self.auth)
         return await filter.filter_query(sql)
 
+    async def __tree_paths(self, ids: Sequence[int]) -> dict[int, str]:
+        """
+        查询节点自身的 tree_path
+
+        参数:
+        - ids (Sequence[int]): 节点ID列表
+
+        返回:
+        - Dict[int, str]: {节点ID: tree_path}
+        """
+        if not ids:
+            return {}
+        sql = select(self.model.id, self.model.tree_path).where(self.model.id.in_(set(ids)))
+        result: Result = await self.auth.db.execute(sql)
+        return {row.id: row.tree_path for row in result.all()}
+
+    async def __child_tree_paths(self, parent_ids: Sequence[int | None]) -> dict[int, str]:
+        """
+        计算挂在各父节点下的子节点应使用的 tree_path
+
+        参数:
+        - parent_ids (Sequence[Optional[int]]): 父节点ID列表，None 表示根节点
+
+        返回:
+        - Dict[int, str]: {父节点ID: 子节点 tree_path}，不存在的父节点不在结果中
+        """
+        paths = await self.__tree_paths([id for id in parent_ids if id is not None])
+        return {id: f"{path}{id}/" for id, path in paths.items()}
+
+    async def __move_tree(self, obj: ModelType, parent_id: int | None) -> None:
+        """
+        调整节点父级，并同步更新其子孙节点的 tree_path（单条 UPDATE）
+
+        参数:
+        - obj (ModelType): 待移动的节点（已加行锁）
+        - parent_id (Optional[int]): 新的父节点ID
+
+        异常:
+        - CustomException: 新父级为节点自身或其子孙节点时抛出异常
+        """
+        tree_paths = await self.__child_tree_paths([parent_id])
+        new_path = tree_paths.get(parent_id, "/")
+        if f"/{obj.id}/" in new_path:
+            raise CustomException(msg="父级不能为自身或其子级")
+
+        old_prefix = f"{obj.tree_path}{obj.id}/"
+        new_prefix = f"{new_path}{obj.id}/"
+        sql = (
+            update(self.model)
+            .where(self.model.tree_path.like(f"{old_prefix}%"))
+            .values(
+                tree_path=literal(new_prefix)
+                + func.substr(self.model.tree_path, len(old_prefix) + 1)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.auth.db.execute(sql)
+        # 同步会话中已加载的子孙节点，避免属性过期后在异步上下文中触发懒加载
+        for item in self.auth.db.identity_map.values():
+            tree_path = item.__dict__.get("tree_path") if isinstance(item, self.model) else None
+            if tree_path and tree_path.startswith(old_prefix):
+                set_committed_value(item, "tree_path", new_prefix + tree_path[len(old_prefix) :])
+        obj.tree_path = new_path
+
+    def __prepare_rows(self, rows: Sequence[Any]) -> builtins.list[dict]:
+        """
+        将批量写入的数据统一转换为字典，并补充创建人/更新人/创建部门字段
+
+        参数:
+        - rows (Sequence[Any]): Schema 实例或字典
+
+        返回:
+        - List[Dict]: 可直接用于 INSERT 的参数列表
+        """
+        columns = sa_inspect(self.model).columns
+        user = self.auth.user
+        values = []
+        for row in rows:
+            item = dict(row) if isinstance(row, dict) else row.model_dump()
+            item = {key: value for key, value in item.items() if key in columns}
+            if user is not None:
+                if "created_id" in columns:
+                    item["created_id"] = user.id
+                if "updated_id" in columns:
+                    item["updated_id"] = user.id
+                if "created_dept_id" in columns:
+                    item["created_dept_id"] = user.dept_id
+            values.append(item)
+        return values
+
+    @staticmethod
+    def __split_rows(
+        values: builtins.list[dict], batch_size: int
+    ) -> builtins.list[builtins.list[dict]]:
+        """
+        按批次大小切分参数列表，字段集合不同的相邻行拆到不同批次（executemany 要求字段一致）
+
+        参数:
+        - values (List[Dict]): 参数列表
+        - batch_size (int): 每批行数
+
+        返回:
+        - List[List[Dict]]: 切分后的批次，保持输入顺序
+        """
+        batches: builtins.list[builtins.list[dict]] = []
+        for item in values:
+            if batches and len(batches[-1]) < batch_size and batches[-1][0].keys() == item.keys():
+                batches[-1].append(item)
+            else:
+                batches.append([item])
+        return batches
+
+    def __select(
+        self,
+        out_schema: Sequence[str] | type[BaseModel],
+        preload: builtins.list[str | Any] | None = None,
+        lean: bool = False,
+        extra_columns: Sequence[Any] = (),
+    ) -> Select:
+        """
+        构建查询语句的 SELECT 部分
+
+        参数:
+        - out_schema (Union[Sequence[str], Type[BaseModel]]): 输出模型或字段列表，仅投影模式使用
+        - preload (Optional[List[Union[str, Any]]]): 预加载关系，仅实体模式使用
+        - lean (bool): 是否使用投影模式
+        - extra_columns (Sequence[Any]): 投影模式下额外查询的列
+
+        返回:
+        - Select: 查询语句
+        """
+        if not lean:
+            sql = select(self.model)
+            # 应用预加载选项
+            for opt in self.__loader_options(preload):
+                sql = sql.options(opt)
+            return sql
+
+        columns, joins = self.__projection(out_schema)
+        sql = select(*columns, *extra_columns).select_from(self.model)
+        for target in joins:
+            sql = sql.outerjoin(target)
+        return sql
+
+    def __projection(
+        self, fields: Sequence[str] | type[BaseModel]
+    ) -> tuple[builtins.list[Any], builtins.list[Any]]:
+        """
+        解析投影字段
+
+        输出模型中与模型列同名的字段直接查询；类型为 BaseModel 的多对一关系字段
+        展开为 "关系.字段" 列；一对多/多对多关系不在投影模式中加载。
+
+        参数:
+        - fields (Union[Sequence[str], Type[BaseModel]]): 字段列表或输出模型
+
+        返回:
+        - Tuple[List[Any], List[Any]]: 带标签的列，以及需要 LEFT JOIN 的关系
+
+        异常:
+        - CustomException: 字段不存在时抛出异常
+        """
+        mapper = sa_inspect(self.model)
+        if isinstance(fields, type) and issubclass(fields, BaseModel):
+            names: builtins.list[str] = []
+            for name, info in fields.model_fields.items():
+                if name in mapper.column_attrs:
+                    names.append(name)
+                    continue
+                relationship = mapper.relationships.get(name)
+                if relationship is None or relationship.uselist:
+                    continue
+                sub_schema = next(
+                    (
+                        arg
+                        for arg in (info.annotation, *get_args(info.annotation))
+                        if isinstance(arg, type) and issubclass(arg, BaseModel)
+                    ),
+                    None,
+                )
+                if sub_schema is None:
+                    continue
+                target = relationship.mapper.column_attrs
+                names.extend(f"{name}.{sub}" for sub in sub_schema.model_fields if sub in target)
+        else:
+            names = list(fields)
+
+        columns = []
+        aliases: dict[str, Any] = {}
+        for name in names:
+            rel_name, _, column_name = name.rpartition(".")
+            if not rel_name:
+                if name not in mapper.column_attrs:
+                    raise CustomException(msg=f"投影字段不存在: {name}")
+                columns.append(getattr(self.model, name).label(name))
+                continue
+            relationship = mapper.relationships.get(rel_name)
+            if relationship is None or relationship.uselist:
+                raise CustomException(msg=f"投影关系不存在或不是多对一关系: {rel_name}")
+            if column_name not in relationship.mapper.column_attrs:
+                raise CustomException(msg=f"投影字段不存在: {name}")
+            # 使用别名关联，避免自关联（如 created_by 指向用户表自身）时表名冲突
+            if rel_name not in aliases:
+                aliases[rel_name] = aliased(relationship.mapper.class_)
+            columns.append(getattr(aliases[rel_name], column_name).label(name))
+
+        joins = [
+            getattr(self.model, rel_name).of_type(alias) for rel_name, alias in aliases.items()
+        ]
+        return columns, joins
+
+    @staticmethod
+    def __lean_row(row: Any) -> dict:
+        """
+        将投影查询结果行转换为字典
+
+        "关系.字段" 列组装为嵌套字典（关联记录不存在时为 None），
+        时间按 DateTimeStr 的格式输出，与输出模型序列化结果保持一致。
+
+        参数:
+        - row (Any): 查询结果行
+
+        返回:
+        - Dict: 结果字典
+        """
+        data: dict[str, Any] = {}
+        for key, value in row._mapping.items():
+            if key.startswith("__key_"):
+                continue
+            if isinstance(value, datetime):
+                value = value.strftime("%Y-%m-%d %H:%M:%S")
+            rel_name, _, column_name = key.rpartition(".")
+            if rel_name:
+                data.setdefault(rel_name, {})[column_name] = value
+            else:
+                data[key] = value
+        for key, value in data.items():
+            if isinstance(value, dict) and all(v is None for v in value.values()):
+                data[key] = None
+        return data
+
+    async def __bulk_execute(
+        self,
+        sql: Any,
+        pk: Any,
+        ids: builtins.list[int],
+        search: dict | None,
+        operation_type: str,
+    ) -> builtins.list[int]:
+        """
+        执行带数据权限的批量 UPDATE/DELETE
+
+        支持 RETURNING 的数据库（PostgreSQL、SQLite）单条语句完成过滤、写入并返回受影响ID；
+        MySQL 不支持 RETURNING，且不允许在 UPDATE/DELETE 中引用目标表自身的子查询，
+        因此先按权限加行锁查询ID，再按ID写入。
+
+        参数:
+        - sql (Any): 未附加条件的 UPDATE/DELETE 语句
+        - pk (Any): 主键列
+        - ids (List[int]): 对象ID列表
+        - search (Optional[Dict]): 附加条件
+        - operation_type (str): 数据权限操作类型（"update"/"delete"）
+
+        返回:
+        - List[int]: 受影响的ID
+        """
+        if not ids:
+            return []
+        conditions = [pk.in_(ids)]
+        if search:
+            conditions.extend(await self.__build_conditions(**search))
+        permission = Permission(model=self.model, auth=self.auth, operation_type=operation_type)
+
+        dialect = self.auth.db.get_bind().dialect
+        returning = dialect.delete_returning if sql.is_delete else dialect.update_returning
+        if returning:
+            sql = await permission.filter_query(sql.where(*conditions))
+            result: Result = await self.auth.db.execute(sql.returning(pk))
+            return list(result.scalars().all())
+
+        query = await permission.filter_query(select(pk).where(*conditions).with_for_update())
+        result = await self.auth.db.execute(query)
+        affected_ids = list(result.scalars().all())
+        if affected_ids:
+            await self.auth.db.execute(sql.where(pk.in_(affected_ids)))
+        return affected_ids
+
+    @staticmethod
+    def __bulk_result(
+        ids: builtins.list[int], affected_ids: builtins.list[int]
+    ) -> dict[str, builtins.list[int]]:
+        """
+        组装批量操作结果
+
+        参数:
+        - ids (List[int]): 请求的ID列表
+        - affected_ids (List[int]): 受影响的ID列表
+
+        返回:
+        - Dict[str, List[int]]: affected_ids 与 denied_ids
+        """
+        affected = set(affected_ids)
+        return {
+            "affected_ids": [id for id in dict.fromkeys(ids) if id in affected],
+            "denied_ids": [id for id in dict.fromkeys(ids) if id not in affected],
+        }
+
+    async def __count(self, conditions: builtins.list[ColumnElement]) -> int:
+        """
+        统计满足条件且在数据权限范围内的记录数
+
+        参数:
+        - conditions (List[ColumnElement]): 查询条件
+
+        返回:
+        - int: 记录数
+        """
+        # 优化count查询：使用主键计数而非全表扫描
+        mapper = sa_inspect(self.model)
+        pk_cols = list(getattr(mapper, "primary_key", []))
+        if pk_cols:
+            # 使用主键的第一列进行计数（主键必定非NULL，性能更好）
+            count_sql = select(func.count(pk_cols[0])).select_from(self.model)
+        else:
+            # 降级方案：使用count(*)
+            count_sql = select(func.count()).select_from(self.model)
+
+        if conditions:
+            count_sql = count_sql.where(*conditions)
+        count_sql = await self.__filter_permissions(count_sql)
+
+        total_result = await self.auth.db.execute(count_sql)
+        return total_result.scalar() or 0
+
+    def __keyset_keys(
+        self, order_by: builtins.list[dict[str, str]]
+    ) -> builtins.list[tuple[str, str]]:
+        """
+        获取游标分页的定位字段，未包含 id 时追加 id 作为决胜字段保证顺序唯一
+
+        参数:
+        - order_by (List[Dict[str, str]]): 排序字段列表
+
+        返回:
+        - List[Tuple[str, str]]: (字段名, 排序方向) 列表
+        """
+        keys = [
+            (field, direction.lower()) for order in order_by for field, direction in order.items()
+        ]
+        if "id" not in {field for field, _ in keys}:
+            keys.append(("id", keys[0][1] if keys else "asc"))
+        return keys
+
+    def __nullable(self, field: str) -> bool:
+        """
+        判断字段是否可能为 NULL（非映射列按可空处理）
+
+        参数:
+        - field (str): 字段名
+
+        返回:
+        - bool: 可空返回True
+        """
+        column = sa_inspect(self.model).columns.get(field)
+        return column is None or bool(column.nullable)
+
+    def __keyset_order_by(
+        self, keys: builtins.list[tuple[str, str]]
+    ) -> builtins.list[ColumnElement]:
+        """
+        获取游标分页的排序字段，NULL 视为最小值: 升序排在最前，降序排在最后
+
+        MySQL 默认即为该顺序且不支持 NULLS FIRST/LAST 语法，其余数据库显式指定。
+
+        参数:
+        - keys (List[Tuple[str, str]]): (字段名, 排序方向) 列表
+
+        返回:
+        - List[ColumnElement]: 排序字段列表
+        """
+        columns = []
+        for field, direction in keys:
+            column = getattr(self.model, field)
+            order = desc(column) if direction == "desc" else asc(column)
+            if settings.DATABASE_TYPE != "mysql" and self.__nullable(field):
+                order = order.nulls_last() if direction == "desc" else order.nulls_first()
+            columns.append(order)
+        return columns
+
+    def __keyset_condition(
+        self, keys: builtins.list[tuple[str, str]], values: builtins.list[Any]
+    ) -> ColumnElement:
+        """
+        构建游标定位条件: (a > :a) OR (a = :a AND b > :b) OR ...
+
+        与 __keyset_order_by 一致，NULL 视为最小值:
+        - 升序: 上一行为 NULL 时其后为全部非 NULL 行，否则为大于该值的行
+        - 降序: 上一行为 NULL 时其后没有更小的值，否则为小于该值的行及 NULL 行
+
+        参数:
+        - keys (List[Tuple[str, str]]): (字段名, 排序方向) 列表
+        - values (List[Any]): 游标中记录的上一页最后一行字段值
+
+        返回:
+        - ColumnElement: 定位条件
+        """
+        clauses = []
+        for i, (field, direction) in enumerate(keys):
+            column = getattr(self.model, field)
+            value = values[i]
+            if direction == "desc":
+                if value is None:
+                    continue
+                seek = column < value
+                if self.__nullable(field):
+                    seek = or_(seek, column.is_(None))
+            elif value is None:
+                seek = column.is_not(None)
+            else:
+                seek = column > value
+            prefix = [
+                getattr(self.model, f).is_(None) if v is None else getattr(self.model, f) == v
+                for (f, _), v in zip(keys[:i], values[:i], strict=True)
+            ]
+            clauses.append(and_(*prefix, seek))
+        return or_(*clauses) if clauses else false()
+
+    @staticmethod
+    def __encode_cursor(values: builtins.list[Any]) -> str:
+        """
+        将定位字段值编码为不透明游标
+
+        参数:
+        - values (List[Any]): 定位字段值
+
+        返回:
+        - str: 游标字符串
+        """
+        payload = []
+        for value in values:
+            if isinstance(value, datetime):
+                payload.append({"dt": value.isoformat()})
+            elif isinstance(value, date):
+                payload.append({"d": value.isoformat()})
+            else:
+                payload.append(value)
+        raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def __decode_cursor(cursor: str) -> builtins.list[Any]:
+        """
+        解码游标
+
+        参数:
+        - cursor (str): 游标字符串
+
+        返回:
+        - List[Any]: 定位字段值
+
+        异常:
+        - CustomException: 游标无效时抛出异常
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+        except ValueError:
+            raise CustomException(msg="无效的分页游标")
+        if not isinstance(payload, list):
+            raise CustomException(msg="无效的分页游标")
+        values = []
+        for value in payload:
+            if isinstance(value, dict) and "dt" in value:
+                values.append(datetime.fromisoformat(value["dt"]))
+            elif isinstance(value, dict) and "d" in value:
+                values.append(date.fromisoformat(value["d"]))
+            else:
+                values.append(value)
+        return values
+
     async def __build_conditions(self, **kwargs) -> builtins.list[ColumnElement]:
         """
         构建查询条件
@@ -159,6 +159,29 @@ class UserMixin(MappedBase):
         )
 
 
+class DeptMixin(MappedBase):
+    """
+    创建部门字段 Mixin
+
+    冗余记录创建人创建数据时所在的部门，与 UserMixin 配合使用：
+        - class YourModel(ModelMixin, UserMixin, DeptMixin)
+
+    数据权限按部门过滤（本部门/本部门及以下/自定义）时直接使用带索引的
+    created_dept_id IN (...)，无需再关联用户表；未混入的表仍通过 created_by 关系过滤。
+    由 CRUDBase 在创建时根据当前用户填充，历史数据通过迁移脚本回填。
+    """
+
+    __abstract__: bool = True
+
+    created_dept_id: Mapped[int | None] = mapped_column(
+        Integer,
+        default=None,
+        nullable=True,
+        index=True,
+        comment="创建部门ID",
+    )
+
+
 class TenantMixin(MappedBase):
     """
     租户隔离字段 Mixin
@@ -211,3 +234,30 @@ class TenantMixin(MappedBase):
             foreign_keys=lambda: self.tenant_id,  # pyright: ignore[reportArgumentType]
             uselist=False,
         )
+
+
+class TreeMixin(MappedBase):
+    """
+    树形路径字段 Mixin
+
+    用于带 parent_id 的树形表（部门、菜单），维护物化路径以避免递归查询子孙/祖先节点
+
+    路径格式：
+        - tree_path 记录从根节点到父节点的ID链，如 /1/3/ 表示父节点为3、祖父节点为1
+        - 根节点的 tree_path 为 /
+        - 节点X的子孙节点：tree_path LIKE '{X.tree_path}{X.id}/%'
+        - 节点X的祖先节点：直接解析 X.tree_path
+
+    由 CRUDBase 在创建、更新（移动）时维护，可通过 CRUDBase.rebuild_tree_path 全量重建
+    """
+
+    __abstract__: bool = True
+
+    tree_path: Mapped[str] = mapped_column(
+        String(255),
+        default="/",
+        server_default="/",
+        nullable=False,
+        index=True,
+        comment="树形路径(祖先ID链,如 /1/3/)",
+    )
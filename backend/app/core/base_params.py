@@ -1,4 +1,5 @@
 import json
+from typing import Literal
 
 from fastapi import Query
 
@@ -16,6 +17,11 @@ class PaginationQueryParam:
             default=None,
             description="排序字段,格式:[{'field1': 'asc'}, {'field2': 'desc'}]",
         ),
+        page_mode: Literal["offset", "cursor"] = Query(
+            default="offset", description="分页模式: offset-页码分页 cursor-游标分页"
+        ),
+        cursor: str | None = Query(default=None, description="游标分页时上一页返回的 next_cursor"),
+        with_total: bool = Query(default=False, description="游标分页时是否统计总数"),
     ) -> None:
         """
         初始化分页查询参数。
@@ -24,12 +30,18 @@ class PaginationQueryParam:
         - page_no (int | None): 当前页码，默认 None。
         - page_size (int | None): 每页数量，默认 None，最大 100。
         - order_by (str | None): 排序字段，格式 'field,asc;field2,desc'。
+        - page_mode (str): 分页模式，offset 为页码分页，cursor 为游标分页，默认 offset。
+        - cursor (str | None): 游标分页时上一页返回的 next_cursor，为空时返回第一页。
+        - with_total (bool): 游标分页时是否统计总数，默认不统计。
 
         返回:
         - None
         """
         self.page_no = page_no
         self.page_size = page_size
+        self.page_mode = page_mode
+        self.cursor = cursor
+        self.with_total = with_total
         # 将字符串格式的order_by转换为服务层需要的List[Dict[str, str]]格式
         if order_by:
             try:
@@ -1,14 +1,18 @@
+import inspect
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 from fastapi import FastAPI
 from redis import exceptions
 from redis.asyncio import Redis
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.config.setting import settings
 from app.core.base_model import MappedBase
@@ -107,6 +111,65 @@ engine, db_session = create_engine_and_session(settings.DB_URI)
 async_engine, async_db_session = create_async_engine_and_session(settings.ASYNC_DB_URI)
 
 
+# 会话 info 中保存的提交后回调: 待提交 / 已提交待执行
+_PENDING_CALLBACKS = "after_commit_pending"
+_COMMITTED_CALLBACKS = "after_commit_committed"
+
+
+def after_commit(db: AsyncSession, callback: Callable[[], Awaitable[Any] | Any]) -> None:
+    """
+    注册事务提交后执行的回调，事务回滚时丢弃。
+
+    缓存失效等操作若在提交前执行，并发请求可能读到未提交前的旧数据并写入新版本的缓存，
+    因此应通过本方法延迟到提交后执行。回调由 run_after_commit 执行（db_getter 在请求事务结束后调用）。
+
+    参数:
+    - db (AsyncSession): 数据库会话。
+    - callback (Callable[[], Awaitable[Any] | Any]): 回调函数，可为同步或异步函数。
+
+    返回:
+    - None
+    """
+    db.info.setdefault(_PENDING_CALLBACKS, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_after_commit(session: Session) -> None:
+    """最外层事务提交后，将待提交回调转为待执行（保存点提交不处理）"""
+    if session.in_nested_transaction():
+        return
+    callbacks = session.info.pop(_PENDING_CALLBACKS, None)
+    if callbacks:
+        session.info.setdefault(_COMMITTED_CALLBACKS, []).extend(callbacks)
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_after_rollback(session: Session) -> None:
+    """最外层事务回滚后丢弃待提交回调（保存点回滚时保留，多执行一次失效无副作用）"""
+    if session.in_nested_transaction():
+        return
+    session.info.pop(_PENDING_CALLBACKS, None)
+
+
+async def run_after_commit(db: AsyncSession) -> None:
+    """
+    执行已提交事务注册的回调，单个回调失败只记录日志。
+
+    参数:
+    - db (AsyncSession): 数据库会话。
+
+    返回:
+    - None
+    """
+    for callback in db.info.pop(_COMMITTED_CALLBACKS, []):
+        try:
+            result = callback()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            log.error(f"执行事务提交后回调失败: {e}")
+
+
 async def create_tables() -> None:
     """创建数据库表"""
     async with async_engine.begin() as coon:
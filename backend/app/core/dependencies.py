@@ -1,21 +1,19 @@
-import json
 from collections.abc import AsyncGenerator
 
 from fastapi import Depends, Request
 from redis.asyncio.client import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.api.v1.module_system.user.crud import UserCRUD
-from app.api.v1.module_system.user.model import UserModel
 from app.common.enums import RedisInitKeyConfig
 from app.config.setting import settings
-from app.core.database import async_db_session
+from app.core.database import async_db_session, run_after_commit
 from app.core.exceptions import CustomException
 from app.core.logger import log
+from app.core.permission import Permission
+from app.core.principal import PrincipalCache
 from app.core.redis_crud import RedisCURD
-from app.core.security import OAuth2Schema, decode_access_token
+from app.core.security import OAuth2Schema, get_token_context
 
 
 async def db_getter() -> AsyncGenerator[AsyncSession, None]:
@@ -25,8 +23,12 @@ async def db_getter() -> AsyncGenerator[AsyncSession, None]:
     - AsyncSession: 数据库会话连接
     """
     async with async_db_session() as session:
-        async with session.begin():
-            yield session
+        try:
+            async with session.begin():
+                yield session
+        finally:
+            # 缓存失效等回调在事务提交后执行
+            await run_after_commit(session)
 
 
 async def redis_getter(request: Request) -> Redis:
@@ -65,53 +67,42 @@ async def get_current_user(
     if token.startswith("Bearer"):
         token = token.split(" ")[1]
 
-    payload = decode_access_token(token)
-    if not payload or not hasattr(payload, "is_refresh") or payload.is_refresh:
+    # 复用请求内已解析的令牌，签名校验与登录信息解析每个请求最多一次
+    payload, user_info = get_token_context(request, token)
+    if payload.is_refresh:
         raise CustomException(msg="非法凭证", code=10401, status_code=401)
 
-    online_user_info = payload.sub
-    # 从Redis中获取用户信息
-    user_info = json.loads(online_user_info)  # 确保是字典类型
-
     session_id = user_info.get("session_id")
     if not session_id:
         raise CustomException(msg="认证已失效", code=10401, status_code=401)
 
-    # 检查用户是否在线
-    online_ok = await RedisCURD(redis).exists(
-        key=f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}"
+    # 检查用户是否在线，启用滑动过期时按需续期token（一次Redis往返）
+    renew_below = None
+    if settings.TOKEN_SLIDING_EXPIRE:
+        renew_below = int(settings.ACCESS_TOKEN_EXPIRE_MINUTES * settings.TOKEN_SLIDING_RENEW_RATIO)
+    online_ok = await RedisCURD(redis).touch_session(
+        access_key=f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}",
+        refresh_key=f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:{session_id}",
+        access_expire=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
+        refresh_expire=settings.REFRESH_TOKEN_EXPIRE_MINUTES,
+        renew_below=renew_below,
+        expire_index=(RedisInitKeyConfig.ONLINE_EXPIRE_INDEX.key, session_id),
     )
     if not online_ok:
         raise CustomException(msg="认证已失效", code=10401, status_code=401)
 
-    # 如果启用了滑动过期，自动续期token
-    if settings.TOKEN_SLIDING_EXPIRE:
-        await RedisCURD(redis).expire(
-            key=f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}",
-            expire=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
-        )
-        await RedisCURD(redis).expire(
-            key=f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:{session_id}",
-            expire=settings.REFRESH_TOKEN_EXPIRE_MINUTES,
-        )
-
     # 关闭数据权限过滤，避免当前用户查询被拦截
     auth = AuthSchema(db=db, check_data_scope=False)
     username = user_info.get("user_name")
     if not username:
         raise CustomException(msg="认证已失效", code=10401, status_code=401)
-    # 获取用户信息，使用深层预加载确保RoleModel.creator被正确加载
-    user = await UserCRUD(auth).get_by_username_crud(
-        username=username,
-        preload=[
-            "dept",
-            selectinload(UserModel.roles),
-            "positions",
-            "created_by",
-        ],
+    # 获取用户权限快照（命中缓存时无需查询数据库）
+    principal = await PrincipalCache.get(
+        db=db, redis=redis, session_id=session_id, username=username
     )
-    if not user:
+    if not principal:
         raise CustomException(msg="用户不存在", code=10401, status_code=401)
+    user, permissions = principal
     if user.status == "1":
         raise CustomException(msg="用户已被停用", code=10401, status_code=401)
 
@@ -120,12 +111,12 @@ async def get_current_user(
     request.scope["user_username"] = user.username
 
     # 过滤可用的角色和职位
-    if hasattr(user, "roles"):
-        user.roles = [role for role in user.roles if role and role.status]
-    if hasattr(user, "positions"):
-        user.positions = [pos for pos in user.positions if pos and pos.status]
+    user.roles = [role for role in user.roles if role and role.status]
+    user.positions = [pos for pos in user.positions if pos and pos.status]
 
     auth.user = user
+    auth.permissions = permissions
+    auth._scope_versions = await Permission.load_versions(redis)
     return auth
 
 
@@ -146,6 +137,10 @@ class AuthPermission:
         """
         self.permissions = permissions or []
         self.check_data_scope = check_data_scope
+        # 路由声明时预编译所需权限集合，通配符表示无需校验
+        self.required = frozenset(self.permissions)
+        if self.required & {"*", "*:*:*"}:
+            self.required = frozenset()
 
     async def __call__(self, auth: AuthSchema = Depends(get_current_user)) -> AuthSchema:
         """
@@ -163,28 +158,16 @@ class AuthPermission:
         if auth.user and auth.user.is_superuser:
             return auth
 
-        # 无需验证权限
-        if not self.permissions:
-            return auth
-
-        # 超级管理员权限标识
-        if "*" in self.permissions or "*:*:*" in self.permissions:
+        # 无需验证权限（含超级管理员权限标识）
+        if not self.required:
             return auth
 
         # 检查用户是否有角色
         if not auth.user or not auth.user.roles:
             raise CustomException(msg="无权限操作", code=10403, status_code=403)
 
-        # 获取用户权限集合
-        user_permissions = {
-            menu.permission
-            for role in auth.user.roles
-            for menu in role.menus
-            if role.status == "0" and menu.permission and menu.status == "0"
-        }
-
         # 权限验证 - 满足任一权限即可
-        if not any(perm in user_permissions for perm in self.permissions):
+        if self.required.isdisjoint(auth.permissions):
             log.error(f"用户缺少任何所需的权限: {self.permissions}")
             raise CustomException(msg="无权限操作", code=10403, status_code=403)
 
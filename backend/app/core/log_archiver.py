@@ -0,0 +1,437 @@
+import asyncio
+import gzip
+import importlib
+import json
+import os
+import re
+import uuid
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, ClassVar
+
+from redis.asyncio.client import Redis
+from sqlalchemy import Table, delete, select
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.common.enums import RedisInitKeyConfig
+from app.config.path_conf import BASE_DIR
+from app.config.setting import settings
+from app.core.database import async_db_session
+from app.core.exceptions import CustomException
+from app.core.logger import log
+from app.core.permission import Permission
+
+# 参与归档的日志表: 表名 -> 模型路径（插件未启用时跳过）
+ARCHIVE_TABLES: dict[str, str] = {
+    "sys_log": "app.api.v1.module_system.log.model.OperationLogModel",
+    "app_job_log": "app.plugin.module_application.job.model.JobLogModel",
+}
+
+_MONTH_PATTERN = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
+# 归档目录标识文件，用于校验多实例是否共享同一归档目录
+_STORAGE_MARKER = ".storage_id"
+
+
+class LogArchiver:
+    """
+    日志归档器
+
+    日志表只保留最近 LOG_RETENTION_DAYS 天的记录。定时任务按主键顺序分批读取更早的记录，
+    按创建月份写入 gzip 压缩的 JSONL 文件（文件内按ID倒序），并在旁边记录该文件的行数:
+    - {LOG_ARCHIVE_DIR}/{表名}/{YYYY-MM}/{批次首条ID}.jsonl.gz
+    - {LOG_ARCHIVE_DIR}/{表名}/{YYYY-MM}/{批次首条ID}.meta.json
+    写入成功后按主键区间整段删除该批记录。文件名由批次首条ID决定，删除失败后重跑会覆盖同名文件，不会产生重复记录。
+    归档文件只写在执行定时任务的实例上，多实例部署时 LOG_ARCHIVE_DIR 必须是共享存储。
+    启动时 check_storage 比对归档目录中的标识文件与 Redis 中登记的标识，不一致说明本实例看到的
+    不是同一目录，此时本实例拒绝归档与查询，避免写入本地磁盘或返回不完整的结果。
+    归档月份可通过 list_months / read_month 按需查询，read_month 按 Permission 的数据范围过滤记录，
+    逐行流式读取，凑满一页即停止；无过滤条件时按行数整文件跳过分页之前的记录。
+    """
+
+    _storage_error: ClassVar[str | None] = None
+
+    @staticmethod
+    def _model(name: str) -> Any | None:
+        """
+        获取归档表对应的模型类。
+
+        参数:
+        - name (str): 表名。
+
+        返回:
+        - Any | None: 模型类，表未注册或所在插件未启用时返回None。
+        """
+        target = ARCHIVE_TABLES.get(name)
+        if target is None:
+            return None
+        module_path, class_name = target.rsplit(".", 1)
+        try:
+            return getattr(importlib.import_module(module_path), class_name)
+        except (ImportError, AttributeError):
+            return None
+
+    @classmethod
+    def _table(cls, name: str) -> Table | None:
+        """
+        获取归档表对象。
+
+        参数:
+        - name (str): 表名。
+
+        返回:
+        - Table | None: 表对象，表未注册或所在插件未启用时返回None。
+        """
+        model = cls._model(name)
+        return model.__table__ if model is not None else None
+
+    @staticmethod
+    def _table_dir(name: str) -> Path:
+        return BASE_DIR.joinpath(settings.LOG_ARCHIVE_DIR, name)
+
+    @classmethod
+    async def check_storage(cls, redis: Redis) -> bool:
+        """
+        校验归档目录是否为各实例共享的存储（应用启动时调用）。
+
+        首次启动的实例生成标识写入归档目录并登记到 Redis，其余实例读取目录中的标识与之比对。
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+
+        返回:
+        - bool: 归档目录可用返回True。
+        """
+        root = BASE_DIR.joinpath(settings.LOG_ARCHIVE_DIR)
+        marker = root.joinpath(_STORAGE_MARKER)
+        try:
+            root.mkdir(parents=True, exist_ok=True)
+            try:
+                with marker.open("x", encoding="utf-8") as f:
+                    f.write(uuid.uuid4().hex)
+            except FileExistsError:
+                pass
+            storage_id = marker.read_text(encoding="utf-8").strip()
+        except OSError as e:
+            cls._storage_error = f"日志归档目录不可用: {e}"
+            log.error(cls._storage_error)
+            return False
+
+        key = RedisInitKeyConfig.LOG_ARCHIVE_STORAGE.key
+        await redis.set(key, storage_id, nx=True)
+        registered = await redis.get(key)
+        if registered != storage_id:
+            cls._storage_error = "日志归档目录不是各实例共享的存储，本实例无法归档或查询归档日志"
+            log.error(
+                f"{cls._storage_error}: {root} 的标识 {storage_id} 与已登记的 {registered} 不一致。"
+                f"请将 LOG_ARCHIVE_DIR 挂载为共享存储；确认目录已迁移时可删除 Redis 键 {key} 后重启"
+            )
+            return False
+        cls._storage_error = None
+        return True
+
+    @classmethod
+    def _ensure_storage(cls) -> None:
+        """
+        校验本实例的归档目录可用。
+
+        异常:
+        - CustomException: 启动校验未通过时抛出。
+        """
+        if cls._storage_error:
+            raise CustomException(msg=cls._storage_error)
+
+    @classmethod
+    async def run(cls) -> dict[str, int]:
+        """
+        归档全部日志表中超过保留天数的记录（由定时任务调用）。
+
+        返回:
+        - dict[str, int]: 各表归档的记录数。
+        """
+        if cls._storage_error:
+            log.error(f"跳过日志归档: {cls._storage_error}")
+            return {}
+        cutoff = datetime.now() - timedelta(days=settings.LOG_RETENTION_DAYS)
+        result = {}
+        for name in ARCHIVE_TABLES:
+            table = cls._table(name)
+            if table is None:
+                continue
+            try:
+                result[name] = await cls.archive_table(table, cutoff)
+            except Exception as e:
+                log.error(f"归档日志表 {name} 失败: {e}")
+        log.info(f"日志归档完成: {result}")
+        return result
+
+    @classmethod
+    async def archive_table(cls, table: Table, cutoff: datetime) -> int:
+        """
+        将创建时间早于 cutoff 的记录写入归档文件并从表中删除。
+
+        参数:
+        - table (Table): 日志表。
+        - cutoff (datetime): 截止时间。
+
+        返回:
+        - int: 归档的记录数。
+        """
+        batch_size = max(settings.LOG_ARCHIVE_BATCH_SIZE, 1)
+        total = 0
+        while True:
+            async with async_db_session() as session:
+                async with session.begin():
+                    rows = (
+                        (
+                            await session.execute(
+                                select(table)
+                                .where(table.c.created_time < cutoff)
+                                .order_by(table.c.id)
+                                .limit(batch_size)
+                            )
+                        )
+                        .mappings()
+                        .all()
+                    )
+                    if not rows:
+                        return total
+                    await asyncio.to_thread(cls._write_batch, table.name, rows)
+                    # 按主键区间整段删除，避免逐条删除
+                    await session.execute(
+                        delete(table).where(
+                            table.c.id.between(rows[0]["id"], rows[-1]["id"]),
+                            table.c.created_time < cutoff,
+                        )
+                    )
+            total += len(rows)
+            if len(rows) < batch_size:
+                return total
+
+    @classmethod
+    def _write_batch(cls, name: str, rows: list) -> None:
+        """
+        按创建月份写入一批记录（先写临时文件再替换），文件内按ID倒序，便于分页时顺序读取。
+
+        参数:
+        - name (str): 表名。
+        - rows (list): 按主键升序排列的记录。
+        """
+        months: dict[str, list] = {}
+        for row in rows:
+            months.setdefault(row["created_time"].strftime("%Y-%m"), []).append(row)
+        for month, items in months.items():
+            path = cls._table_dir(name).joinpath(month, f"{items[0]['id']:012d}.jsonl.gz")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                for item in reversed(items):
+                    f.write(json.dumps(dict(item), ensure_ascii=False, default=str))
+                    f.write("\n")
+            os.replace(tmp_path, path)
+            meta_path = cls._meta_path(path)
+            tmp_path = meta_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps({"rows": len(items)}), encoding="utf-8")
+            os.replace(tmp_path, meta_path)
+
+    @staticmethod
+    def _meta_path(path: Path) -> Path:
+        return path.with_name(path.name.replace(".jsonl.gz", ".meta.json"))
+
+    @classmethod
+    def _file_rows(cls, path: Path) -> int | None:
+        """
+        读取归档文件的行数。
+
+        参数:
+        - path (Path): 归档文件路径。
+
+        返回:
+        - int | None: 行数，缺少行数文件（早期按ID升序写入的文件）时返回None。
+        """
+        try:
+            return int(json.loads(cls._meta_path(path).read_text(encoding="utf-8"))["rows"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @classmethod
+    def list_months(cls, name: str) -> list[dict[str, Any]]:
+        """
+        获取已归档的月份。
+
+        参数:
+        - name (str): 表名。
+
+        返回:
+        - list[dict[str, Any]]: 月份、文件数、记录数(缺少行数文件时为None)及文件总大小，按月份倒序。
+
+        异常:
+        - CustomException: 归档目录未通过启动校验时抛出。
+        """
+        cls._ensure_storage()
+        table_dir = cls._table_dir(name)
+        if not table_dir.is_dir():
+            return []
+        months = []
+        for month_dir in sorted(table_dir.iterdir(), reverse=True):
+            if not month_dir.is_dir() or not _MONTH_PATTERN.match(month_dir.name):
+                continue
+            files = list(month_dir.glob("*.jsonl.gz"))
+            counts = [cls._file_rows(file) for file in files]
+            months.append({
+                "month": month_dir.name,
+                "files": len(files),
+                "rows": None if None in counts else sum(counts),
+                "size": sum(file.stat().st_size for file in files),
+            })
+        return months
+
+    @classmethod
+    async def read_month(
+        cls,
+        auth: AuthSchema,
+        name: str,
+        month: str,
+        page_no: int = 1,
+        page_size: int = 10,
+        search: dict | None = None,
+    ) -> dict[str, Any]:
+        """
+        分页读取归档月份中的记录（按ID倒序），只返回当前用户数据范围内的记录。
+
+        参数:
+        - auth (AuthSchema): 认证信息模型，用于解析数据权限范围。
+        - name (str): 表名。
+        - month (str): 月份，格式 YYYY-MM。
+        - page_no (int): 页码。
+        - page_size (int): 每页数量。
+        - search (dict | None): 查询条件，格式同查询参数模型的 __dict__。
+
+        返回:
+        - dict[str, Any]: 分页数据。有查询条件或数据权限限制时不统计总数，total 为None。
+
+        异常:
+        - CustomException: 月份格式不正确、未归档或归档目录未通过启动校验时抛出。
+        """
+        cls._ensure_storage()
+        if not _MONTH_PATTERN.match(month):
+            raise CustomException(msg="月份格式不正确，应为 YYYY-MM")
+        month_dir = cls._table_dir(name).joinpath(month)
+        model = cls._model(name)
+        if model is None or not month_dir.is_dir():
+            raise CustomException(msg=f"{month} 没有归档记录")
+        allow = await Permission(model=model, auth=auth).row_filter()
+        start = (page_no - 1) * page_size
+        items, total, has_next = await asyncio.to_thread(
+            cls._scan_month, month_dir, start, page_size, search or {}, allow
+        )
+        return {
+            "items": items,
+            "total": total,
+            "page_no": page_no,
+            "page_size": page_size,
+            "has_next": has_next,
+        }
+
+    @classmethod
+    def _scan_month(
+        cls,
+        month_dir: Path,
+        start: int,
+        limit: int,
+        search: dict,
+        allow: Callable[[dict], bool] | None = None,
+    ) -> tuple[list[dict], int | None, bool]:
+        """
+        按ID倒序流式扫描月份目录下的归档文件，取满分页范围并多看一条后停止。
+
+        没有查询条件和数据权限限制时，按行数文件整文件跳过分页之前的记录，并直接汇总总数；
+        否则逐行过滤，不统计总数。
+
+        参数:
+        - month_dir (Path): 月份目录。
+        - start (int): 起始位置。
+        - limit (int): 数量。
+        - search (dict): 查询条件。
+        - allow (Callable[[dict], bool] | None): 数据权限过滤函数，None 表示不限制。
+
+        返回:
+        - tuple[list[dict], int | None, bool]: 分页记录、总数(不统计时为None)及是否有下一页。
+        """
+        conditions = {
+            key: value
+            for key, value in search.items()
+            if value is not None and not (isinstance(value, tuple) and value[-1] is None)
+        }
+        filtered = bool(conditions) or allow is not None
+        paths = sorted(month_dir.glob("*.jsonl.gz"), reverse=True)
+        counts = [cls._file_rows(path) for path in paths]
+        total = None if filtered or None in counts else sum(counts)
+
+        items: list[dict] = []
+        matched = 0
+        for path, count in zip(paths, counts, strict=True):
+            if not filtered and count is not None and matched + count <= start:
+                matched += count
+                continue
+            for row in cls._iter_rows(path, descending=count is not None):
+                if filtered and (
+                    not cls._match(row, conditions) or (allow is not None and not allow(row))
+                ):
+                    continue
+                if matched >= start + limit:
+                    return items, total, True
+                if matched >= start:
+                    items.append(row)
+                matched += 1
+        return items, total, False
+
+    @staticmethod
+    def _iter_rows(path: Path, descending: bool) -> Iterator[dict]:
+        """
+        按ID倒序逐行读取归档文件。
+
+        参数:
+        - path (Path): 归档文件路径。
+        - descending (bool): 文件是否已按ID倒序写入，早期按升序写入的文件需整体读取后反转。
+
+        返回:
+        - Iterator[dict]: 记录迭代器。
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            lines = f if descending else reversed(f.readlines())
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+
+    @staticmethod
+    def _match(row: dict, conditions: dict) -> bool:
+        """
+        判断记录是否满足查询条件（支持 like/eq/between 及直接取值）。
+
+        参数:
+        - row (dict): 归档记录。
+        - conditions (dict): 查询条件。
+
+        返回:
+        - bool: 满足返回True。
+        """
+        for key, condition in conditions.items():
+            value = row.get(key)
+            if isinstance(condition, tuple) and len(condition) == 2:
+                operator, expected = condition
+                if expected is None:
+                    continue
+                if operator == "like":
+                    if str(expected).strip("%") not in str(value or ""):
+                        return False
+                    continue
+                if operator == "between":
+                    low, high = (str(item) for item in expected)
+                    if value is None or not low <= str(value) <= high:
+                        return False
+                    continue
+                condition = expected
+            if str(value) != str(condition):
+                return False
+        return True
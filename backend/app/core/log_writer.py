@@ -0,0 +1,226 @@
+import asyncio
+import random
+import time
+from typing import Any, ClassVar
+
+from pydantic import ValidationError
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.log.crud import OperationLogCRUD
+from app.api.v1.module_system.log.schema import OperationLogCreateSchema
+from app.config.setting import settings
+from app.core.database import async_db_session
+from app.core.logger import log
+from app.utils.ip_local_util import IpLocalUtil
+from app.utils.ua_util import UserAgentUtil
+
+# 停止写入的哨兵
+_STOP = object()
+
+
+class OperationLogWriter:
+    """
+    操作日志异步批量写入器
+
+    请求线程只把原始日志记录放入进程内有界队列；后台任务每 OPERATION_LOG_FLUSH_MS 毫秒
+    或攒够 OPERATION_LOG_BATCH_SIZE 条时解析UA、IP归属地并以多值 INSERT 一次写入。
+    队列满时按 OPERATION_LOG_OVERFLOW 处理:
+    - drop: 丢弃新记录
+    - sample: 队列过半后按 OPERATION_LOG_SAMPLE_RATE 抽样保留，队列满时丢弃
+    - block: 等待队列空位（对请求形成背压）
+    应用关闭时 stop 会把队列中剩余记录全部写入。
+    """
+
+    _queue: ClassVar[asyncio.Queue | None] = None
+    _task: ClassVar[asyncio.Task | None] = None
+    _stats: ClassVar[dict[str, Any]] = {
+        "written": 0,
+        "dropped": 0,
+        "failed": 0,
+        "batches": 0,
+        "last_flush_ms": 0.0,
+        "max_flush_ms": 0.0,
+    }
+
+    @classmethod
+    def start(cls) -> None:
+        """
+        启动后台写入任务。
+
+        返回:
+        - None
+        """
+        if cls._task is not None and not cls._task.done():
+            return
+        cls._queue = asyncio.Queue(maxsize=max(settings.OPERATION_LOG_QUEUE_SIZE, 1))
+        cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls, timeout: float = 10.0) -> None:
+        """
+        停止后台写入任务，并写入队列中剩余的记录。
+
+        参数:
+        - timeout (float): 等待写入完成的最长时间(秒)。
+
+        返回:
+        - None
+        """
+        queue, task = cls._queue, cls._task
+        if queue is None or task is None:
+            return
+        cls._task = None
+        await queue.put(_STOP)
+        try:
+            await asyncio.wait_for(task, timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            log.error(f"操作日志写入超时，剩余 {queue.qsize()} 条未写入")
+        cls._queue = None
+
+    @classmethod
+    async def submit(cls, record: dict) -> None:
+        """
+        提交一条原始日志记录。
+
+        参数:
+        - record (dict): 日志字段，另含 user_agent(原始UA字符串)，request_ip 用于解析归属地。
+
+        返回:
+        - None
+        """
+        queue = cls._queue
+        if queue is None or cls._task is None or cls._task.done():
+            # 写入任务未启动(如脚本中调用)或已意外退出时直接写入
+            await cls._flush([record])
+            return
+
+        policy = settings.OPERATION_LOG_OVERFLOW
+        if policy == "block":
+            await queue.put(record)
+            return
+        if (
+            policy == "sample"
+            and queue.qsize() >= queue.maxsize // 2
+            and random.random() >= settings.OPERATION_LOG_SAMPLE_RATE
+        ):
+            cls._stats["dropped"] += 1
+            return
+        try:
+            queue.put_nowait(record)
+        except asyncio.QueueFull:
+            cls._stats["dropped"] += 1
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        """
+        获取写入器运行指标。
+
+        返回:
+        - dict[str, Any]: 队列长度、容量、已写入/丢弃/失败条数、批次数及刷新耗时。
+        """
+        queue = cls._queue
+        return {
+            "queue_size": queue.qsize() if queue else 0,
+            "queue_max": queue.maxsize if queue else 0,
+            "overflow": settings.OPERATION_LOG_OVERFLOW,
+            **cls._stats,
+        }
+
+    @classmethod
+    async def _run(cls) -> None:
+        """后台任务: 按时间或条数攒批写入，收到停止哨兵后写完剩余记录退出"""
+        queue = cls._queue
+        assert queue is not None
+        loop = asyncio.get_running_loop()
+        interval = settings.OPERATION_LOG_FLUSH_MS / 1000
+        batch_size = max(settings.OPERATION_LOG_BATCH_SIZE, 1)
+        while True:
+            batch: list = []
+            stopping = False
+            try:
+                item = await queue.get()
+                stopping = item is _STOP
+                batch = [] if stopping else [item]
+                deadline = loop.time() + interval
+                while len(batch) < batch_size:
+                    try:
+                        if stopping:
+                            item = queue.get_nowait()
+                        else:
+                            item = await asyncio.wait_for(
+                                queue.get(), max(deadline - loop.time(), 0)
+                            )
+                    except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                        break
+                    if item is _STOP:
+                        stopping = True
+                    else:
+                        batch.append(item)
+                if batch:
+                    await cls._flush(batch)
+                if stopping:
+                    # 写完队列中的剩余记录后退出
+                    while not queue.empty():
+                        batch = [queue.get_nowait() for _ in range(min(queue.qsize(), batch_size))]
+                        batch = [record for record in batch if record is not _STOP]
+                        if batch:
+                            await cls._flush(batch)
+                    return
+            except Exception as e:
+                # 单批异常不能终止后台任务，否则后续日志只会堆积在队列中
+                cls._stats["failed"] += len(batch)
+                log.error(f"操作日志写入任务异常: {e}")
+                if stopping:
+                    return
+
+    @classmethod
+    async def _flush(cls, records: list[dict]) -> None:
+        """
+        解析并批量写入日志记录，失败时记录错误，不影响后续批次。
+
+        参数:
+        - records (list[dict]): 原始日志记录。
+        """
+        start = time.perf_counter()
+        rows = []
+        for record in records:
+            try:
+                rows.append(await cls._build(record))
+            except ValidationError as e:
+                cls._stats["failed"] += 1
+                log.error(f"操作日志数据不合法: {e}")
+        if not rows:
+            return
+        try:
+            async with async_db_session() as session:
+                async with session.begin():
+                    await OperationLogCRUD(AuthSchema(db=session)).create_many(rows=rows)
+            cls._stats["written"] += len(rows)
+        except Exception as e:
+            cls._stats["failed"] += len(rows)
+            log.error(f"批量写入操作日志失败: {e}")
+        elapsed = round((time.perf_counter() - start) * 1000, 3)
+        cls._stats["batches"] += 1
+        cls._stats["last_flush_ms"] = elapsed
+        cls._stats["max_flush_ms"] = max(cls._stats["max_flush_ms"], elapsed)
+
+    @staticmethod
+    async def _build(record: dict) -> OperationLogCreateSchema:
+        """
+        由原始记录构造日志创建模型（解析UA与IP归属地）。
+
+        参数:
+        - record (dict): 原始日志记录。
+
+        返回:
+        - OperationLogCreateSchema: 日志创建模型。
+        """
+        data = dict(record)
+        user_agent = UserAgentUtil.parse(data.pop("user_agent", None))
+        request_ip = data.get("request_ip")
+        return OperationLogCreateSchema(
+            **data,
+            login_location=await IpLocalUtil.get_ip_location(request_ip) if request_ip else None,
+            request_os=user_agent.os,
+            request_browser=user_agent.browser,
+        )
@@ -1,14 +1,20 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
-from sqlalchemy import and_, or_, select
+from redis.asyncio.client import Redis
+from sqlalchemy import or_, select
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql.elements import ColumnElement
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.api.v1.module_system.dept.model import DeptModel
 from app.api.v1.module_system.user.model import UserModel
+from app.common.enums import RedisInitKeyConfig
 from app.config.setting import settings
-from app.utils.common_util import get_child_id_map, get_child_recursion
+from app.core.redis_crud import RedisCURD
 
 
 class Permission:
@@ -27,6 +33,11 @@ class Permission:
     DATA_SCOPE_ALL = 5  # 全部数据
     DATA_SCOPE_CUSTOM = 6  # 自定义数据
 
+    # 跨请求数据范围缓存: {(范围, 版本号, *键): (过期时间, ID集合)}
+    _scope_cache: ClassVar[OrderedDict[tuple, tuple[float, frozenset[int]]]] = OrderedDict()
+    # 支持跨请求缓存的数据范围，版本号保存在 Redis 中，变更时递增，所有进程中旧版本的缓存随之失效
+    _scopes: ClassVar[tuple[str, ...]] = ("dept",)
+
     def __init__(self, model: Any, auth: AuthSchema, operation_type: str = "read") -> None:
         """
         初始化权限过滤器实例
@@ -41,6 +52,87 @@ class Permission:
         self.operation_type = operation_type
         self.conditions: list[ColumnElement] = []  # 权限条件列表
 
+    @staticmethod
+    def _version_key(scope: str) -> str:
+        """数据范围版本号的 Redis 键名"""
+        return f"{RedisInitKeyConfig.DATA_SCOPE_VERSION.key}:{scope}"
+
+    @classmethod
+    async def load_versions(cls, redis: Redis) -> dict[str, int]:
+        """
+        读取数据范围版本号，每个请求在认证时调用一次
+
+        Args:
+            redis: Redis连接
+
+        Returns:
+            {范围: 版本号}，读取失败时为空字典（仅使用请求内缓存）
+        """
+        if settings.DATA_SCOPE_CACHE_SECONDS <= 0:
+            return {}
+        values = await RedisCURD(redis).mget([cls._version_key(scope) for scope in cls._scopes])
+        if len(values) != len(cls._scopes):
+            return {}
+        return {scope: int(value or 0) for scope, value in zip(cls._scopes, values, strict=True)}
+
+    @classmethod
+    async def invalidate_cache(cls, redis: Redis, *scopes: str) -> None:
+        """
+        使数据权限范围缓存失效，应通过 after_commit 在部门变更的事务提交后调用
+
+        Args:
+            redis: Redis连接
+            scopes: 失效的范围 ("dept")，未提供时全部失效
+        """
+        targets = scopes or cls._scopes
+        for scope in targets:
+            await RedisCURD(redis).incr(cls._version_key(scope))
+        for key in [key for key in cls._scope_cache if key[0] in targets]:
+            cls._scope_cache.pop(key, None)
+
+    async def _cached_scope(
+        self,
+        scope: str,
+        key: tuple,
+        loader: Callable[[], Awaitable[frozenset[int]]],
+    ) -> frozenset[int]:
+        """
+        读取数据范围缓存，依次命中请求内缓存、跨请求缓存，均未命中时调用 loader 加载；
+        未读取到版本号时（如后台任务构造的认证对象）仅使用请求内缓存
+
+        Args:
+            scope: 范围名称 ("dept")
+            key: 范围内的缓存键
+            loader: 加载函数，返回ID集合
+
+        Returns:
+            ID集合
+        """
+        version = self.auth._scope_versions.get(scope)
+        cache_key = (scope, version, *key)
+        request_cache = self.auth._scope_cache
+        if cache_key in request_cache:
+            return request_cache[cache_key]
+
+        ttl = settings.DATA_SCOPE_CACHE_SECONDS
+        now = time.monotonic()
+        entry = self._scope_cache.get(cache_key) if version is not None else None
+        if entry is not None and entry[0] > now:
+            self._scope_cache.move_to_end(cache_key)
+            value = entry[1]
+        else:
+            value = await loader()
+            if version is not None and ttl > 0:
+                self._scope_cache[cache_key] = (now + ttl, value)
+                self._scope_cache.move_to_end(cache_key)
+                while len(self._scope_cache) > settings.DATA_SCOPE_CACHE_MAXSIZE:
+                    self._scope_cache.popitem(last=False)
+            else:
+                self._scope_cache.pop(cache_key, None)
+
+        request_cache[cache_key] = value
+        return value
+
     async def filter_query(self, query: Any) -> Any:
         """
         异步过滤查询对象
@@ -92,11 +184,11 @@ class Permission:
             # 既没有租户字段也没有创建者字段，不需要权限过滤
             return None
 
-        # 2. 获取用户可访问的租户ID列表
-        accessible_tenant_ids = await self._get_accessible_tenants()
+        # 2. 获取用户可访问的租户条件
+        tenant_condition = self._get_tenant_condition() if has_tenant_field else None
 
-        # 3. 获取分享给用户租户的资源ID列表
-        shared_resource_ids = await self._get_shared_resources()
+        # 3. 获取分享给用户租户的资源条件
+        share_condition = self._get_share_condition()
 
         # 4. 获取部门权限条件（原有逻辑）
         dept_condition = await self._get_dept_permission_condition()
@@ -105,16 +197,12 @@ class Permission:
         conditions = []
 
         # 条件A: 本租户数据
-        if has_tenant_field and accessible_tenant_ids:
-            conditions.append(
-                self.model.tenant_id.in_(list(accessible_tenant_ids))
-            )
+        if tenant_condition is not None:
+            conditions.append(tenant_condition)
 
         # 条件B: 分享的数据（跨租户访问通道）
-        if shared_resource_ids:
-            conditions.append(
-                self.model.id.in_(list(shared_resource_ids))
-            )
+        if share_condition is not None:
+            conditions.append(share_condition)
 
         # 条件C: 部门权限（原有逻辑，适配新的 data_scope 值）
         if dept_condition is not None:
@@ -127,55 +215,46 @@ class Permission:
         # 默认：无权限
         return self.model.id == -1
 
-    async def _get_accessible_tenants(self) -> set[int]:
+    def _get_tenant_condition(self) -> ColumnElement | None:
         """
-        获取用户可访问的租户ID列表
+        获取用户可访问的租户条件
 
         基于角色的 data_scope 设置：
-        - DATA_SCOPE_ALL (5): 返回所有租户ID
-        - DATA_SCOPE_TENANT (4): 返回用户所在租户ID
-        - 其他 (1/2/3/6): 默认返回用户所在租户ID
+        - DATA_SCOPE_ALL (5): 所有启用的租户（EXISTS 子查询，由数据库完成过滤）
+        - DATA_SCOPE_TENANT (4): 用户所在租户
+        - 其他 (1/2/3/6): 默认用户所在租户
         """
-        tenant_ids = set()
-
         # 获取用户所在租户
         user_tenant_id = getattr(self.auth.user, "tenant_id", None)
 
         if not user_tenant_id:
-            # 用户没有关联租户，返回空集合（无权限）
-            return tenant_ids
-
-        # 获取用户的所有角色
-        roles = getattr(self.auth.user, "roles", []) or []
-        if not roles:
-            # 用户没有角色，默认只能访问本租户
-            return {user_tenant_id}
+            # 用户没有关联租户，无租户权限
+            return None
 
         # 收集所有角色的 data_scope
-        data_scopes = set()
-        for role in roles:
-            data_scopes.add(role.data_scope)
+        roles = getattr(self.auth.user, "roles", []) or []
+        data_scopes = {role.data_scope for role in roles}
 
         # 优先级处理
         if self.DATA_SCOPE_ALL in data_scopes:
-            # 全部数据权限：返回所有租户ID
+            # 全部数据权限：数据所属租户为任一启用租户
             from app.api.v1.module_system.tenant.model import TenantModel
 
-            sql = select(TenantModel.id).where(TenantModel.is_active == True)
-            result = await self.auth.db.execute(sql)
-            return set(result.scalars().all())
-
-        # 本租户数据权限或其他权限
-        # 默认返回用户所在租户
-        tenant_ids.add(user_tenant_id)
+            tenant = aliased(TenantModel)
+            return (
+                select(tenant.id)
+                .where(tenant.id == self.model.tenant_id, tenant.is_active.is_(True))
+                .exists()
+            )
 
-        return tenant_ids
+        # 本租户数据权限或其他权限（含无角色）：默认用户所在租户
+        return self.model.tenant_id == user_tenant_id
 
-    async def _get_shared_resources(self) -> set[int]:
+    def _get_share_condition(self) -> ColumnElement | None:
         """
-        获取分享给用户租户的资源ID列表
+        获取分享给用户租户的资源条件
 
-        返回分享给用户租户、且在有效期内、且状态为生效的资源ID
+        以关联 sys_data_share 的 EXISTS 子查询表示：分享给用户租户、且在有效期内、且状态为生效
         根据 operation_type 和 share_type 过滤：
         - read: 包含 share_type=1 和 share_type=2
         - update: 仅包含 share_type=2
@@ -185,38 +264,31 @@ class Permission:
 
         user_tenant_id = getattr(self.auth.user, "tenant_id", None)
         if not user_tenant_id:
-            return set()
-
-        # 删除操作不包含分享数据
-        if self.operation_type == "delete":
-            return set()
+            return None
 
-        # 根据操作类型确定允许的分享类型
+        # 根据操作类型确定允许的分享类型，删除操作不包含分享数据
         if self.operation_type == "read":
             allowed_share_types = [1, 2]  # 仅查看 + 查看和编辑
         elif self.operation_type == "update":
             allowed_share_types = [2]  # 仅查看和编辑
         else:
-            return set()
-
-        # 查询分享记录
-        now = datetime.now()
-        sql = select(DataShareModel.resource_id).where(
-            and_(
-                DataShareModel.target_tenant_id == user_tenant_id,
-                DataShareModel.resource_type == self.model.__tablename__,
-                DataShareModel.status == "0",  # 生效状态
-                DataShareModel.share_type.in_(allowed_share_types),
-                (
-                    (DataShareModel.expire_time.is_(None))
-                    | (DataShareModel.expire_time > now)
-                ),
+            return None
+
+        # 使用别名，避免过滤分享表自身时子查询被错误关联；字段顺序与 ix_sys_data_share_target 一致
+        share = aliased(DataShareModel)
+        return (
+            select(share.id)
+            .where(
+                share.target_tenant_id == user_tenant_id,
+                share.resource_type == self.model.__tablename__,
+                share.resource_id == self.model.id,
+                share.status == "0",  # 生效状态
+                share.share_type.in_(allowed_share_types),
+                or_(share.expire_time.is_(None), share.expire_time > datetime.now()),
             )
+            .exists()
         )
 
-        result = await self.auth.db.execute(sql)
-        return set(result.scalars().all())
-
     async def _get_dept_permission_condition(self) -> ColumnElement | None:
         """
         获取部门权限条件（适配新的 data_scope 值）
@@ -229,13 +301,37 @@ class Permission:
         if not hasattr(self.model, "created_id"):
             return None
 
+        accessible_dept_ids = await self._resolve_dept_scope()
+        if accessible_dept_ids is None:
+            return None
+
+        # 如果有部门权限（2、3、6任一），使用部门过滤
+        if accessible_dept_ids:
+            # 优先使用冗余的创建部门字段（单表索引过滤，无需关联用户表）
+            created_dept_attr = getattr(self.model, "created_dept_id", None)
+            if created_dept_attr is not None:
+                return created_dept_attr.in_(sorted(accessible_dept_ids))
+            creator_rel = getattr(self.model, "created_by", None)
+            # 优先使用关系过滤（性能更好）
+            if creator_rel is not None and hasattr(UserModel, "dept_id"):
+                return creator_rel.has(UserModel.dept_id.in_(list(accessible_dept_ids)))
+
+        # 仅本人数据权限（1）、无角色或没有任何有效权限范围时，只能查看自己的数据
+        return self.model.created_id == self.auth.user.id
+
+    async def _resolve_dept_scope(self) -> frozenset[int] | None:
+        """
+        解析用户角色的部门数据范围
+
+        Returns:
+            None 表示不按部门限制（5-全部、4-本租户）；
+            部门ID集合表示按创建人部门过滤（2、3、6的并集）；
+            空集合表示只能访问本人创建的数据（1-仅本人、无角色或无有效范围）
+        """
         # 如果用户没有角色，只能查看自己的数据
         roles = getattr(self.auth.user, "roles", []) or []
         if not roles:
-            created_id_attr = getattr(self.model, "created_id", None)
-            if created_id_attr is not None:
-                return created_id_attr == self.auth.user.id
-            return None
+            return frozenset()
 
         # 获取用户所有角色的权限范围
         data_scopes = set()
@@ -270,38 +366,89 @@ class Permission:
         # 处理本部门及以下数据权限（3）
         if self.DATA_SCOPE_DEPT_AND_CHILD in data_scopes and user_dept_id is not None:
             try:
-                # 查询所有部门并递归获取子部门
-                dept_sql = select(DeptModel)
-                dept_result = await self.auth.db.execute(dept_sql)
-                dept_objs = dept_result.scalars().all()
-                id_map = get_child_id_map(dept_objs)
-                dept_with_children_ids = get_child_recursion(id=user_dept_id, id_map=id_map)
+                dept_with_children_ids = await self._cached_scope(
+                    "dept", (user_dept_id,), lambda: self._load_dept_children(user_dept_id)
+                )
                 accessible_dept_ids.update(dept_with_children_ids)
             except Exception:
                 # 查询失败时降级到本部门
                 accessible_dept_ids.add(user_dept_id)
 
-        # 如果有部门权限（2、3、6任一），使用部门过滤
-        if accessible_dept_ids:
-            creator_rel = getattr(self.model, "created_by", None)
-            # 优先使用关系过滤（性能更好）
-            if creator_rel is not None and hasattr(UserModel, "dept_id"):
-                return creator_rel.has(UserModel.dept_id.in_(list(accessible_dept_ids)))
-            # 降级方案：如果模型没有created_by关系但有created_id，则只能查看自己的数据
-            created_id_attr = getattr(self.model, "created_id", None)
-            if created_id_attr is not None:
-                return created_id_attr == self.auth.user.id
+        return frozenset(accessible_dept_ids)
+
+    async def row_filter(self) -> Callable[[dict[str, Any]], bool] | None:
+        """
+        获取与 filter_query 等价的行过滤函数，用于已不在数据库中的记录（如归档日志）
+
+        数据范围在此一次解析完成，返回的函数为同步函数，可在线程中逐行调用。
+        记录已不在表中，数据分享(sys_data_share)不再适用，仅按租户与部门/本人范围判断。
+
+        Returns:
+            判断单行是否可访问的函数，None 表示不限制
+        """
+        if not self.auth.user or not self.auth.check_data_scope or self.auth.user.is_superuser:
             return None
 
-        # 处理仅本人数据权限（1）
-        if self.DATA_SCOPE_SELF in data_scopes:
-            created_id_attr = getattr(self.model, "created_id", None)
-            if created_id_attr is not None:
-                return created_id_attr == self.auth.user.id
+        has_tenant_field = hasattr(self.model, "tenant_id")
+        has_created_id_field = hasattr(self.model, "created_id")
+        if not has_tenant_field and not has_created_id_field:
             return None
 
-        # 默认情况：如果用户有角色但没有任何有效权限范围，只能查看自己的数据
-        created_id_attr = getattr(self.model, "created_id", None)
-        if created_id_attr is not None:
-            return created_id_attr == self.auth.user.id
-        return None
+        checks: list[Callable[[dict[str, Any]], bool]] = []
+
+        # 条件A: 本租户数据
+        user_tenant_id = getattr(self.auth.user, "tenant_id", None)
+        if has_tenant_field and user_tenant_id:
+            roles = getattr(self.auth.user, "roles", []) or []
+            if self.DATA_SCOPE_ALL in {role.data_scope for role in roles}:
+                from app.api.v1.module_system.tenant.model import TenantModel
+
+                result = await self.auth.db.execute(
+                    select(TenantModel.id).where(TenantModel.is_active.is_(True))
+                )
+                tenant_ids = frozenset(result.scalars().all())
+            else:
+                tenant_ids = frozenset({user_tenant_id})
+            checks.append(lambda row: row.get("tenant_id") in tenant_ids)
+
+        # 条件C: 部门权限
+        accessible_dept_ids = await self._resolve_dept_scope() if has_created_id_field else None
+        if accessible_dept_ids is not None:
+            if accessible_dept_ids and hasattr(self.model, "created_dept_id"):
+                checks.append(lambda row: row.get("created_dept_id") in accessible_dept_ids)
+            elif accessible_dept_ids and hasattr(self.model, "created_by"):
+                # 与 created_by 关系过滤一致，按创建人当前所在部门判断
+                result = await self.auth.db.execute(
+                    select(UserModel.id).where(UserModel.dept_id.in_(sorted(accessible_dept_ids)))
+                )
+                creator_ids = frozenset(result.scalars().all())
+                checks.append(lambda row: row.get("created_id") in creator_ids)
+            else:
+                user_id = self.auth.user.id
+                checks.append(lambda row: row.get("created_id") == user_id)
+
+        if not checks:
+            # 默认：无权限
+            return lambda row: False
+        return lambda row: any(check(row) for check in checks)
+
+    async def _load_dept_children(self, dept_id: int) -> frozenset[int]:
+        """
+        查询部门及其所有子部门ID
+
+        Args:
+            dept_id: 部门ID
+
+        Returns:
+            部门ID集合
+        """
+        # 按物化路径前缀匹配子部门，无需加载整棵部门树
+        path_sql = select(DeptModel.tree_path).where(DeptModel.id == dept_id)
+        tree_path = (await self.auth.db.execute(path_sql)).scalar()
+        if tree_path is None:
+            return frozenset({dept_id})
+        dept_sql = select(DeptModel.id).where(
+            or_(DeptModel.id == dept_id, DeptModel.tree_path.like(f"{tree_path}{dept_id}/%"))
+        )
+        dept_result = await self.auth.db.execute(dept_sql)
+        return frozenset(dept_result.scalars().all())
@@ -0,0 +1,308 @@
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, ClassVar
+
+from redis.asyncio.client import Redis
+from sqlalchemy import DateTime, select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.module_system.dept.model import DeptModel
+from app.api.v1.module_system.menu.model import MenuModel
+from app.api.v1.module_system.position.model import PositionModel
+from app.api.v1.module_system.role.model import RoleDeptsModel, RoleMenusModel, RoleModel
+from app.api.v1.module_system.user.model import UserModel, UserPositionsModel, UserRolesModel
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.redis_crud import RedisCURD
+
+
+class PrincipalCache:
+    """
+    登录用户权限快照缓存
+
+    将当前用户、角色（含自定义数据权限部门）与岗位压缩为可序列化的快照，
+    按 会话ID + 版本号 缓存在 Redis 与进程内 LRU 中，命中时无需任何 SQL；
+    权限标识由 RolePermissionIndex 按角色合并得到。
+    用户、角色、菜单、部门、岗位变更后调用 invalidate 递增全局版本号，使所有快照与角色权限索引失效；
+    应通过 after_commit 在事务提交后调用，否则并发请求可能在提交前读到旧数据并以新版本号缓存。
+
+    快照还原为不绑定会话的 UserModel/RoleModel 对象，仅包含列字段与 roles/depts/positions，
+    需要完整关联数据时应重新查询。
+    """
+
+    # 进程内快照缓存: {(会话ID, 版本号): (过期时间, 快照)}
+    _local: ClassVar[OrderedDict[tuple[str, int], tuple[float, dict]]] = OrderedDict()
+
+    @classmethod
+    async def get(
+        cls, db: AsyncSession, redis: Redis, session_id: str, username: str
+    ) -> tuple[UserModel, frozenset[str]] | None:
+        """
+        获取登录用户及其权限标识集合
+
+        参数:
+        - db (AsyncSession): 数据库会话，仅在缓存未命中时使用
+        - redis (Redis): Redis连接
+        - session_id (str): 会话ID
+        - username (str): 用户名
+
+        返回:
+        - tuple[UserModel, frozenset[str]] | None: (用户对象, 权限标识集合)，用户不存在时返回None
+        """
+        ttl = settings.PRINCIPAL_CACHE_SECONDS
+        if ttl <= 0:
+            snapshot = await cls._load(db=db, username=username)
+            return await cls._resolve(db=db, version=None, snapshot=snapshot) if snapshot else None
+
+        cache_key = f"{RedisInitKeyConfig.PRINCIPAL.key}:{session_id}"
+        values = await RedisCURD(redis).mget([RedisInitKeyConfig.PRINCIPAL_VERSION.key, cache_key])
+        version_raw, cached = values if len(values) == 2 else (None, None)
+        version = int(version_raw or 0)
+
+        now = time.monotonic()
+        local_key = (session_id, version)
+        entry = cls._local.get(local_key)
+        if entry is not None and entry[0] > now and entry[1]["user"]["username"] == username:
+            cls._local.move_to_end(local_key)
+            return await cls._resolve(db=db, version=version, snapshot=entry[1])
+
+        snapshot = json.loads(cached) if cached else None
+        if (
+            not snapshot
+            or snapshot.get("version") != version
+            or snapshot["user"]["username"] != username
+        ):
+            snapshot = await cls._load(db=db, username=username)
+            if not snapshot:
+                return None
+            snapshot["version"] = version
+            await RedisCURD(redis).set(key=cache_key, value=snapshot, expire=ttl)
+
+        cls._local[local_key] = (now + ttl, snapshot)
+        cls._local.move_to_end(local_key)
+        while len(cls._local) > settings.PRINCIPAL_CACHE_MAXSIZE:
+            cls._local.popitem(last=False)
+        return await cls._resolve(db=db, version=version, snapshot=snapshot)
+
+    @classmethod
+    async def invalidate(cls, redis: Redis) -> None:
+        """
+        使所有登录用户权限快照失效，在用户、角色、菜单、部门、岗位变更的事务提交后调用
+
+        参数:
+        - redis (Redis): Redis连接
+        """
+        await RedisCURD(redis).incr(RedisInitKeyConfig.PRINCIPAL_VERSION.key)
+        cls._local.clear()
+        RolePermissionIndex.clear()
+
+    @classmethod
+    async def _resolve(
+        cls, db: AsyncSession, version: int | None, snapshot: dict
+    ) -> tuple[UserModel, frozenset[str]]:
+        """
+        由快照构造用户对象，并合并其启用角色的权限标识
+
+        参数:
+        - db (AsyncSession): 数据库会话，仅在角色权限索引未命中时使用
+        - version (int | None): 权限版本号，None 表示不使用缓存
+        - snapshot (dict): 权限快照
+
+        返回:
+        - tuple[UserModel, frozenset[str]]: (用户对象, 权限标识集合)
+        """
+        index = await RolePermissionIndex.get(db=db, version=version)
+        role_ids = [role["id"] for role in snapshot["roles"] if role["status"] == "0"]
+        return cls._build(snapshot), RolePermissionIndex.union(index, role_ids)
+
+    @classmethod
+    async def _load(cls, db: AsyncSession, username: str) -> dict | None:
+        """
+        从数据库加载权限快照（仅查询列字段，不触发关系的级联加载）
+
+        参数:
+        - db (AsyncSession): 数据库会话
+        - username (str): 用户名
+
+        返回:
+        - dict | None: 权限快照，用户不存在时返回None
+        """
+        users = await cls._rows(db, UserModel, UserModel.username == username)
+        if not users:
+            return None
+        user = users[0]
+        user.pop("password", None)
+
+        roles = await cls._rows(
+            db,
+            RoleModel,
+            RoleModel.id.in_(
+                select(UserRolesModel.role_id).where(UserRolesModel.user_id == user["id"])
+            ),
+        )
+        role_ids = [role["id"] for role in roles]
+        role_depts: dict[int, list[int]] = {}
+        if role_ids:
+            result = await db.execute(
+                select(RoleDeptsModel.role_id, RoleDeptsModel.dept_id).where(
+                    RoleDeptsModel.role_id.in_(role_ids)
+                )
+            )
+            for row in result.all():
+                role_depts.setdefault(row.role_id, []).append(row.dept_id)
+
+        for role in roles:
+            role["dept_ids"] = role_depts.get(role["id"], [])
+
+        positions = await cls._rows(
+            db,
+            PositionModel,
+            PositionModel.id.in_(
+                select(UserPositionsModel.position_id).where(
+                    UserPositionsModel.user_id == user["id"]
+                )
+            ),
+        )
+        return {"user": user, "roles": roles, "positions": positions}
+
+    @staticmethod
+    async def _rows(db: AsyncSession, model: Any, *conditions: Any) -> list[dict]:
+        """
+        查询模型的列字段，日期时间转为ISO字符串以便序列化
+
+        参数:
+        - db (AsyncSession): 数据库会话
+        - model (Any): 模型类
+        - conditions (Any): 查询条件
+
+        返回:
+        - list[dict]: 列字段字典列表
+        """
+        keys = [attr.key for attr in sa_inspect(model).column_attrs]
+        result = await db.execute(select(*[getattr(model, key) for key in keys]).where(*conditions))
+        return [
+            {
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in row._mapping.items()
+            }
+            for row in result.all()
+        ]
+
+    @staticmethod
+    def _columns(model: Any, data: dict) -> dict:
+        """
+        将快照中的列字段还原为模型属性值
+
+        参数:
+        - model (Any): 模型类
+        - data (dict): 列字段字典
+
+        返回:
+        - dict: 可用于构造模型对象的属性字典
+        """
+        columns = sa_inspect(model).columns
+        values = {}
+        for key, value in data.items():
+            if key not in columns:
+                continue
+            if isinstance(value, str) and isinstance(columns[key].type, DateTime):
+                value = datetime.fromisoformat(value)
+            values[key] = value
+        return values
+
+    @classmethod
+    def _build(cls, snapshot: dict) -> UserModel:
+        """
+        由快照构造不绑定会话的用户对象
+
+        参数:
+        - snapshot (dict): 权限快照
+
+        返回:
+        - UserModel: 用户对象
+        """
+        user = UserModel(**cls._columns(UserModel, snapshot["user"]))
+        user.roles = [
+            RoleModel(
+                **cls._columns(RoleModel, role),
+                depts=[DeptModel(id=dept_id) for dept_id in role["dept_ids"]],
+            )
+            for role in snapshot["roles"]
+        ]
+        user.positions = [
+            PositionModel(**cls._columns(PositionModel, position))
+            for position in snapshot["positions"]
+        ]
+        return user
+
+
+class RolePermissionIndex:
+    """
+    角色权限索引
+
+    一次查询出所有 启用菜单 的权限标识，按角色预编译为 frozenset 并缓存在进程内，
+    鉴权时只需合并当前用户启用角色的集合。索引随全局权限版本号刷新，
+    sys_role_menus、sys_menu 变更时由 PrincipalCache.invalidate 统一失效。
+    """
+
+    # 进程内索引: (版本号, 过期时间, {角色ID: 权限标识集合})
+    _index: ClassVar[tuple[int, float, dict[int, frozenset[str]]] | None] = None
+
+    @classmethod
+    async def get(cls, db: AsyncSession, version: int | None) -> dict[int, frozenset[str]]:
+        """
+        获取角色权限索引
+
+        参数:
+        - db (AsyncSession): 数据库会话，仅在索引未命中时使用
+        - version (int | None): 权限版本号，None 表示不使用缓存
+
+        返回:
+        - dict[int, frozenset[str]]: {角色ID: 权限标识集合}
+        """
+        now = time.monotonic()
+        cached = cls._index
+        if version is not None and cached and cached[0] == version and cached[1] > now:
+            return cached[2]
+
+        result = await db.execute(
+            select(RoleMenusModel.role_id, MenuModel.permission)
+            .join(MenuModel, RoleMenusModel.menu_id == MenuModel.id)
+            .where(
+                MenuModel.status == "0",
+                MenuModel.permission.is_not(None),
+                MenuModel.permission != "",
+            )
+        )
+        grouped: dict[int, set[str]] = {}
+        for row in result.all():
+            grouped.setdefault(row.role_id, set()).add(row.permission)
+        index = {role_id: frozenset(perms) for role_id, perms in grouped.items()}
+
+        if version is not None:
+            cls._index = (version, now + settings.PRINCIPAL_CACHE_SECONDS, index)
+        return index
+
+    @staticmethod
+    def union(index: dict[int, frozenset[str]], role_ids: list[int]) -> frozenset[str]:
+        """
+        合并多个角色的权限标识
+
+        参数:
+        - index (dict[int, frozenset[str]]): 角色权限索引
+        - role_ids (list[int]): 角色ID列表
+
+        返回:
+        - frozenset[str]: 权限标识集合
+        """
+        if len(role_ids) == 1:
+            return index.get(role_ids[0], frozenset())
+        return frozenset().union(*(index.get(role_id, frozenset()) for role_id in role_ids))
+
+    @classmethod
+    def clear(cls) -> None:
+        """清空进程内索引"""
+        cls._index = None
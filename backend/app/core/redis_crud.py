@@ -1,9 +1,10 @@
 import json
-from collections.abc import Awaitable
+from collections.abc import AsyncIterator, Awaitable
 from typing import Any
 
 from redis.asyncio.client import Redis
 
+from app.config.setting import settings
 from app.core.logger import log
 
 
@@ -23,6 +24,8 @@ class RedisCURD:
         返回:
         - list: 返回缓存值列表,如果获取失败则返回空列表
         """
+        if not keys:
+            return []
         try:
             data = await self.redis.mget(*[str(key) for key in keys])
             return data
@@ -30,22 +33,68 @@ class RedisCURD:
             log.error(f"批量获取缓存失败: {e!s}")
             return []
 
-    async def get_keys(self, pattern: str = "*") -> list:
+    async def scan_iter(self, pattern: str = "*", count: int | None = None) -> AsyncIterator[str]:
+        """增量遍历缓存键名(SCAN)，不会像 KEYS 一样阻塞 Redis
+
+        参数:
+        - pattern (str, optional): 匹配模式,默认值为"*"。
+        - count (int | None, optional): 每次 SCAN 的 COUNT 提示,默认使用 REDIS_SCAN_COUNT。
+
+        返回:
+        - AsyncIterator[str]: 键名异步迭代器,遍历期间变更的键可能重复返回或遗漏
+        """
+        async for key in self.redis.scan_iter(
+            match=pattern, count=count or settings.REDIS_SCAN_COUNT
+        ):
+            yield key
+
+    async def get_keys(self, pattern: str = "*", count: int | None = None) -> list:
         """获取缓存键名
 
         参数:
         - pattern (str, optional): 匹配模式,默认值为"*"。
+        - count (int | None, optional): 每次 SCAN 的 COUNT 提示,默认使用 REDIS_SCAN_COUNT。
 
         返回:
-        - list: 返回匹配的缓存键名列表,如果获取失败则返回空列表
+        - list: 返回匹配的缓存键名列表(已去重),如果获取失败则返回空列表
         """
         try:
-            keys = await self.redis.keys(f"{pattern}")
-            return keys
+            keys: dict[str, None] = {}
+            async for key in self.scan_iter(pattern, count):
+                keys[key] = None
+            return list(keys)
         except Exception as e:
             log.error(f"获取缓存键名失败: {e!s}")
             return []
 
+    async def delete_by_pattern(
+        self, pattern: str, count: int | None = None, batch_size: int | None = None
+    ) -> int:
+        """按匹配模式删除缓存，边 SCAN 边分批 UNLINK，内存回收由 Redis 后台完成
+
+        参数:
+        - pattern (str): 匹配模式。
+        - count (int | None, optional): 每次 SCAN 的 COUNT 提示,默认使用 REDIS_SCAN_COUNT。
+        - batch_size (int | None, optional): 每批 UNLINK 的键数,默认使用 REDIS_DELETE_BATCH_SIZE。
+
+        返回:
+        - int: 删除的键数
+
+        异常:
+        - RedisError: 遍历或删除失败时抛出
+        """
+        batch_size = max(batch_size or settings.REDIS_DELETE_BATCH_SIZE, 1)
+        deleted = 0
+        batch: list[str] = []
+        async for key in self.scan_iter(pattern, count):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await self.redis.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await self.redis.unlink(*batch)
+        return deleted
+
     async def get(self, key: str) -> Any:
         """获取缓存
 
@@ -191,9 +240,7 @@ class RedisCURD:
         - bool: 如果清空缓存成功则返回True,否则返回False
         """
         try:
-            keys = await self.redis.keys(f"{pattern}")
-            if keys:
-                await self.redis.delete(*keys)
+            await self.delete_by_pattern(pattern)
             return True
         except Exception as e:
             log.error(f"清空缓存失败: {e!s}")
@@ -255,6 +302,62 @@ class RedisCURD:
             log.error(f"续约分布式锁失败: {e!s}")
             return False
 
+    async def touch_session(
+        self,
+        access_key: str,
+        refresh_key: str,
+        access_expire: int,
+        refresh_expire: int,
+        renew_below: int | None = None,
+        expire_index: tuple[str, str] | None = None,
+    ) -> bool:
+        """校验会话是否在线并按需滑动续期（一次往返）
+
+        参数:
+        - access_key (str): access_token 键名
+        - refresh_key (str): refresh_token 键名
+        - access_expire (int): access_token 续期后的过期时间,单位为秒
+        - refresh_expire (int): refresh_token 续期后的过期时间,单位为秒
+        - renew_below (int | None, optional): 剩余有效期低于该秒数时才续期,None 表示不续期。
+        - expire_index (tuple[str, str] | None, optional): (过期索引键名, 会话ID),续期时同步更新会话的过期时间。
+
+        返回:
+        - bool: 会话在线返回True,否则返回False
+        """
+        try:
+            # 使用Lua脚本确保原子性校验和续期
+            script = """
+            local ttl = redis.call('ttl', KEYS[1])
+            if ttl == -2 then
+                return 0
+            end
+            if ARGV[3] ~= '' and ttl >= 0 and ttl < tonumber(ARGV[3]) then
+                redis.call('expire', KEYS[1], ARGV[1])
+                redis.call('expire', KEYS[2], ARGV[2])
+                if KEYS[3] then
+                    local now = redis.call('time')
+                    redis.call('zadd', KEYS[3], 'XX', tonumber(now[1]) + tonumber(ARGV[1]), ARGV[4])
+                end
+            end
+            return 1
+            """
+            keys = [access_key, refresh_key]
+            args = [
+                str(access_expire),
+                str(refresh_expire),
+                "" if renew_below is None else str(renew_below),
+            ]
+            if expire_index:
+                keys.append(expire_index[0])
+                args.append(expire_index[1])
+            result = await self.redis.eval(  # pyright: ignore[reportGeneralTypeIssues]
+                script, len(keys), *keys, *args
+            )
+            return result == 1
+        except Exception as e:
+            log.error(f"校验会话失败: {e!s}")
+            return False
+
     async def expire(self, key: str, expire: int) -> bool:
         """设置缓存过期时间
 
@@ -271,6 +374,22 @@ class RedisCURD:
             log.error(f"设置缓存过期时间失败: {e!s}")
             return False
 
+    async def incr(self, key: str, amount: int = 1) -> int | None:
+        """递增计数器
+
+        参数:
+        - key (str): 缓存键名
+        - amount (int, optional): 递增步长,默认值为1。
+
+        返回:
+        - int | None: 递增后的值,如果递增失败则返回None
+        """
+        try:
+            return await self.redis.incr(f"{key}", amount)
+        except Exception as e:
+            log.error(f"递增计数器失败: {e!s}")
+            return None
+
     async def info(self) -> dict:
         """获取缓存信息
 
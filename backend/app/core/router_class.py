@@ -1,18 +1,18 @@
+import hashlib
 import json
+import random
 import time
 from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import Any
 
 from fastapi import Request, Response
 from fastapi.routing import APIRoute
-from user_agents import parse
+from starlette.datastructures import UploadFile
 
-from app.api.v1.module_system.auth.schema import AuthSchema
-from app.api.v1.module_system.log.schema import OperationLogCreateSchema
-from app.api.v1.module_system.log.service import OperationLogService
 from app.config.setting import settings
-from app.core.database import async_db_session
-from app.utils.ip_local_util import IpLocalUtil
+from app.core.log_writer import OperationLogWriter
 
 """
 在 FastAPI 中，route_class 参数用于自定义路由的行为。
@@ -21,6 +21,139 @@ from app.utils.ip_local_util import IpLocalUtil
 """
 
 
+@dataclass(frozen=True)
+class CapturePolicy:
+    """操作日志请求/响应内容记录策略"""
+
+    request_max_bytes: int = 2000  # 请求内容最多记录的字节数
+    response_max_bytes: int = 2000  # 响应内容最多记录的字节数
+    skip_binary: bool = True  # 非文本内容只记录类型和大小
+    sample_rate: float = 1.0  # 记录内容的采样比例，未采样的日志只保留请求元信息
+    hash_only: bool = False  # 只记录内容的 sha256 摘要
+
+
+@lru_cache(maxsize=1024)
+def get_capture_policy(name: str, path: str, method: str) -> CapturePolicy:
+    """
+    获取路由的内容记录策略，规则优先级: 路由函数名 > 路由路径 > 请求方法 > 默认策略
+
+    参数:
+    - name (str): 路由函数名
+    - path (str): 路由路径
+    - method (str): 请求方法
+
+    返回:
+    - CapturePolicy: 内容记录策略
+    """
+    options = dict(settings.OPERATION_LOG_CAPTURE)
+    for key in (method, path, name):
+        options.update(settings.OPERATION_LOG_CAPTURE_RULES.get(key) or {})
+    allowed = {field.name for field in fields(CapturePolicy)}
+    return CapturePolicy(**{key: value for key, value in options.items() if key in allowed})
+
+
+def _is_text(content_type: str) -> bool:
+    """判断内容类型是否为文本"""
+    content_type = content_type.lower()
+    return content_type.startswith("text/") or "json" in content_type or "xml" in content_type
+
+
+def _encode(data: bytes, limit: int, policy: CapturePolicy, content_type: str) -> str:
+    """
+    按策略将内容转为日志文本（截断、摘要或二进制概要）
+
+    参数:
+    - data (bytes): 原始内容
+    - limit (int): 最多记录的字节数
+    - policy (CapturePolicy): 内容记录策略
+    - content_type (str): 内容类型
+
+    返回:
+    - str: 日志文本
+    """
+    if policy.hash_only:
+        return f"sha256:{hashlib.sha256(data).hexdigest()} ({len(data)} 字节)"
+    if policy.skip_binary and content_type and not _is_text(content_type):
+        return f"[{content_type.split(';')[0]} {len(data)} 字节]"
+    if len(data) <= limit:
+        return data.decode("utf-8", errors="ignore")
+    return (
+        data[: max(limit, 0)].decode("utf-8", errors="ignore") + f"...(已截断，共 {len(data)} 字节)"
+    )
+
+
+async def capture_request(request: Request, policy: CapturePolicy) -> str:
+    """
+    记录请求内容，只使用路由已读取的请求体与表单，不会为记录日志而缓冲整个上传内容
+
+    参数:
+    - request (Request): 请求对象
+    - policy (CapturePolicy): 内容记录策略
+
+    返回:
+    - str: 请求内容日志文本
+    """
+    content_type = request.headers.get("Content-Type", "")
+    content_length = request.headers.get("Content-Length")
+    limit = policy.request_max_bytes
+
+    if content_type.startswith(("multipart/form-data", "application/x-www-form-urlencoded")):
+        # 路由解析过的表单由 Starlette 缓存在 _form 中，上传文件只记录文件名、类型与大小
+        form = getattr(request, "_form", None)
+        if form is None:
+            return f"[{content_type.split(';')[0]} {content_length or '未知'} 字节]"
+        lines = []
+        for key, value in form.multi_items():
+            if isinstance(value, UploadFile):
+                lines.append(f"{key}: {value.filename} ({value.content_type}, {value.size} 字节)")
+            else:
+                lines.append(f"{key}: {value}")
+        return _encode("\n".join(lines).encode(), limit, policy, "text/plain")
+
+    # 路由未读取请求体时，仅在声明长度不超过上限时读取
+    body = getattr(request, "_body", None)
+    if body is None:
+        if not content_length or not content_length.isdigit():
+            body = b""
+        elif int(content_length) > limit:
+            return f"[{content_type.split(';')[0] or '请求体'} {content_length} 字节]"
+        else:
+            body = await request.body()
+
+    # 超长、摘要模式与非文本内容不再解析，直接按策略转换
+    if len(body) > limit or policy.hash_only or (content_type and not _is_text(content_type)):
+        return _encode(body, limit, policy, content_type)
+
+    oper_param: dict[str, Any] = {}
+    if body:
+        try:
+            oper_param["body"] = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            oper_param["body"] = body.decode("utf-8", errors="ignore")
+    if request.path_params:
+        oper_param["path_params"] = dict(request.path_params)
+    return json.dumps(oper_param, ensure_ascii=False)
+
+
+def capture_response(response: Response, policy: CapturePolicy) -> str:
+    """
+    记录响应内容，流式响应不读取响应体
+
+    参数:
+    - response (Response): 响应对象
+    - policy (CapturePolicy): 内容记录策略
+
+    返回:
+    - str: 响应内容日志文本
+    """
+    body = getattr(response, "body", None)
+    if not isinstance(body, (bytes, bytearray)):
+        return "{}"
+    return _encode(
+        bytes(body), policy.response_max_bytes, policy, response.headers.get("Content-Type", "")
+    )
+
+
 class OperationLogRoute(APIRoute):
     """操作日志路由装饰器"""
 
@@ -62,46 +195,13 @@ class OperationLogRoute(APIRoute):
             if route.name in settings.IGNORE_OPERATION_FUNCTION:
                 return response
 
-            user_agent = parse(request.headers.get("user-agent"))
-            payload = b"{}"
-            req_content_type = request.headers.get("Content-Type", "")
-
-            if req_content_type and (
-                req_content_type.startswith((
-                    "multipart/form-data",
-                    "application/x-www-form-urlencoded",
-                ))
-            ):
-                form_data = await request.form()
-                oper_param = "\n".join([f"{k}: {v}" for k, v in form_data.items()])
-                payload = oper_param  # 直接使用字符串格式的参数
+            # 按策略记录请求、响应内容
+            policy = get_capture_policy(route.name, route.path, request.method)
+            if policy.sample_rate >= 1 or random.random() < policy.sample_rate:
+                payload = await capture_request(request, policy)
+                response_data = capture_response(response, policy)
             else:
-                payload = await request.body()
-                path_params = request.path_params
-                oper_param = {}
-
-                # 处理请求体数据
-                if payload:
-                    try:
-                        oper_param["body"] = json.loads(payload.decode())
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        oper_param["body"] = payload.decode("utf-8", errors="ignore")
-
-                # 处理路径参数
-                if path_params:
-                    oper_param["path_params"] = dict(path_params)
-
-                payload = json.dumps(oper_param, ensure_ascii=False)
-
-                # 日志表请求参数字段长度最大为2000，因此在此处判断长度
-                if len(payload) > 2000:
-                    payload = "请求参数过长"
-
-            response_data = (
-                response.body
-                if "application/json" in response.headers.get("Content-Type", "")
-                else b"{}"
-            )
+                payload = response_data = "未采样"
             process_time = f"{(time.time() - start_time):.2f}s"
 
             # 获取当前用户ID,如果是登录接口则为空
@@ -123,8 +223,6 @@ class OperationLogRoute(APIRoute):
                 if request.client:
                     request_ip = request.client.host
 
-            login_location = await IpLocalUtil.get_ip_location(request_ip) if request_ip else None
-
             # 判断请求是否来自api文档
             referer = request.headers.get("referer")
             request_from_swagger = referer and referer.endswith("docs")
@@ -134,30 +232,21 @@ class OperationLogRoute(APIRoute):
                 # 如果请求来自api文档，则不记录日志
                 pass
             else:
-                async with async_db_session() as session:
-                    async with session.begin():
-                        auth = AuthSchema(db=session)
-                        await OperationLogService.create_log_service(
-                            data=OperationLogCreateSchema(
-                                type=log_type,
-                                request_path=request.url.path,
-                                request_method=request.method,
-                                request_payload=payload,
-                                request_ip=request_ip,
-                                login_location=login_location,
-                                request_os=user_agent.os.family,
-                                request_browser=user_agent.browser.family,
-                                response_code=response.status_code,
-                                response_json=response_data.decode()
-                                if isinstance(response_data, (bytes, bytearray))
-                                else str(response_data),
-                                process_time=process_time,
-                                description=route.summary,
-                                created_id=current_user_id,
-                                updated_id=current_user_id,
-                            ),
-                            auth=auth,
-                        )
+                # UA、IP归属地解析与入库由后台写入任务批量完成
+                await OperationLogWriter.submit({
+                    "type": log_type,
+                    "request_path": request.url.path,
+                    "request_method": request.method,
+                    "request_payload": payload,
+                    "request_ip": request_ip,
+                    "user_agent": request.headers.get("user-agent"),
+                    "response_code": response.status_code,
+                    "response_json": response_data,
+                    "process_time": process_time,
+                    "description": route.summary,
+                    "created_id": current_user_id,
+                    "updated_id": current_user_id,
+                })
 
             return response
 
@@ -1,3 +1,10 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+
 import jwt
 from fastapi import Form, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
@@ -146,3 +153,64 @@ def decode_access_token(token: str) -> JWTPayloadSchema:
 
     except jwt.InvalidTokenError:
         raise CustomException(msg="token已失效,请重新登录", code=10401, status_code=401)
+
+
+# 已校验令牌缓存: {令牌摘要: (过期时间戳, 载荷, 用户登录信息)}
+_VERIFIED_TOKENS: OrderedDict[str, tuple[float, JWTPayloadSchema, dict[str, Any]]] = OrderedDict()
+
+
+def parse_access_token(token: str) -> tuple[JWTPayloadSchema, dict[str, Any]]:
+    """
+    解析JWT访问令牌并解析登录信息，已校验的令牌在过期前直接命中缓存
+
+    参数:
+    - token (str): JWT访问令牌字符串。
+
+    返回:
+    - tuple[JWTPayloadSchema, dict[str, Any]]: (JWT有效载荷, 用户登录信息)，登录信息只读。
+
+    异常:
+    - CustomException: 解析失败时抛出,状态码为401。
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    cached = _VERIFIED_TOKENS.get(key)
+    if cached and cached[0] > time.time():
+        _VERIFIED_TOKENS.move_to_end(key)
+        return cached[1], cached[2]
+
+    payload = decode_access_token(token)
+    try:
+        user_info = json.loads(payload.sub)
+    except json.JSONDecodeError:
+        raise CustomException(msg="无效认证,请重新登录", code=10401, status_code=401)
+    if not isinstance(user_info, dict):
+        raise CustomException(msg="无效认证,请重新登录", code=10401, status_code=401)
+
+    if settings.TOKEN_CACHE_MAXSIZE > 0:
+        exp = payload.exp.timestamp() if isinstance(payload.exp, datetime) else payload.exp
+        _VERIFIED_TOKENS[key] = (exp, payload, user_info)
+        while len(_VERIFIED_TOKENS) > settings.TOKEN_CACHE_MAXSIZE:
+            _VERIFIED_TOKENS.popitem(last=False)
+    return payload, user_info
+
+
+def get_token_context(request: Request, token: str) -> tuple[JWTPayloadSchema, dict[str, Any]]:
+    """
+    获取当前请求的令牌上下文，优先复用 AuthContextMiddleware 已解析的结果
+
+    参数:
+    - request (Request): FastAPI请求对象。
+    - token (str): JWT访问令牌字符串。
+
+    返回:
+    - tuple[JWTPayloadSchema, dict[str, Any]]: (JWT有效载荷, 用户登录信息)。
+
+    异常:
+    - CustomException: 解析失败时抛出,状态码为401。
+    """
+    context = request.scope.get("token_context")
+    if context and context[0] == token:
+        return context[1], context[2]
+    payload, user_info = parse_access_token(token)
+    request.scope["token_context"] = (token, payload, user_info)
+    return payload, user_info
@@ -0,0 +1,259 @@
+import asyncio
+import ipaddress
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+from redis.asyncio.client import Redis
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.logger import log
+
+
+class IpMatcher:
+    """
+    IP匹配器
+
+    将IP与CIDR网段编译为按位前缀树(IPv4/IPv6各一棵)，
+    匹配时沿地址的二进制位下行，遇到任一网段终点即命中，耗时与名单长度无关。
+    """
+
+    _END = "end"
+
+    def __init__(self, entries: Iterable[str] = ()) -> None:
+        """
+        编译IP名单，忽略无法解析的条目。
+
+        参数:
+        - entries (Iterable[str]): IP或CIDR网段，如 127.0.0.1、10.0.0.0/8。
+        """
+        self._roots: dict[int, dict] = {4: {}, 6: {}}
+        self.size = 0
+        for entry in entries:
+            try:
+                network = ipaddress.ip_network(str(entry).strip(), strict=False)
+            except ValueError:
+                log.warning(f"忽略无法解析的IP名单条目: {entry}")
+                continue
+            node = self._roots[network.version]
+            bits = int(network.network_address)
+            for i in range(
+                network.max_prefixlen - 1, network.max_prefixlen - 1 - network.prefixlen, -1
+            ):
+                node = node.setdefault((bits >> i) & 1, {})
+            node[self._END] = True
+            self.size += 1
+
+    def match(self, ip: str | None) -> bool:
+        """
+        判断IP是否在名单内。
+
+        参数:
+        - ip (str | None): IP地址。
+
+        返回:
+        - bool: 命中返回True。
+        """
+        if not ip or not self.size:
+            return False
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+        node = self._roots[address.version]
+        bits = int(address)
+        for i in range(address.max_prefixlen - 1, -1, -1):
+            if self._END in node:
+                return True
+            node = node.get((bits >> i) & 1)
+            if node is None:
+                return False
+        return self._END in node
+
+
+class PathMatcher:
+    """
+    请求路径匹配器
+
+    精确路径放入集合，以 * 结尾的条目作为前缀匹配。
+    """
+
+    def __init__(self, entries: Iterable[str] = ()) -> None:
+        """
+        编译路径名单。
+
+        参数:
+        - entries (Iterable[str]): 路径，如 /api/v1/system/auth/login、/api/v1/common/*。
+        """
+        self._exact: set[str] = set()
+        prefixes = []
+        for entry in entries:
+            entry = str(entry).strip()
+            if entry.endswith("*"):
+                prefixes.append(entry.rstrip("*"))
+            elif entry:
+                self._exact.add(entry)
+        self._prefixes = tuple(prefixes)
+
+    def match(self, path: str | None) -> bool:
+        """
+        判断路径是否在名单内。
+
+        参数:
+        - path (str | None): 请求路径。
+
+        返回:
+        - bool: 命中返回True。
+        """
+        if not path:
+            return False
+        return path in self._exact or (bool(self._prefixes) and path.startswith(self._prefixes))
+
+
+@dataclass(frozen=True)
+class SystemConfigSnapshot:
+    """中间件使用的系统配置快照"""
+
+    demo_enable: bool = False
+    ip_white_list: IpMatcher = field(default_factory=IpMatcher)
+    white_api_list_path: PathMatcher = field(default_factory=PathMatcher)
+    ip_black_list: IpMatcher = field(default_factory=IpMatcher)
+
+    @classmethod
+    def from_config(cls, config: dict) -> "SystemConfigSnapshot":
+        """
+        由系统配置字典编译快照。
+
+        参数:
+        - config (dict): ParamsService.get_system_config_for_middleware 返回的配置字典。
+
+        返回:
+        - SystemConfigSnapshot: 系统配置快照。
+        """
+        return cls(
+            demo_enable=str(config.get("demo_enable")).lower() == "true",
+            ip_white_list=IpMatcher(config.get("ip_white_list") or []),
+            white_api_list_path=PathMatcher(config.get("white_api_list_path") or []),
+            ip_black_list=IpMatcher(config.get("ip_black_list") or []),
+        )
+
+
+class SystemConfigCache:
+    """
+    系统配置进程内快照
+
+    请求路径上只读取进程内快照，不访问Redis。配置变更时 publish 通过Redis发布订阅
+    通知所有进程失效快照；订阅断开期间快照按 SYSTEM_CONFIG_CACHE_SECONDS 过期兜底。
+    """
+
+    _snapshot: ClassVar[SystemConfigSnapshot | None] = None
+    _expire_at: ClassVar[float] = 0.0
+    _lock: ClassVar[asyncio.Lock | None] = None
+    _listener: ClassVar[asyncio.Task | None] = None
+
+    @classmethod
+    async def get(cls, redis: Redis) -> SystemConfigSnapshot:
+        """
+        获取系统配置快照，过期或失效时重新加载。
+
+        参数:
+        - redis (Redis): Redis 客户端实例
+
+        返回:
+        - SystemConfigSnapshot: 系统配置快照。
+        """
+        snapshot = cls._snapshot
+        if snapshot is not None and cls._expire_at > time.monotonic():
+            return snapshot
+
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            # 并发请求只由第一个加载
+            if cls._snapshot is not None and cls._expire_at > time.monotonic():
+                return cls._snapshot
+            from app.api.v1.module_system.params.service import ParamsService
+
+            config = await ParamsService.get_system_config_for_middleware(redis)
+            cls._snapshot = SystemConfigSnapshot.from_config(config)
+            cls._expire_at = time.monotonic() + settings.SYSTEM_CONFIG_CACHE_SECONDS
+            return cls._snapshot
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """使当前进程的快照失效"""
+        cls._expire_at = 0.0
+
+    @classmethod
+    async def publish(cls, redis: Redis) -> None:
+        """
+        通知所有进程系统配置已变更。
+
+        参数:
+        - redis (Redis): Redis 客户端实例
+
+        返回:
+        - None
+        """
+        cls.invalidate()
+        try:
+            await redis.publish(RedisInitKeyConfig.SYSTEM_CONFIG_CHANNEL.key, "changed")
+        except Exception as e:
+            log.error(f"发布系统配置变更通知失败: {e}")
+
+    @classmethod
+    def start(cls, redis: Redis) -> None:
+        """
+        启动配置变更订阅任务。
+
+        参数:
+        - redis (Redis): Redis 客户端实例
+
+        返回:
+        - None
+        """
+        if cls._listener is None or cls._listener.done():
+            cls._listener = asyncio.create_task(cls._listen(redis))
+
+    @classmethod
+    async def stop(cls) -> None:
+        """停止配置变更订阅任务"""
+        if cls._listener is not None:
+            cls._listener.cancel()
+            try:
+                await cls._listener
+            except asyncio.CancelledError:
+                pass
+            cls._listener = None
+
+    @classmethod
+    async def _listen(cls, redis: Redis) -> None:
+        """
+        订阅配置变更通知，连接异常时重连。
+
+        参数:
+        - redis (Redis): Redis 客户端实例
+        """
+        channel = RedisInitKeyConfig.SYSTEM_CONFIG_CHANNEL.key
+        while True:
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(channel)
+                # 订阅建立前可能错过通知，重新加载一次
+                cls.invalidate()
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        cls.invalidate()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"系统配置变更订阅异常，稍后重连: {e}")
+                await asyncio.sleep(5)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
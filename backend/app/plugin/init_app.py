@@ -17,9 +17,12 @@ from app.config.setting import settings
 from app.core.exceptions import handle_exception
 from app.core.http_limit import http_limit_callback, ws_limit_callback
 from app.core.logger import log
+from app.core.system_config import SystemConfigCache
 from app.scripts.initialize import InitializeData
+from app.utils.captcha_util import CaptchaPool
 from app.utils.common_util import import_module, import_modules_async
 from app.utils.console import console_close, console_run
+from app.utils.ip_local_util import IpLocalUtil
 
 
 @asynccontextmanager
@@ -35,6 +38,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
     """
     from app.api.v1.module_system.dict.service import DictDataService
     from app.api.v1.module_system.params.service import ParamsService
+    from app.core.log_archiver import LogArchiver
+    from app.core.log_writer import OperationLogWriter
     from app.plugin.module_application.job.tools.ap_scheduler import SchedulerUtil
 
     try:
@@ -46,10 +51,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
         log.info("✅ 全局事件模块加载完成")
         await ParamsService().init_config_service(redis=app.state.redis)
         log.info("✅ Redis系统配置初始化完成")
+        SystemConfigCache.start(redis=app.state.redis)
+        log.info("✅ 系统配置变更订阅已启动")
         await DictDataService().init_dict_service(redis=app.state.redis)
         log.info("✅ Redis数据字典初始化完成")
         await SchedulerUtil.init_system_scheduler(redis=app.state.redis)
         log.info("✅ 定时任务调度器初始化完成")
+        if settings.LOG_ARCHIVE_ENABLE and await LogArchiver.check_storage(redis=app.state.redis):
+            log.info("✅ 日志归档目录校验通过")
         await FastAPILimiter.init(
             redis=app.state.redis,
             prefix=settings.REQUEST_LIMITER_REDIS_PREFIX,
@@ -57,6 +66,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
             ws_callback=ws_limit_callback,
         )
         log.info("✅ 请求限流器初始化完成")
+        OperationLogWriter.start()
+        log.info("✅ 操作日志写入任务已启动")
+        if settings.CAPTCHA_ENABLE:
+            CaptchaPool.prefill()
+            log.info("✅ 验证码预渲染已启动")
 
         # 导入并显示最终的启动信息面板
         from app.common.enums import EnvironmentEnum
@@ -79,6 +93,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
     yield
 
     try:
+        await OperationLogWriter.stop()
+        log.info("✅ 操作日志已全部写入")
         await import_modules_async(
             modules=settings.EVENT_LIST, desc="全局事件", app=app, status=False
         )
@@ -87,6 +103,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
         log.info("✅ 定时任务调度器已关闭")
         await FastAPILimiter.close()
         log.info("✅ 请求限制器已关闭")
+        await SystemConfigCache.stop()
+        log.info("✅ 系统配置变更订阅已关闭")
+        await IpLocalUtil.close()
+        log.info("✅ IP归属地查询已关闭")
         console_close()
 
     except Exception as e:
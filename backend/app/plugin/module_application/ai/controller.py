@@ -4,7 +4,6 @@ from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.request import PaginationService
 from app.common.response import StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.dependencies import AuthPermission
@@ -92,13 +91,12 @@ async def list_controller(
     返回:
     - JSONResponse: 包含 MCP 服务器列表的 JSON 响应
     """
-    result_dict_list = await McpService.list_service(
-        auth=auth, search=search, order_by=page.order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    result_dict = await McpService.page_service(
+        auth=auth,
         page_no=page.page_no,
         page_size=page.page_size,
+        search=search,
+        order_by=page.order_by,
     )
     log.info("查询 MCP 服务器列表成功")
     return SuccessResponse(data=result_dict, msg="查询 MCP 服务器列表成功")
@@ -5,7 +5,7 @@ from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.base_crud import CRUDBase
 
 from .model import McpModel
-from .schema import McpCreateSchema, McpUpdateSchema
+from .schema import McpCreateSchema, McpOutSchema, McpUpdateSchema
 
 
 class McpCRUD(CRUDBase[McpModel, McpCreateSchema, McpUpdateSchema]):
@@ -74,6 +74,36 @@ class McpCRUD(CRUDBase[McpModel, McpCreateSchema, McpUpdateSchema]):
             preload=preload,
         )
 
+    async def page_crud(
+        self,
+        offset: int,
+        limit: int,
+        order_by: list[dict] | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+    ) -> dict:
+        """
+        分页获取MCP 服务器列表
+
+        参数:
+        - offset (int): 偏移量
+        - limit (int): 每页数量
+        - order_by (list[dict] | None): 排序参数
+        - search (dict | None): 查询参数
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - dict: 分页数据
+        """
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=order_by or [{"id": "asc"}],
+            search=search or {},
+            out_schema=McpOutSchema,
+            preload=preload,
+        )
+
     async def create_crud(self, data: McpCreateSchema) -> McpModel | None:
         """
         创建MCP服务器
@@ -99,7 +129,7 @@ class McpCRUD(CRUDBase[McpModel, McpCreateSchema, McpUpdateSchema]):
         """
         return await self.update(id=id, data=data)
 
-    async def delete_crud(self, ids: list[int]) -> None:
+    async def delete_crud(self, ids: list[int]) -> dict:
         """
         批量删除MCP服务器
 
@@ -107,6 +137,6 @@ class McpCRUD(CRUDBase[McpModel, McpCreateSchema, McpUpdateSchema]):
         - ids (list[int]): MCP服务器ID列表
 
         返回:
-        - None
+        - dict: 已删除的ID(affected_ids)与未删除的ID(denied_ids)
         """
         return await self.delete(ids=ids)
@@ -58,6 +58,36 @@ class McpService:
         obj_list = await McpCRUD(auth).get_list_crud(search=search_dict, order_by=order_by)
         return [McpOutSchema.model_validate(obj).model_dump() for obj in obj_list]
 
+    @classmethod
+    async def page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: McpQueryParam | None = None,
+        order_by: list[dict] | None = None,
+    ) -> dict:
+        """
+        分页获取MCP服务器列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (McpQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+
+        返回:
+        - dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await McpCRUD(auth).page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+        )
+
     @classmethod
     async def create_service(cls, auth: AuthSchema, data: McpCreateSchema) -> dict[str, Any]:
         """
@@ -114,11 +144,9 @@ class McpService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            obj = await McpCRUD(auth).get_by_id_crud(id=id)
-            if not obj:
-                raise CustomException(msg="删除失败，该数据不存在")
-        await McpCRUD(auth).delete_crud(ids=ids)
+        result = await McpCRUD(auth).delete_crud(ids=ids)
+        if result["denied_ids"]:
+            raise CustomException(msg="删除失败，该数据不存在")
 
     @classmethod
     async def chat_query(cls, query: ChatQuerySchema) -> AsyncGenerator[str, Any]:
@@ -4,7 +4,6 @@ from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.request import PaginationService
 from app.common.response import ErrorResponse, StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.dependencies import AuthPermission
@@ -61,13 +60,12 @@ async def get_obj_list_controller(
     返回:
     - JSONResponse: 包含分页后的定时任务列表的JSON响应
     """
-    result_dict_list = await JobService.get_job_list_service(
-        auth=auth, search=search, order_by=page.order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    result_dict = await JobService.get_job_page_service(
+        auth=auth,
         page_no=page.page_no,
         page_size=page.page_size,
+        search=search,
+        order_by=page.order_by,
     )
     log.info("查询定时任务列表成功")
     return SuccessResponse(data=result_dict, msg="查询定时任务列表成功")
@@ -283,18 +281,79 @@ async def get_job_log_list_controller(
     - JSONResponse: 查询定时任务日志列表的JSON响应
     """
     order_by = [{"created_time": "desc"}]
-    result_dict_list = await JobLogService.get_job_log_list_service(
-        auth=auth, search=search, order_by=order_by
-    )
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
-        page_no=page.page_no,
-        page_size=page.page_size,
-    )
+    if page.page_mode == "cursor":
+        result_dict = await JobLogService.get_job_log_cursor_page_service(
+            auth=auth,
+            cursor=page.cursor,
+            page_size=page.page_size,
+            search=search,
+            order_by=order_by,
+            with_total=page.with_total,
+        )
+    else:
+        result_dict = await JobLogService.get_job_log_page_service(
+            auth=auth,
+            page_no=page.page_no,
+            page_size=page.page_size,
+            search=search,
+            order_by=order_by,
+        )
     log.info("查询定时任务日志列表成功")
     return SuccessResponse(data=result_dict, msg="查询定时任务日志列表成功")
 
 
+@JobRouter.get(
+    "/log/archive/months",
+    summary="查询定时任务日志归档月份",
+    description="查询已归档的定时任务日志月份",
+)
+async def get_job_log_archive_months_controller(
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_application:job:query"]))],
+) -> JSONResponse:
+    """
+    查询定时任务日志归档月份
+
+    参数:
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含归档月份列表的JSON响应
+    """
+    result = await JobLogService.get_job_log_archive_months_service()
+    log.info("查询定时任务日志归档月份成功")
+    return SuccessResponse(data=result, msg="查询定时任务日志归档月份成功")
+
+
+@JobRouter.get(
+    "/log/archive/{month}",
+    summary="查询归档定时任务日志",
+    description="分页查询指定月份的归档定时任务日志",
+)
+async def get_job_log_archive_list_controller(
+    month: Annotated[str, Path(description="归档月份(YYYY-MM)")],
+    page: Annotated[PaginationQueryParam, Depends()],
+    search: Annotated[JobLogQueryParam, Depends()],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_application:job:query"]))],
+) -> JSONResponse:
+    """
+    查询归档定时任务日志
+
+    参数:
+    - month (str): 归档月份(YYYY-MM)
+    - page (PaginationQueryParam): 分页查询参数模型
+    - search (JobLogQueryParam): 查询参数模型
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含分页归档定时任务日志的JSON响应
+    """
+    result_dict = await JobLogService.get_job_log_archive_page_service(
+        auth=auth, month=month, page_no=page.page_no, page_size=page.page_size, search=search
+    )
+    log.info(f"查询归档定时任务日志成功 {month}")
+    return SuccessResponse(data=result_dict, msg="查询归档定时任务日志成功")
+
+
 @JobRouter.delete("/log/delete", summary="删除定时任务日志", description="删除定时任务日志")
 async def delete_job_log_controller(
     ids: Annotated[list[int], Body(description="ID列表")],
@@ -8,7 +8,9 @@ from .model import JobLogModel, JobModel
 from .schema import (
     JobCreateSchema,
     JobLogCreateSchema,
+    JobLogOutSchema,
     JobLogUpdateSchema,
+    JobOutSchema,
     JobUpdateSchema,
 )
 
@@ -60,6 +62,36 @@ class JobCRUD(CRUDBase[JobModel, JobCreateSchema, JobUpdateSchema]):
         """
         return await self.list(search=search, order_by=order_by, preload=preload)
 
+    async def get_obj_page_crud(
+        self,
+        offset: int,
+        limit: int,
+        order_by: list[dict] | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+    ) -> dict:
+        """
+        分页获取定时任务列表
+
+        参数:
+        - offset (int): 偏移量
+        - limit (int): 每页数量
+        - order_by (list[dict] | None): 排序参数
+        - search (dict | None): 查询参数
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - dict: 分页数据
+        """
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=order_by or [{"id": "asc"}],
+            search=search or {},
+            out_schema=JobOutSchema,
+            preload=preload,
+        )
+
     async def create_obj_crud(self, data: JobCreateSchema) -> JobModel | None:
         """
         创建定时任务
@@ -161,6 +193,69 @@ class JobLogCRUD(CRUDBase[JobLogModel, JobLogCreateSchema, JobLogUpdateSchema]):
         """
         return await self.list(search=search, order_by=order_by, preload=preload)
 
+    async def get_obj_log_page_crud(
+        self,
+        offset: int,
+        limit: int,
+        order_by: list[dict] | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+    ) -> dict:
+        """
+        分页获取定时任务日志列表
+
+        参数:
+        - offset (int): 偏移量
+        - limit (int): 每页数量
+        - order_by (list[dict] | None): 排序参数
+        - search (dict | None): 查询参数
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - dict: 分页数据
+        """
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=order_by or [{"id": "asc"}],
+            search=search or {},
+            out_schema=JobLogOutSchema,
+            preload=preload,
+        )
+
+    async def get_obj_log_cursor_page_crud(
+        self,
+        cursor: str | None,
+        limit: int,
+        order_by: list[dict] | None = None,
+        search: dict | None = None,
+        preload: list | None = None,
+        with_total: bool = False,
+    ) -> dict:
+        """
+        游标分页获取定时任务日志列表
+
+        参数:
+        - cursor (str | None): 上一页返回的游标，为空时返回第一页
+        - limit (int): 每页数量
+        - order_by (list[dict] | None): 排序参数
+        - search (dict | None): 查询参数
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+        - with_total (bool): 是否统计总数
+
+        返回:
+        - dict: 分页数据
+        """
+        return await self.page_after(
+            cursor=cursor,
+            limit=limit,
+            order_by=order_by,
+            search=search,
+            out_schema=JobLogOutSchema,
+            preload=preload,
+            with_total=with_total,
+        )
+
     async def delete_obj_log_crud(self, ids: list[int]) -> None:
         """
         删除定时任务日志
@@ -1,10 +1,10 @@
 from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.base_model import ModelMixin, UserMixin
+from app.core.base_model import DeptMixin, ModelMixin, UserMixin
 
 
-class JobModel(ModelMixin, UserMixin):
+class JobModel(ModelMixin, UserMixin, DeptMixin):
     """
     定时任务调度表
     - 0: 运行中
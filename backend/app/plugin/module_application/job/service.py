@@ -1,5 +1,6 @@
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.exceptions import CustomException
+from app.core.log_archiver import LogArchiver
 from app.utils.cron_util import CronUtil
 from app.utils.excel_util import ExcelUtil
 
@@ -56,6 +57,36 @@ class JobService:
         obj_list = await JobCRUD(auth).get_obj_list_crud(search=search.__dict__, order_by=order_by)
         return [JobOutSchema.model_validate(obj).model_dump() for obj in obj_list]
 
+    @classmethod
+    async def get_job_page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: JobQueryParam | None = None,
+        order_by: list[dict] | None = None,
+    ) -> dict:
+        """
+        分页获取定时任务列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (JobQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+
+        返回:
+        - dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await JobCRUD(auth).get_obj_page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+        )
+
     @classmethod
     async def create_job_service(cls, auth: AuthSchema, data: JobCreateSchema) -> dict:
         """
@@ -260,6 +291,68 @@ class JobLogService:
         )
         return [JobLogOutSchema.model_validate(obj).model_dump() for obj in obj_list]
 
+    @classmethod
+    async def get_job_log_page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: JobLogQueryParam | None = None,
+        order_by: list[dict] | None = None,
+    ) -> dict:
+        """
+        分页获取定时任务日志列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (JobLogQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+
+        返回:
+        - dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await JobLogCRUD(auth).get_obj_log_page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+        )
+
+    @classmethod
+    async def get_job_log_cursor_page_service(
+        cls,
+        auth: AuthSchema,
+        cursor: str | None,
+        page_size: int,
+        search: JobLogQueryParam | None = None,
+        order_by: list[dict] | None = None,
+        with_total: bool = False,
+    ) -> dict:
+        """
+        游标分页获取定时任务日志列表
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - cursor (str | None): 上一页返回的游标，为空时返回第一页
+        - page_size (int): 每页数量
+        - search (JobLogQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+        - with_total (bool): 是否统计总数
+
+        返回:
+        - dict: 分页数据
+        """
+        return await JobLogCRUD(auth).get_obj_log_cursor_page_crud(
+            cursor=cursor,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+            with_total=with_total,
+        )
+
     @classmethod
     async def delete_job_log_service(cls, auth: AuthSchema, ids: list[int]) -> None:
         """
@@ -291,6 +384,47 @@ class JobLogService:
             ids = [log.id for log in all_logs]
             await JobLogCRUD(auth).delete_obj_log_crud(ids=ids)
 
+    @classmethod
+    async def get_job_log_archive_months_service(cls) -> list[dict]:
+        """
+        获取已归档的定时任务日志月份
+
+        返回:
+        - list[dict]: 归档月份列表
+        """
+        return LogArchiver.list_months(name="app_job_log")
+
+    @classmethod
+    async def get_job_log_archive_page_service(
+        cls,
+        auth: AuthSchema,
+        month: str,
+        page_no: int,
+        page_size: int,
+        search: JobLogQueryParam | None = None,
+    ) -> dict:
+        """
+        分页查询归档月份中的定时任务日志
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - month (str): 归档月份(YYYY-MM)
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (JobLogQueryParam | None): 查询参数模型
+
+        返回:
+        - dict: 分页数据
+        """
+        return await LogArchiver.read_month(
+            auth=auth,
+            name="app_job_log",
+            month=month,
+            page_no=page_no,
+            page_size=page_size,
+            search=search.__dict__ if search else {},
+        )
+
     @classmethod
     async def export_job_log_service(cls, data_list: list[dict]) -> bytes:
         """
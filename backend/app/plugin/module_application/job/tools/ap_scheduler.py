@@ -57,6 +57,9 @@ scheduler.configure(
     timezone="Asia/Shanghai",
 )
 
+# 系统内置任务ID前缀（不对应 app_job 记录）
+SYSTEM_JOB_PREFIX = "system:"
+
 
 class SchedulerUtil:
     """
@@ -184,7 +187,7 @@ class SchedulerUtil:
                             exception_info=exception_info,
                             created_time=datetime.now(),
                             updated_time=datetime.now(),
-                            job_id=job_id,
+                            job_id=None if str(job_id).startswith(SYSTEM_JOB_PREFIX) else job_id,
                         )
 
                         # 保存到数据库
@@ -255,6 +258,19 @@ class SchedulerUtil:
                     await asyncio.sleep(2)
                     log.info("✅️ 定时任务已由其他实例初始化完成")
 
+        if settings.LOG_ARCHIVE_ENABLE:
+            from app.core.log_archiver import LogArchiver
+
+            try:
+                cls.add_system_job(
+                    job_id=f"{SYSTEM_JOB_PREFIX}log_archive",
+                    name="日志归档",
+                    func=LogArchiver.run,
+                    cron=settings.LOG_ARCHIVE_CRON,
+                )
+            except CustomException as e:
+                log.error(f"添加日志归档任务失败: {e.msg}")
+
     @classmethod
     async def close_system_scheduler(cls) -> None:
         """
@@ -493,6 +509,56 @@ class SchedulerUtil:
         except Exception as e:
             raise CustomException(msg=f"添加任务失败: {e!s}")
 
+    @classmethod
+    def add_system_job(cls, job_id: str, name: str, func: Callable, cron: str) -> Job:
+        """
+        添加系统内置任务。
+
+        系统任务保存在各实例的内存存储器中，执行时通过分布式锁保证同一时刻只有一个实例运行。
+
+        参数:
+        - job_id (str): 任务ID，以 SYSTEM_JOB_PREFIX 开头。
+        - name (str): 任务名称。
+        - func (Callable): 执行函数。
+        - cron (str): Cron表达式(秒 分 时 日 月 周 [年])。
+
+        返回:
+        - Job: 新增的任务对象。
+
+        异常:
+        - CustomException: Cron表达式不正确时抛出。
+        """
+        fields = cron.strip().split()
+        if len(fields) not in (6, 7) or not CronUtil.validate_cron_expression(cron):
+            raise CustomException(msg=f"系统任务{name}, Cron表达式不正确")
+        parsed_fields = [field if field != "?" else "*" for field in fields]
+        if len(fields) == 6:
+            parsed_fields.append("*")
+        second, minute, hour, day, month, day_of_week, year = tuple(parsed_fields)
+        job = scheduler.add_job(
+            func=cls._task_wrapper,
+            trigger=CronTrigger(
+                second=second,
+                minute=minute,
+                hour=hour,
+                day=day,
+                month=month,
+                day_of_week=day_of_week,
+                year=year,
+                timezone="Asia/Shanghai",
+            ),
+            args=[func, job_id],
+            id=job_id,
+            name=name,
+            coalesce=True,
+            max_instances=1,
+            jobstore="default",
+            executor="default",
+            replace_existing=True,
+        )
+        log.info(f"系统任务 {job_id} 添加成功")
+        return job
+
     @classmethod
     def remove_job(cls, job_id: str | int) -> None:
         """
@@ -511,12 +577,14 @@ class SchedulerUtil:
     @classmethod
     def clear_jobs(cls) -> None:
         """
-        删除所有调度任务。
+        删除所有调度任务（保留系统内置任务）。
 
         返回:
         - None
         """
-        scheduler.remove_all_jobs()
+        for job in scheduler.get_jobs():
+            if not job.id.startswith(SYSTEM_JOB_PREFIX):
+                scheduler.remove_job(job_id=job.id)
 
     @classmethod
     def modify_job(cls, job_id: str | int) -> Job:
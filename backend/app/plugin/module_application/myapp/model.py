@@ -1,10 +1,10 @@
 from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.base_model import ModelMixin, UserMixin
+from app.core.base_model import DeptMixin, ModelMixin, UserMixin
 
 
-class ApplicationModel(ModelMixin, UserMixin):
+class ApplicationModel(ModelMixin, UserMixin, DeptMixin):
     """
     应用系统表
     """
@@ -56,6 +56,36 @@ class ApplicationService:
         obj_list = await ApplicationCRUD(auth).list_crud(search=search_dict, order_by=order_by)
         return [ApplicationOutSchema.model_validate(obj).model_dump() for obj in obj_list]
 
+    @classmethod
+    async def page_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: ApplicationQueryParam | None = None,
+        order_by: list[dict] | None = None,
+    ) -> dict:
+        """
+        分页获取应用列表（数据库分页）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (ApplicationQueryParam | None): 查询参数模型
+        - order_by (list[dict] | None): 排序参数列表
+
+        返回:
+        - dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await ApplicationCRUD(auth).page_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else {},
+        )
+
     @classmethod
     async def create_service(cls, auth: AuthSchema, data: ApplicationCreateSchema) -> dict:
         """
@@ -262,41 +262,63 @@ class DemoService:
 
             error_msgs = []
             success_count = 0
-            count = 0
 
-            # 处理每一行数据
-            for _index, row in df.iterrows():
-                count += 1
+            # 构建全部数据，文件内重复的名称仅保留首次出现的行
+            rows: dict[str, tuple[int, dict]] = {}
+            for count, (_index, row) in enumerate(df.iterrows(), start=1):
+                # 数据转换前的类型检查
                 try:
-                    # 数据转换前的类型检查
+                    status = "0" if row["status"] == "正常" else "1"
+                except ValueError:
+                    error_msgs.append(f"第{count}行: 状态必须是'正常'或'停用'")
+                    continue
+
+                data = {
+                    "name": str(row["name"]),
+                    "status": status,
+                    "description": str(row["description"]),
+                }
+                if data["name"] in rows:
+                    error_msgs.append(f"第{count}行: 对象 {data['name']} 在文件中重复")
+                    continue
+                rows[data["name"]] = (count, data)
+
+            # 一次查询取出已存在的对象，替代逐行查询
+            exists_objs = {}
+            if rows:
+                objs = await DemoCRUD(auth).list(
+                    search={"name": ("in", list(rows.keys()))}, preload=[]
+                )
+                exists_objs = {obj.name: obj for obj in objs}
+
+            create_rows: list[tuple[int, dict]] = []
+            for name, (count, data) in rows.items():
+                exists_obj = exists_objs.get(name)
+                if not exists_obj:
+                    create_rows.append((count, data))
+                elif update_support:
                     try:
-                        status = "0" if row["status"] == "正常" else "1"
-                    except ValueError:
-                        error_msgs.append(f"第{count}行: 状态必须是'正常'或'停用'")
-                        continue
-
-                    # 构建用户数据
-                    data = {
-                        "name": str(row["name"]),
-                        "status": status,
-                        "description": str(row["description"]),
-                    }
-
-                    # 处理用户导入
-                    exists_obj = await DemoCRUD(auth).get(name=data["name"])
-                    if exists_obj:
-                        if update_support:
-                            await DemoCRUD(auth).update(id=exists_obj.id, data=data)
-                            success_count += 1
-                        else:
-                            error_msgs.append(f"第{count}行: 对象 {data['name']} 已存在")
-                    else:
-                        await DemoCRUD(auth).create(data=data)
+                        await DemoCRUD(auth).update(id=exists_obj.id, data=data)
                         success_count += 1
+                    except Exception as e:
+                        error_msgs.append(f"第{count}行: {e!s}")
+                else:
+                    error_msgs.append(f"第{count}行: 对象 {name} 已存在")
 
-                except Exception as e:
-                    error_msgs.append(f"第{count}行: {e!s}")
-                    continue
+            # 新数据批量写入；整批失败时逐行重试以定位错误行
+            if create_rows:
+                try:
+                    async with auth.db.begin_nested():
+                        await DemoCRUD(auth).create_many(rows=[data for _, data in create_rows])
+                    success_count += len(create_rows)
+                except Exception:
+                    for count, data in create_rows:
+                        try:
+                            async with auth.db.begin_nested():
+                                await DemoCRUD(auth).create_many(rows=[data])
+                            success_count += 1
+                        except Exception as e:
+                            error_msgs.append(f"第{count}行: {e!s}")
 
             # 返回详细的导入结果
             result = f"成功导入 {success_count} 条数据"
@@ -39,11 +39,11 @@ async def gen_table_list_controller(
     返回:
     - JSONResponse: 包含查询结果和分页信息的JSON响应
     """
-    result_dict_list = await GenTableService.get_gen_table_list_service(auth=auth, search=search)
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    result_dict = await GenTableService.get_gen_table_page_service(
+        auth=auth,
         page_no=page.page_no,
         page_size=page.page_size,
+        search=search,
     )
     log.info("获取代码生成业务表列表成功")
     return SuccessResponse(data=result_dict, msg="获取代码生成业务表列表成功")
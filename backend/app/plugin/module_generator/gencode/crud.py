@@ -13,6 +13,7 @@ from .schema import (
     GenDBTableSchema,
     GenTableColumnOutSchema,
     GenTableColumnSchema,
+    GenTableOutSchema,
     GenTableQueryParam,
     GenTableSchema,
 )
@@ -96,6 +97,34 @@ class GenTableCRUD(CRUDBase[GenTableModel, GenTableSchema, GenTableSchema]):
             preload=preload,
         )
 
+    async def get_gen_table_page(
+        self,
+        offset: int,
+        limit: int,
+        search: GenTableQueryParam | None = None,
+        preload: list | None = None,
+    ) -> dict:
+        """
+        根据查询参数分页获取代码生成业务表列表信息。
+
+        参数:
+        - offset (int): 偏移量。
+        - limit (int): 每页数量。
+        - search (GenTableQueryParam | None): 查询参数对象。
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - dict: 分页数据。
+        """
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=[{"created_time": "desc"}],
+            search=search.__dict__ if search else {},
+            out_schema=GenTableOutSchema,
+            preload=preload,
+        )
+
     async def add_gen_table(self, add_model: GenTableSchema) -> GenTableModel:
         """
         新增业务表信息。
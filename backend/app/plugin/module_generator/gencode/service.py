@@ -84,6 +84,28 @@ class GenTableService:
         gen_table_list_result = await GenTableCRUD(auth=auth).get_gen_table_list(search)
         return [GenTableOutSchema.model_validate(obj).model_dump() for obj in gen_table_list_result]
 
+    @classmethod
+    @handle_service_exception
+    async def get_gen_table_page_service(
+        cls, auth: AuthSchema, page_no: int, page_size: int, search: GenTableQueryParam
+    ) -> dict:
+        """
+        分页获取代码生成业务表列表信息（数据库分页）。
+
+        参数:
+        - auth (AuthSchema): 认证信息。
+        - page_no (int): 页码。
+        - page_size (int): 每页数量。
+        - search (GenTableQueryParam): 查询参数模型。
+
+        返回:
+        - dict: 分页数据。
+        """
+        offset = (page_no - 1) * page_size
+        return await GenTableCRUD(auth=auth).get_gen_table_page(
+            offset=offset, limit=page_size, search=search
+        )
+
     @classmethod
     @handle_service_exception
     async def get_gen_db_table_list_service(
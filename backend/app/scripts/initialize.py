@@ -5,6 +5,7 @@ from typing import Any
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.module_system.auth.schema import AuthSchema
 from app.api.v1.module_system.dept.model import DeptModel
 from app.api.v1.module_system.dict.model import DictDataModel, DictTypeModel
 from app.api.v1.module_system.menu.model import MenuModel
@@ -13,6 +14,7 @@ from app.api.v1.module_system.position.model import PositionModel
 from app.api.v1.module_system.role.model import RoleModel
 from app.api.v1.module_system.user.model import UserModel, UserRolesModel
 from app.config.path_conf import SCRIPT_DIR
+from app.core.base_crud import CRUDBase
 from app.core.database import async_db_session, create_tables
 from app.core.logger import log
 
@@ -61,8 +63,10 @@ class InitializeData:
         参数:
         - db (AsyncSession): 异步数据库会话。
         """
-        # 存储字典类型数据的映射，用于后续字典数据的初始化
-        dict_type_mapping = {}
+        # 存储字典类型到ID的映射，用于后续字典数据的初始化
+        dict_type_mapping: dict[str, int] = {}
+        # 初始化阶段没有登录用户，不进行数据权限过滤
+        auth = AuthSchema(db=db)
 
         for model in self.prepare_init_models:
             table_name = model.__tablename__
@@ -86,32 +90,33 @@ class InitializeData:
                 if table_name in ["sys_dept", "sys_menu"]:
                     # 获取对应的模型类
                     model_class = DeptModel if table_name == "sys_dept" else MenuModel
-                    objs = self.__create_objects_with_children(data, model_class)
+                    db.add_all(self.__create_objects_with_children(data, model_class))
+                    await db.flush()
+                    # 嵌套写入时父节点ID尚未生成，写入后统一计算树形路径
+                    await CRUDBase(model=model_class, auth=auth).rebuild_tree_path()
                 # 处理字典类型表，保存类型映射
                 elif table_name == "sys_dict_type":
-                    objs = []
-                    for item in data:
-                        obj = model(**item)
-                        objs.append(obj)
-                        dict_type_mapping[item["dict_type"]] = obj
+                    rows = await CRUDBase(model=model, auth=auth).create_many(
+                        rows=data, returning=["id", "dict_type"]
+                    )
+                    dict_type_mapping = {row["dict_type"]: row["id"] for row in rows}
                 # 处理字典数据表，添加dict_type_id关联
                 elif table_name == "sys_dict_data":
-                    objs = []
+                    items = []
                     for item in data:
                         dict_type = item.get("dict_type")
                         if dict_type in dict_type_mapping:
                             # 添加dict_type_id关联
-                            item["dict_type_id"] = dict_type_mapping[dict_type].id
+                            item["dict_type_id"] = dict_type_mapping[dict_type]
                         else:
                             log.warning(f"⚠️  未找到字典类型 {dict_type}，跳过该字典数据")
                             continue
-                        objs.append(model(**item))
+                        items.append(item)
+                    await CRUDBase(model=model, auth=auth).create_many(rows=items)
                 else:
-                    # 表为空，直接插入全部数据
-                    objs = [model(**item) for item in data]
+                    # 表为空，直接批量插入全部数据
+                    await CRUDBase(model=model, auth=auth).create_many(rows=data)
 
-                db.add_all(objs)
-                await db.flush()
                 log.info(f"✅️ 已向 {table_name} 表写入初始化数据")
 
             except Exception as e:
@@ -185,3 +190,14 @@ class InitializeData:
                 # session.add_all(objs)
                 # 确保提交事务
                 await session.commit()
+
+    async def rebuild_tree_path(self) -> None:
+        """
+        根据 parent_id 重建部门、菜单的树形路径（tree_path）
+        """
+        async with async_db_session() as session:
+            async with session.begin():
+                auth = AuthSchema(db=session)
+                for model in (DeptModel, MenuModel):
+                    count = await CRUDBase(model=model, auth=auth).rebuild_tree_path()
+                    log.info(f"✅️ 已重建 {model.__tablename__} 表树形路径（更新 {count} 条记录）")
@@ -1,11 +1,17 @@
+import asyncio
 import base64
 import random
 import string
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
+from typing import ClassVar
 
 from PIL import Image, ImageDraw, ImageFont
 
 from app.config.setting import settings
+from app.core.logger import log
 
 
 class CaptchaUtil:
@@ -13,6 +19,17 @@ class CaptchaUtil:
     验证码工具类
     """
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _font() -> ImageFont.FreeTypeFont:
+        """
+        加载验证码字体（每个进程只读取一次字体文件）。
+
+        返回:
+        - ImageFont.FreeTypeFont: 字体对象。
+        """
+        return ImageFont.truetype(font=settings.CAPTCHA_FONT_PATH, size=settings.CAPTCHA_FONT_SIZE)
+
     @classmethod
     def generate_captcha(cls) -> tuple[str, str]:
         """
@@ -32,7 +49,7 @@ class CaptchaUtil:
         draw = ImageDraw.Draw(image)
 
         # 使用指定字体
-        font = ImageFont.truetype(font=settings.CAPTCHA_FONT_PATH, size=settings.CAPTCHA_FONT_SIZE)
+        font = cls._font()
 
         # 计算文本总宽度和高度
         total_width = sum(draw.textbbox((0, 0), char, font=font)[2] for char in captcha_value)
@@ -93,7 +110,7 @@ class CaptchaUtil:
         draw = ImageDraw.Draw(image)
 
         # 设置字体
-        font = ImageFont.truetype(font=settings.CAPTCHA_FONT_PATH, size=settings.CAPTCHA_FONT_SIZE)
+        font = cls._font()
 
         # 生成运算数字和运算符
         operators = ["+", "-", "*"]
@@ -140,3 +157,75 @@ class CaptchaUtil:
         base64_string = base64.b64encode(buffer.getvalue()).decode()
 
         return base64_string, captcha_value
+
+
+class CaptchaPool:
+    """
+    预渲染验证码池
+
+    在进程内缓存一批已渲染的运算验证码，取用时直接弹出；
+    剩余数量低于一半时在后台补充。渲染统一在单个后台线程中执行，
+    不占用事件循环，也避免多线程共用同一字体对象。
+    """
+
+    _pool: ClassVar[deque[tuple[str, int]]] = deque()
+    _refill_task: ClassVar[asyncio.Task | None] = None
+    _executor: ClassVar[ThreadPoolExecutor | None] = None
+
+    @classmethod
+    async def _render(cls) -> tuple[str, int]:
+        """
+        在后台线程中渲染一个运算验证码。
+
+        返回:
+        - Tuple[str, int]: [base64图片字符串, 计算结果]。
+        """
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="captcha")
+        return await asyncio.get_running_loop().run_in_executor(
+            cls._executor, CaptchaUtil.captcha_arithmetic
+        )
+
+    @classmethod
+    async def get(cls) -> tuple[str, int]:
+        """
+        获取一个运算验证码。
+
+        返回:
+        - Tuple[str, int]: [base64图片字符串, 计算结果]。
+        """
+        size = settings.CAPTCHA_POOL_SIZE
+        if size <= 0:
+            return await cls._render()
+
+        captcha = cls._pool.popleft() if cls._pool else None
+        if len(cls._pool) < size // 2:
+            cls.prefill()
+        if captcha is None:
+            captcha = await cls._render()
+        return captcha
+
+    @classmethod
+    def prefill(cls) -> None:
+        """
+        在后台启动补充任务（已有补充任务运行时忽略）。
+
+        返回:
+        - None
+        """
+        if settings.CAPTCHA_POOL_SIZE > 0 and (cls._refill_task is None or cls._refill_task.done()):
+            cls._refill_task = asyncio.create_task(cls.fill())
+
+    @classmethod
+    async def fill(cls) -> None:
+        """
+        将验证码池补充至配置的容量（逐个渲染，实时请求可插队执行）。
+
+        返回:
+        - None
+        """
+        try:
+            while len(cls._pool) < settings.CAPTCHA_POOL_SIZE:
+                cls._pool.append(await cls._render())
+        except Exception as e:
+            log.error(f"预渲染验证码失败: {e!s}")
@@ -1,6 +1,9 @@
+import asyncio
 import hashlib
 import os
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, TypeVar
 
 from cryptography.hazmat.backends.openssl import backend
 from cryptography.hazmat.primitives import padding
@@ -8,23 +11,77 @@ from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from itsdangerous import URLSafeSerializer
 from passlib.context import CryptContext
 
+from app.config.setting import settings
+from app.core.exceptions import CustomException
 from app.core.logger import log
 
 # 密码加密配置
 PwdContext = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
-    bcrypt__rounds=12,  # 设置加密轮数,增加安全性
+    bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS,  # 设置加密轮数,增加安全性
 )
 
+T = TypeVar("T")
+
 
 class PwdUtil:
     """
     密码工具类,提供密码加密和验证功能
+
+    bcrypt 计算耗时较长(12轮约250ms)，统一提交到独立线程池执行，避免阻塞事件循环；
+    线程数即并发上限，排队任务超过上限时直接拒绝。
     """
 
+    _executor: ClassVar[ThreadPoolExecutor | None] = None
+    # 已提交未完成的任务数，仅在事件循环线程中修改
+    _inflight: ClassVar[int] = 0
+
+    @classmethod
+    async def _run(cls, func: Callable[..., T], *args: Any) -> T:
+        """
+        在密码线程池中执行计算
+
+        参数:
+        - func (Callable[..., T]): 待执行函数。
+        - args (Any): 函数参数。
+
+        返回:
+        - T: 函数返回值。
+
+        异常:
+        - CustomException: 排队任务过多时抛出。
+        """
+        workers = settings.PASSWORD_HASH_WORKERS
+        if 0 < settings.PASSWORD_HASH_QUEUE_MAX <= cls._inflight - workers:
+            log.warning(f"密码计算排队任务过多: {cls._inflight - workers}")
+            raise CustomException(msg="系统繁忙，请稍后重试", status_code=503)
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pwd-hash")
+
+        cls._inflight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(cls._executor, func, *args)
+        finally:
+            cls._inflight -= 1
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        获取密码线程池运行指标
+
+        返回:
+        - dict[str, int]: 线程数、执行中任务数、排队任务数。
+        """
+        workers = settings.PASSWORD_HASH_WORKERS
+        return {
+            "workers": workers,
+            "running": min(cls._inflight, workers),
+            "pending": max(cls._inflight - workers, 0),
+        }
+
     @classmethod
-    def verify_password(cls, plain_password: str, password_hash: str) -> bool:
+    async def verify_password(cls, plain_password: str, password_hash: str) -> bool:
         """
         校验密码是否匹配
 
@@ -35,10 +92,26 @@ class PwdUtil:
         返回:
         - bool: 密码是否匹配。
         """
-        return PwdContext.verify(plain_password, password_hash)
+        return await cls._run(PwdContext.verify, plain_password, password_hash)
+
+    @classmethod
+    async def verify_and_update_password(
+        cls, plain_password: str, password_hash: str
+    ) -> tuple[bool, str | None]:
+        """
+        校验密码，并在加密配置(如轮数)变更后生成新的哈希值
+
+        参数:
+        - plain_password (str): 明文密码。
+        - password_hash (str): 加密后的密码哈希值。
+
+        返回:
+        - tuple[bool, str | None]: (密码是否匹配, 需要替换的新哈希值，无需更新时为None)。
+        """
+        return await cls._run(PwdContext.verify_and_update, plain_password, password_hash)
 
     @classmethod
-    def set_password_hash(cls, password: str) -> str:
+    async def set_password_hash(cls, password: str) -> str:
         """
         对密码进行加密
 
@@ -48,7 +121,7 @@ class PwdUtil:
         返回:
         - str: 加密后的密码哈希值。
         """
-        return PwdContext.hash(password)
+        return await cls._run(PwdContext.hash, password)
 
     @classmethod
     def check_password_strength(cls, password: str) -> str | None:
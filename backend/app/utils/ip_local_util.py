@@ -1,15 +1,173 @@
+import asyncio
+import csv
+import ipaddress
+import mmap
+import os
 import re
+import struct
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import ClassVar
 
 import httpx
 
+from app.config.path_conf import BASE_DIR
+from app.config.setting import settings
 from app.core.logger import log
 
 
+class IpLocationDB:
+    """
+    离线IP归属地库
+
+    数据文件格式(小端):
+    - 文件头: 魔数(4字节) + 记录数(uint32) + 字符串区偏移(uint32)
+    - 记录区: 按起始IP升序排列的 起始IP、结束IP、归属地偏移、归属地长度(均为uint32)
+    - 字符串区: UTF-8 编码的归属地文本，相同文本只存一份
+
+    文件以只读方式内存映射，查询时在记录区二分查找，不会整体读入内存。
+    """
+
+    MAGIC = b"FAIP"
+    HEADER = struct.Struct("<4sII")
+    RECORD = struct.Struct("<IIII")
+
+    def __init__(self, path: Path) -> None:
+        """
+        打开离线IP库。
+
+        参数:
+        - path (Path): 数据文件路径。
+
+        异常:
+        - ValueError: 数据文件格式不正确时抛出。
+        """
+        with path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self._strings = self.HEADER.unpack_from(self._mm, 0)
+        if magic != self.MAGIC:
+            self._mm.close()
+            raise ValueError(f"IP库文件格式不正确: {path}")
+
+    def lookup(self, ip: int) -> str | None:
+        """
+        查询IP所在区间的归属地。
+
+        参数:
+        - ip (int): 整数形式的IPv4地址。
+
+        返回:
+        - str | None: 归属地，不在任何区间内时返回None。
+        """
+        # 查找最后一个起始IP <= ip 的记录
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = struct.unpack_from("<I", self._mm, self.HEADER.size + mid * self.RECORD.size)[0]
+            if start <= ip:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == 0:
+            return None
+        _, end, offset, length = self.RECORD.unpack_from(
+            self._mm, self.HEADER.size + (lo - 1) * self.RECORD.size
+        )
+        if ip > end:
+            return None
+        start = self._strings + offset
+        return self._mm[start : start + length].decode()
+
+    def close(self) -> None:
+        """关闭内存映射"""
+        self._mm.close()
+
+    @classmethod
+    def build(cls, rows: Iterable[tuple[int, int, str]], path: Path) -> int:
+        """
+        由IP区间生成数据文件（先写临时文件再替换，运行中的进程不受影响）。
+
+        参数:
+        - rows (Iterable[tuple[int, int, str]]): (起始IP, 结束IP, 归属地) 区间。
+        - path (Path): 数据文件路径。
+
+        返回:
+        - int: 写入的记录数。
+
+        异常:
+        - ValueError: 区间不合法或存在重叠时抛出。
+        """
+        records = sorted(rows)
+        strings = bytearray()
+        offsets: dict[str, tuple[int, int]] = {}
+        packed = bytearray()
+        prev_end = -1
+        for start, end, location in records:
+            if not 0 <= start <= end <= 0xFFFFFFFF:
+                raise ValueError(f"IP区间不合法: {start}-{end}")
+            if start <= prev_end:
+                raise ValueError(f"IP区间存在重叠: {ipaddress.IPv4Address(start)}")
+            prev_end = end
+            if location not in offsets:
+                data = location.encode()
+                offsets[location] = (len(strings), len(data))
+                strings += data
+            packed += cls.RECORD.pack(start, end, *offsets[location])
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, len(records), cls.HEADER.size + len(packed)))
+            f.write(packed)
+            f.write(strings)
+        os.replace(tmp_path, path)
+        return len(records)
+
+    @classmethod
+    def import_csv(cls, csv_path: Path, path: Path) -> int:
+        """
+        由CSV文件生成数据文件，每行为 起始IP,结束IP,归属地（IP可为点分或整数形式，#开头为注释）。
+
+        参数:
+        - csv_path (Path): CSV文件路径。
+        - path (Path): 数据文件路径。
+
+        返回:
+        - int: 写入的记录数。
+        """
+
+        def to_int(value: str) -> int:
+            value = value.strip()
+            return int(value) if value.isdigit() else int(ipaddress.IPv4Address(value))
+
+        with csv_path.open(encoding="utf-8", newline="") as f:
+            rows = [
+                (to_int(row[0]), to_int(row[1]), row[2].strip())
+                for row in csv.reader(f)
+                if len(row) >= 3 and row[0].strip() and not row[0].startswith("#")
+            ]
+        return cls.build(rows, path)
+
+
 class IpLocalUtil:
     """
     获取IP归属地工具类
+
+    优先查询离线IP库，结果缓存在进程内LRU中；离线库未命中时返回"未知"，
+    并可在后台调用在线接口补全，结果写入缓存供后续请求使用，不阻塞当前请求。
+    在线查询失败不写入缓存，仅记录失败时间，IP_LOCATION_REMOTE_RETRY_SECONDS 秒后允许重新查询。
     """
 
+    _db: ClassVar[IpLocationDB | None] = None
+    _db_loaded: ClassVar[bool] = False
+    _cache: ClassVar[OrderedDict[str, str]] = OrderedDict()
+    _pending: ClassVar[dict[str, asyncio.Task]] = {}
+    # 在线查询失败的IP: {IP: 允许重试的时间}
+    _failures: ClassVar[OrderedDict[str, float]] = OrderedDict()
+    _client: ClassVar[httpx.AsyncClient | None] = None
+
     @classmethod
     def is_valid_ip(cls, ip: str) -> bool:
         """
@@ -49,7 +207,7 @@ class IpLocalUtil:
         - ip (str): IP地址。
 
         返回:
-        - str | None: IP归属地信息，失败时返回"未知"或None。
+        - str | None: IP归属地信息，查询不到时返回"未知"。
         """
         # 校验IP格式
         if not cls.is_valid_ip(ip):
@@ -60,27 +218,113 @@ class IpLocalUtil:
         if cls.is_private_ip(ip):
             return "内网IP"
 
+        location = cls._cache.get(ip)
+        if location is not None:
+            cls._cache.move_to_end(ip)
+            return location
+
+        location = cls.lookup_local(ip)
+        if location:
+            cls._remember(ip, location)
+            return location
+
+        if settings.IP_LOCATION_REMOTE_ENABLE:
+            cls._schedule_remote(ip)
+        return "未知"
+
+    @classmethod
+    def lookup_local(cls, ip: str) -> str | None:
+        """
+        查询离线IP库。
+
+        参数:
+        - ip (str): IPv4地址。
+
+        返回:
+        - str | None: 归属地，离线库不可用或未收录时返回None。
+        """
+        if not cls._db_loaded:
+            cls._db_loaded = True
+            path = BASE_DIR.joinpath(settings.IP_LOCATION_DB_PATH)
+            try:
+                cls._db = IpLocationDB(path)
+                log.info(f"已加载离线IP库: {path}, 共 {cls._db.count} 条记录")
+            except (OSError, ValueError) as e:
+                log.warning(f"离线IP库不可用: {e}")
+        if cls._db is None:
+            return None
+        return cls._db.lookup(int(ipaddress.IPv4Address(ip)))
+
+    @classmethod
+    def _remember(cls, ip: str, location: str) -> None:
+        """
+        写入LRU缓存。
+
+        参数:
+        - ip (str): IP地址。
+        - location (str): 归属地。
+        """
+        cls._cache[ip] = location
+        cls._cache.move_to_end(ip)
+        while len(cls._cache) > settings.IP_LOCATION_CACHE_MAXSIZE:
+            cls._cache.popitem(last=False)
+
+    @classmethod
+    def _schedule_remote(cls, ip: str) -> None:
+        """
+        在后台查询在线接口（同一IP同时只查询一次）。
+
+        参数:
+        - ip (str): IP地址。
+        """
+        if ip in cls._pending:
+            return
+        retry_at = cls._failures.get(ip)
+        if retry_at is not None:
+            if time.monotonic() < retry_at:
+                return
+            cls._failures.pop(ip, None)
+        task = asyncio.create_task(cls._lookup_remote(ip))
+        cls._pending[ip] = task
+        task.add_done_callback(lambda _: cls._pending.pop(ip, None))
+
+    @classmethod
+    async def _lookup_remote(cls, ip: str) -> None:
+        """
+        调用在线接口查询归属地，成功时写入缓存，失败时记录重试时间。
+
+        参数:
+        - ip (str): IP地址。
+        """
+        location = None
         try:
-            # 使用ip-api.com API获取IP归属地信息
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # 尝试使用 ip9.com.cn API
-                url = f"https://ip9.com.cn/get?ip={ip}"
-                response = await cls._make_api_request(client, url)
-                if response and response.json().get("ret") == 200:
-                    result = response.json().get("data", {})
-                    return f"{result.get('country', '')}-{result.get('prov', '')}-{result.get('city', '')}-{result.get('area', '')}-{result.get('isp', '')}"
+            if cls._client is None:
+                cls._client = httpx.AsyncClient(timeout=settings.IP_LOCATION_REMOTE_TIMEOUT)
+            client = cls._client
 
+            # 尝试使用 ip9.com.cn API
+            url = f"https://ip9.com.cn/get?ip={ip}"
+            response = await cls._make_api_request(client, url)
+            if response and response.json().get("ret") == 200:
+                result = response.json().get("data", {})
+                location = f"{result.get('country', '')}-{result.get('prov', '')}-{result.get('city', '')}-{result.get('area', '')}-{result.get('isp', '')}"
+            else:
                 # 尝试使用百度 API
                 url = f"https://qifu-api.baidubce.com/ip/geo/v1/district?ip={ip}"
                 response = await cls._make_api_request(client, url)
                 if response and response.json().get("code") == "Success":
                     data = response.json().get("data", {})
-                    # 修正原代码中的格式错误
-                    return f"{data.get('country', '')}-{data.get('prov', '')}-{data.get('city', '')}-{data.get('district', '')}-{data.get('isp', '')}"
+                    location = f"{data.get('country', '')}-{data.get('prov', '')}-{data.get('city', '')}-{data.get('district', '')}-{data.get('isp', '')}"
 
         except Exception as e:
             log.error(f"获取IP归属地失败: {e}")
-            return "未知"
+        if location is None:
+            cls._failures[ip] = time.monotonic() + settings.IP_LOCATION_REMOTE_RETRY_SECONDS
+            cls._failures.move_to_end(ip)
+            while len(cls._failures) > settings.IP_LOCATION_CACHE_MAXSIZE:
+                cls._failures.popitem(last=False)
+            return
+        cls._remember(ip, location)
 
     @classmethod
     async def _make_api_request(cls, client: httpx.AsyncClient, url: str):
@@ -97,7 +341,7 @@ class IpLocalUtil:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                response = await client.get(url, timeout=10)
+                response = await client.get(url)
                 if response.status_code == 200:
                     return response
             except Exception as e:
@@ -105,3 +349,23 @@ class IpLocalUtil:
                     continue
                 log.error(f"API 请求失败: {e}")
         return None
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        关闭在线查询客户端与离线IP库。
+
+        返回:
+        - None
+        """
+        for task in list(cls._pending.values()):
+            task.cancel()
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+        if cls._db is not None:
+            cls._db.close()
+            cls._db = None
+        cls._db_loaded = False
+        cls._cache.clear()
+        cls._failures.clear()
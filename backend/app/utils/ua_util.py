@@ -0,0 +1,69 @@
+from collections import OrderedDict
+from typing import ClassVar, NamedTuple
+
+from user_agents import parse
+
+from app.config.setting import settings
+
+
+class UserAgentInfo(NamedTuple):
+    """User-Agent 解析结果"""
+
+    os: str
+    browser: str
+
+
+class UserAgentUtil:
+    """
+    User-Agent 解析工具类
+
+    user_agents.parse 需要依次匹配大量正则，而实际请求中的UA种类很少，
+    解析结果(操作系统、浏览器)按UA字符串缓存在进程内LRU中，容量为 USER_AGENT_CACHE_MAXSIZE。
+    """
+
+    _cache: ClassVar[OrderedDict[str, UserAgentInfo]] = OrderedDict()
+    _hits: ClassVar[int] = 0
+    _misses: ClassVar[int] = 0
+
+    @classmethod
+    def parse(cls, user_agent: str | None) -> UserAgentInfo:
+        """
+        解析 User-Agent。
+
+        参数:
+        - user_agent (str | None): User-Agent 字符串。
+
+        返回:
+        - UserAgentInfo: 操作系统与浏览器名称。
+        """
+        key = user_agent or ""
+        info = cls._cache.get(key)
+        if info is not None:
+            cls._hits += 1
+            cls._cache.move_to_end(key)
+            return info
+
+        cls._misses += 1
+        parsed = parse(key)
+        info = UserAgentInfo(os=parsed.os.family, browser=parsed.browser.family)
+        cls._cache[key] = info
+        while len(cls._cache) > settings.USER_AGENT_CACHE_MAXSIZE:
+            cls._cache.popitem(last=False)
+        return info
+
+    @classmethod
+    def stats(cls) -> dict[str, int | float]:
+        """
+        获取缓存运行指标。
+
+        返回:
+        - dict[str, int | float]: 缓存条数、容量、命中次数、未命中次数及命中率。
+        """
+        total = cls._hits + cls._misses
+        return {
+            "size": len(cls._cache),
+            "maxsize": settings.USER_AGENT_CACHE_MAXSIZE,
+            "hits": cls._hits,
+            "misses": cls._misses,
+            "hit_rate": round(cls._hits / total, 4) if total else 0.0,
+        }
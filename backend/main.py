@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from typing import Annotated
 
 import typer
@@ -125,5 +126,47 @@ def upgrade(
     typer.echo("所有迁移已应用。")
 
 
+@fastapiadmin_cli.command(
+    name="rebuild-tree",
+    help="根据 parent_id 重建部门、菜单的树形路径, 运行 python main.py rebuild-tree --env=dev",
+)
+def rebuild_tree(
+    env: Annotated[
+        EnvironmentEnum, typer.Option("--env", help="运行环境 (dev, prod)")
+    ] = EnvironmentEnum.DEV,
+) -> None:
+    """重建部门、菜单的树形路径"""
+    os.environ["ENVIRONMENT"] = env.value
+
+    import asyncio
+
+    from app.scripts.initialize import InitializeData
+
+    asyncio.run(InitializeData().rebuild_tree_path())
+    typer.echo("树形路径已重建。")
+
+
+@fastapiadmin_cli.command(
+    name="import-ipdb",
+    help="由CSV(起始IP,结束IP,归属地)生成离线IP库, 运行 python main.py import-ipdb ip.csv --env=dev",
+)
+def import_ipdb(
+    csv_path: Annotated[Path, typer.Argument(help="CSV文件路径", exists=True, dir_okay=False)],
+    env: Annotated[
+        EnvironmentEnum, typer.Option("--env", help="运行环境 (dev, prod)")
+    ] = EnvironmentEnum.DEV,
+) -> None:
+    """生成离线IP归属地库"""
+    os.environ["ENVIRONMENT"] = env.value
+
+    from app.config.path_conf import BASE_DIR
+    from app.config.setting import settings
+    from app.utils.ip_local_util import IpLocationDB
+
+    path = BASE_DIR.joinpath(settings.IP_LOCATION_DB_PATH)
+    count = IpLocationDB.import_csv(csv_path, path)
+    typer.echo(f"已写入 {count} 条记录到 {path}，重启服务后生效。")
+
+
 if __name__ == "__main__":
     fastapiadmin_cli()
@@ -1,12 +1,17 @@
+import asyncio
 import os
 import sys
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 # 导入 main 模块，确保路径正确
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from app.core.base_model import MappedBase
 from main import create_app
 
 # 创建测试客户端
@@ -17,3 +22,17 @@ app = create_app()
 def test_client():
     with TestClient(app) as client:
         yield client
+
+
+@pytest.fixture
+def session_maker(tmp_path: Path):
+    """每个测试使用独立的 sqlite 数据库"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=NullPool)
+
+    async def init() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(MappedBase.metadata.create_all)
+
+    asyncio.run(init())
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
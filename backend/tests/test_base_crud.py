@@ -0,0 +1,216 @@
+"""
+数据层基类测试
+
+注意：使用普通的 def 定义测试函数，不要使用 async def
+执行命令: pytest tests/test_base_crud.py
+"""
+
+import asyncio
+
+import pytest
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.dept.crud import DeptCRUD
+from app.api.v1.module_system.position.crud import PositionCRUD
+from app.api.v1.module_system.position.model import PositionModel
+from app.api.v1.module_system.position.schema import PositionOutSchema
+from app.api.v1.module_system.user.model import UserModel
+from app.core.exceptions import CustomException
+from app.core.permission import Permission
+
+
+async def _page_all_ids(
+    crud: PositionCRUD, order_by: list[dict[str, str]], limit: int
+) -> list[int]:
+    """按游标逐页读取全部岗位ID"""
+    ids: list[int] = []
+    cursor = None
+    while True:
+        page = await crud.page_after(
+            cursor=cursor,
+            limit=limit,
+            order_by=order_by,
+            search=None,
+            out_schema=PositionOutSchema,
+            lean=True,
+        )
+        ids.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not page["has_next"]:
+            return ids
+
+
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+@pytest.mark.parametrize("limit", [1, 2, 3])
+def test_page_after_nullable_order_field(session_maker, direction: str, limit: int) -> None:
+    """测试按可空字段游标分页时，NULL 行不丢失也不重复"""
+    descriptions = [None, "b", None, "a", "c", None, "b", None]
+
+    async def run() -> None:
+        async with session_maker() as session:
+            session.add_all(
+                PositionModel(name=f"岗位{i}", description=description)
+                for i, description in enumerate(descriptions)
+            )
+            await session.commit()
+
+            crud = PositionCRUD(AuthSchema(db=session))
+            ids = await _page_all_ids(crud, [{"description": direction}], limit)
+            rows = {obj.id: obj.description for obj in await crud.list()}
+
+        assert len(ids) == len(descriptions)
+        assert sorted(ids) == sorted(rows)
+        # NULL 视为最小值: 升序排在最前，降序排在最后
+        expected = sorted(rows, key=lambda i: (rows[i] is not None, rows[i] or "", i))
+        assert ids == (expected if direction == "asc" else expected[::-1])
+
+    asyncio.run(run())
+
+
+def _user(id: int) -> UserModel:
+    """未分配角色的普通用户，数据权限为仅本人数据"""
+    return UserModel(id=id, username=f"user{id}", password="", name=f"用户{id}", is_superuser=False)
+
+
+async def _create_positions(session, owner_ids: list[int]) -> list[int]:
+    """按创建人依次创建岗位，返回岗位ID"""
+    ids = []
+    for i, owner_id in enumerate(owner_ids):
+        obj = await PositionCRUD(AuthSchema(db=session, user=_user(owner_id))).create({
+            "name": f"岗位{i}"
+        })
+        ids.append(obj.id)
+    await session.commit()
+    return ids
+
+
+def test_update_denied_by_data_scope(session_maker) -> None:
+    """测试更新他人创建的数据时被数据权限拒绝，且数据不变"""
+
+    async def run() -> None:
+        async with session_maker() as session:
+            (id,) = await _create_positions(session, [2])
+            crud = PositionCRUD(AuthSchema(db=session, user=_user(1)))
+            with pytest.raises(CustomException, match="更新对象不存在"):
+                await crud.update(id, {"name": "越权修改"})
+            await session.rollback()
+
+            obj = await PositionCRUD(AuthSchema(db=session)).get(id=id)
+            assert obj is not None
+            assert obj.name == "岗位0"
+            assert obj.updated_id == 2
+
+    asyncio.run(run())
+
+
+def test_update_allowed_by_data_scope(session_maker) -> None:
+    """测试更新本人创建的数据"""
+
+    async def run() -> None:
+        async with session_maker() as session:
+            (id,) = await _create_positions(session, [1])
+            obj = await PositionCRUD(AuthSchema(db=session, user=_user(1))).update(
+                id, {"name": "已修改"}
+            )
+            assert obj.id == id
+            assert obj.name == "已修改"
+            assert obj.updated_id == 1
+            await session.commit()
+
+        async with session_maker() as session:
+            obj = await PositionCRUD(AuthSchema(db=session)).get(id=id)
+            assert obj is not None
+            assert obj.name == "已修改"
+
+    asyncio.run(run())
+
+
+def test_delete_with_mixed_permissions(session_maker) -> None:
+    """测试批量删除时只删除有权限的数据，无权限及不存在的ID列入 denied_ids"""
+
+    async def run() -> None:
+        async with session_maker() as session:
+            own_1, other, own_2 = await _create_positions(session, [1, 2, 1])
+            missing = own_2 + 100
+            result = await PositionCRUD(AuthSchema(db=session, user=_user(1))).delete([
+                own_1,
+                other,
+                missing,
+                own_2,
+            ])
+            await session.commit()
+
+            assert result == {"affected_ids": [own_1, own_2], "denied_ids": [other, missing]}
+            rows = await PositionCRUD(AuthSchema(db=session)).list()
+            assert [obj.id for obj in rows] == [other]
+
+    asyncio.run(run())
+
+
+def test_update_parent_moves_descendant_tree_path(session_maker) -> None:
+    """测试调整父级时同步更新子孙节点的 tree_path"""
+
+    async def run() -> None:
+        async with session_maker() as session:
+            crud = DeptCRUD(AuthSchema(db=session))
+            a = await crud.create({"name": "A"})
+            b = await crud.create({"name": "B", "parent_id": a.id})
+            c = await crud.create({"name": "C", "parent_id": b.id})
+            d = await crud.create({"name": "D"})
+            assert c.tree_path == f"/{a.id}/{b.id}/"
+
+            await crud.update(b.id, {"parent_id": d.id})
+            # 会话中已加载的子孙节点同步更新
+            assert c.tree_path == f"/{d.id}/{b.id}/"
+            await session.commit()
+
+        async with session_maker() as session:
+            rows = await DeptCRUD(AuthSchema(db=session)).list()
+            paths = {obj.name: (obj.parent_id, obj.tree_path) for obj in rows}
+            assert paths == {
+                "A": (None, "/"),
+                "B": (d.id, f"/{d.id}/"),
+                "C": (b.id, f"/{d.id}/{b.id}/"),
+                "D": (None, "/"),
+            }
+
+            with pytest.raises(CustomException, match="父级不能为自身或其子级"):
+                await DeptCRUD(AuthSchema(db=session)).update(b.id, {"parent_id": c.id})
+
+    asyncio.run(run())
+
+
+def test_dept_scope_cache_follows_version(session_maker) -> None:
+    """测试部门范围跨请求缓存按 Redis 版本号命中，未读取到版本号时仅在请求内缓存"""
+    calls: list[int] = []
+
+    async def loader() -> frozenset[int]:
+        calls.append(1)
+        return frozenset({len(calls)})
+
+    async def resolve(session, versions: dict[str, int]) -> frozenset[int]:
+        auth = AuthSchema(db=session)
+        auth._scope_versions = versions
+        permission = Permission(model=PositionModel, auth=auth)
+        value = await permission._cached_scope("dept", (10,), loader)
+        # 同一请求内再次读取不调用 loader
+        assert await permission._cached_scope("dept", (10,), loader) == value
+        return value
+
+    async def run() -> None:
+        Permission._scope_cache.clear()
+        async with session_maker() as session:
+            assert await resolve(session, {"dept": 1}) == {1}
+            assert await resolve(session, {"dept": 1}) == {1}
+            # 其他进程递增版本号后重新加载
+            assert await resolve(session, {"dept": 2}) == {2}
+            assert await resolve(session, {}) == {3}
+            assert await resolve(session, {}) == {4}
+        Permission._scope_cache.clear()
+
+    asyncio.run(run())
+
+
+# 运行所有测试
+if __name__ == "__main__":
+    pytest.main(["-v", "tests/test_base_crud.py"])
@@ -0,0 +1,142 @@
+"""
+日志归档测试
+
+注意：使用普通的 def 定义测试函数，不要使用 async def
+执行命令: pytest tests/test_log_archiver.py
+"""
+
+import asyncio
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.role.model import RoleModel
+from app.api.v1.module_system.user.model import UserModel
+from app.config.setting import settings
+from app.core.log_archiver import LogArchiver
+
+
+@pytest.fixture
+def archive_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """归档目录指向临时目录"""
+    path = tmp_path / "archive"
+    monkeypatch.setattr(settings, "LOG_ARCHIVE_DIR", str(path))
+    return path
+
+
+def _user(id: int, dept_id: int | None = None, data_scope: int | None = None) -> UserModel:
+    """构造登录用户，data_scope 为空时不分配角色"""
+    roles = (
+        [RoleModel(id=id, name="角色", code="role", data_scope=data_scope)] if data_scope else []
+    )
+    return UserModel(
+        id=id,
+        username=f"user{id}",
+        password="",
+        name=f"用户{id}",
+        dept_id=dept_id,
+        is_superuser=False,
+        roles=roles,
+    )
+
+
+def test_read_month_applies_data_scope(session_maker, archive_dir: Path) -> None:
+    """测试读取归档日志时按数据权限过滤，与在线日志列表的范围一致"""
+    created_time = datetime(2025, 1, 15, 8, 0, 0)
+    LogArchiver._write_batch(
+        "sys_log",
+        [
+            {"id": id, "created_id": created_id, "created_time": created_time, "type": 2}
+            for id, created_id in [(1, 1), (2, 2), (3, 3), (4, None)]
+        ],
+    )
+
+    async def read_ids(session, user: UserModel | None) -> list[int]:
+        page = await LogArchiver.read_month(
+            auth=AuthSchema(db=session, user=user), name="sys_log", month="2025-01", page_size=10
+        )
+        return [item["id"] for item in page["items"]]
+
+    async def run() -> None:
+        async with session_maker() as session:
+            session.add_all([
+                UserModel(id=1, username="user1", password="", name="用户1", dept_id=10),
+                UserModel(id=2, username="user2", password="", name="用户2", dept_id=10),
+                UserModel(id=3, username="user3", password="", name="用户3", dept_id=20),
+            ])
+            await session.commit()
+
+            superuser = _user(9)
+            superuser.is_superuser = True
+            assert await read_ids(session, superuser) == [4, 3, 2, 1]
+            # 未分配角色: 仅本人数据
+            assert await read_ids(session, _user(1, dept_id=10)) == [1]
+            # 本部门数据: 按创建人所在部门
+            assert await read_ids(session, _user(1, dept_id=10, data_scope=2)) == [2, 1]
+
+    asyncio.run(run())
+
+
+def _write_rows(ids: range) -> None:
+    """按每批10条写入归档日志，奇数ID为登录日志"""
+    created_time = datetime(2025, 1, 15, 8, 0, 0)
+    rows = [{"id": id, "created_time": created_time, "type": id % 2 or 2} for id in ids]
+    for offset in range(0, len(rows), 10):
+        LogArchiver._write_batch("sys_log", rows[offset : offset + 10])
+
+
+@pytest.mark.parametrize("page_size", [1, 7, 10, 30])
+def test_read_month_pages_across_files(archive_dir: Path, page_size: int) -> None:
+    """测试跨多个归档文件分页（整文件跳过），记录按ID倒序不丢失也不重复"""
+    _write_rows(range(1, 26))
+    month_dir = archive_dir / "sys_log" / "2025-01"
+
+    ids: list[int] = []
+    start = 0
+    while True:
+        items, total, has_next = LogArchiver._scan_month(month_dir, start, page_size, {})
+        assert total == 25
+        ids.extend(item["id"] for item in items)
+        start += page_size
+        if not has_next:
+            break
+    assert ids == list(range(25, 0, -1))
+    assert LogArchiver.list_months("sys_log")[0]["rows"] == 25
+
+
+def test_read_month_with_search_stops_at_page(archive_dir: Path) -> None:
+    """测试带查询条件时逐行过滤，不统计总数"""
+    _write_rows(range(1, 26))
+    month_dir = archive_dir / "sys_log" / "2025-01"
+
+    items, total, has_next = LogArchiver._scan_month(month_dir, 3, 5, {"type": ("eq", 1)})
+    assert [item["id"] for item in items] == [19, 17, 15, 13, 11]
+    assert total is None
+    assert has_next is True
+
+    items, _, has_next = LogArchiver._scan_month(month_dir, 10, 5, {"type": ("eq", 1)})
+    assert [item["id"] for item in items] == [5, 3, 1]
+    assert has_next is False
+
+
+def test_read_month_legacy_file_without_meta(archive_dir: Path) -> None:
+    """测试缺少行数文件的早期归档（按ID升序写入）仍按ID倒序读取"""
+    month_dir = archive_dir / "sys_log" / "2025-01"
+    month_dir.mkdir(parents=True)
+    with gzip.open(month_dir / f"{1:012d}.jsonl.gz", "wt", encoding="utf-8") as f:
+        for id in range(1, 6):
+            f.write(json.dumps({"id": id, "type": 2}) + "\n")
+
+    items, total, has_next = LogArchiver._scan_month(month_dir, 1, 2, {})
+    assert [item["id"] for item in items] == [4, 3]
+    assert total is None
+    assert has_next is True
+
+
+# 运行所有测试
+if __name__ == "__main__":
+    pytest.main(["-v", "tests/test_log_archiver.py"])